@@ -4,6 +4,7 @@ Pulsecity Agent Enrichment Layer.
 Architecture:
   base/          — BaseAgent, AgentTask, AgentResult, output Pydantic models
   llm/           — BaseLLMClient, AnthropicLLMClient, OpenAILLMClient, provider_router
+  cache/         — EnrichmentCache (per-event agent output reuse)
   mcp/           — MCPClient (DirectMCPClient in-memory; LocalMCPClient/ServerMCPClient FastMCP)
   enrichment/    — FeatureAlignmentAgent, TaxonomyClassifierAgent, EmotionMapperAgent,
                    DataQualityAgent, DeduplicationAgent, ArtistEnricherAgent
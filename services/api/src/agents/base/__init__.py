@@ -7,11 +7,12 @@ from src.agents.base.output_models import (
     SubcategoryExtraction,
     TaxonomyAttributesExtraction,
 )
-from src.agents.base.task import AgentResult, AgentTask
+from src.agents.base.task import AgentResult, AgentTask, TokenUsage
 
 __all__ = [
     "AgentTask",
     "AgentResult",
+    "TokenUsage",
     "BaseAgent",
     "PrimaryCategoryExtraction",
     "SubcategoryExtraction",
@@ -4,10 +4,12 @@ Abstract BaseAgent interface for all enrichment agents.
 Every enrichment agent subclasses BaseAgent and implements run().
 """
 
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generator
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Generator, TypeVar
 
 if TYPE_CHECKING:
     from src.schemas.event import EventSchema
@@ -16,6 +18,13 @@ from src.agents.base.task import AgentResult, AgentTask
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Reused C-accelerated encoder for prompt JSON (json.dumps(indent=...) falls
+# back to the pure-Python encoder and rebuilds an encoder on every call)
+_PROMPT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class BaseAgent(ABC):
     """
@@ -25,12 +34,18 @@ class BaseAgent(ABC):
         name        — unique identifier used in logs and configs
         prompt_name — key into PromptRegistry
 
+    Subclasses may set:
+        cacheable   — False when an event's output depends on the rest of the
+                      batch, or on identity/date fields the cache fingerprint
+                      ignores; rules out result caching and content grouping
+
     Subclasses must implement:
         run(task: AgentTask) -> AgentResult
     """
 
     name: str = "base_agent"
     prompt_name: str = ""
+    cacheable: bool = True
 
     @abstractmethod
     async def run(self, task: AgentTask) -> AgentResult:
@@ -137,11 +152,50 @@ class BaseAgent(ABC):
 
         return {
             "event_count": len(events),
-            "events_json": json.dumps(items, ensure_ascii=False, indent=2),
+            "events_json": self._dumps_items(items),
         }
 
+    @staticmethod
+    def _dumps_items(items: list) -> str:
+        """
+        Serialize a list for a prompt as a JSON array with one item per line.
+
+        Keeps prompts readable for the model without indent=2's per-field
+        whitespace tokens, and encodes each item with the C encoder.
+        """
+        if not items:
+            return "[]"
+        encode = _PROMPT_JSON_ENCODER.encode
+        return "[\n" + ",\n".join(map(encode, items)) + "\n]"
+
     @staticmethod
     def _chunk(lst: list, size: int) -> Generator[list, None, None]:
         """Yield successive non-overlapping chunks of `size` from `lst`."""
         for i in range(0, len(lst), size):
             yield lst[i : i + size]
+
+    @staticmethod
+    async def _gather_bounded(
+        items: list[T],
+        worker: Callable[[T], Awaitable[R]],
+        max_concurrency: int = 1,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> list[R]:
+        """
+        Await worker(item) for every item, at most `max_concurrency` at a time.
+
+        Results are returned in input order. With max_concurrency <= 1 items
+        are processed one after another, exactly like a plain loop. A shared
+        `limiter` replaces the per-call bound, so several concurrent runs stay
+        within one overall limit.
+        """
+        if limiter is None and max_concurrency <= 1:
+            return [await worker(item) for item in items]
+
+        semaphore = limiter or asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(item: T) -> R:
+            async with semaphore:
+                return await worker(item)
+
+        return list(await asyncio.gather(*(_bounded(item) for item in items)))
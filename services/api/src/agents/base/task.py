@@ -3,12 +3,15 @@ AgentTask and AgentResult dataclasses for the enrichment pipeline.
 
 AgentTask describes a unit of work given to a BaseAgent.
 AgentResult is the structured output returned by the agent.
+TokenUsage aggregates LLM token counts across agents and runs.
 """
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Self
 
 if TYPE_CHECKING:
+    import asyncio
+
     from src.schemas.event import EventSchema
 
 
@@ -22,9 +25,45 @@ class AgentTask:
     prompt_version: str = "active"  # "active" | "v1" | "v2" etc.
     priority: int = 1
     retry_limit: int = 2
+    max_concurrency: int = 1  # LLM batches an agent may have in flight at once
+    # Shared across concurrent runs; bounds their LLM batches in place of max_concurrency
+    limiter: "asyncio.Semaphore | None" = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class TokenUsage:
+    """LLM token counts, summed with += across agents and runs."""
+
+    prompt: int = 0
+    completion: int = 0
+    total: int = 0
+
+    @classmethod
+    def from_dict(cls, usage: dict[str, int]) -> Self:
+        """Build from an AgentResult.token_usage dict."""
+        return cls(
+            prompt=usage.get("prompt_tokens", 0),
+            completion=usage.get("completion_tokens", 0),
+            total=usage.get("total", 0),
+        )
+
+    def __iadd__(self, other: "TokenUsage") -> Self:
+        """Add another usage's counts to this one in place."""
+        self.prompt += other.prompt
+        self.completion += other.completion
+        self.total += other.total
+        return self
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the prompt_tokens / completion_tokens / total dict form."""
+        return {
+            "prompt_tokens": self.prompt,
+            "completion_tokens": self.completion,
+            "total": self.total,
+        }
+
+
 @dataclass
 class AgentResult:
     """Structured output returned by a BaseAgent after processing a task."""
@@ -0,0 +1,5 @@
+"""Result caches that let the enrichment chain skip repeated LLM work."""
+
+from src.agents.cache.enrichment_cache import EnrichmentCache, field_delta
+
+__all__ = ["EnrichmentCache", "field_delta"]
@@ -0,0 +1,150 @@
+"""
+EnrichmentCache — reuse an agent's output for events with identical content.
+
+Recurring series, multi-night residencies and the same gig listed on several
+sources produce events whose enrichment-relevant content is identical; only
+identifiers and dates differ. The cache fingerprints each event with those
+fields excluded and remembers which top-level fields an agent changed, so a
+later event with the same fingerprint gets the same enrichment without an
+LLM call.
+
+Entries are keyed by (agent name, resolved prompt version, fingerprint), so
+bumping a prompt's active version invalidates that agent's entries. An entry
+may also carry the agent's confidence score for the event.
+
+Usage:
+    cache = EnrichmentCache(max_entries=10_000)
+    fp = EnrichmentCache.fingerprint(event)
+    delta = cache.get("feature_alignment", "v1", fp)
+    if delta is None:
+        # Agents enrich their inputs in place: give them a copy, so the
+        # original is still there to diff against
+        enriched_event = ...run the agent on event.model_copy(deep=True)...
+        cache.put("feature_alignment", "v1", fp, field_delta(event, enriched_event))
+    else:
+        event = EnrichmentCache.apply(event, delta)
+"""
+
+import copy
+import json
+import logging
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.schemas.event import EventSchema
+
+logger = logging.getLogger(__name__)
+
+# Identity / scheduling fields that vary across occurrences of the same event
+# but do not change what the agents infer from it.
+_VOLATILE_FIELDS = frozenset(
+    {
+        "event_id",
+        "source",
+        "start_datetime",
+        "end_datetime",
+        "created_at",
+        "updated_at",
+    }
+)
+
+
+def field_delta(before: "EventSchema", after: "EventSchema") -> dict[str, Any]:
+    """
+    Return the top-level fields an agent changed between `before` and `after`.
+
+    Values are deep copies of the `after` attributes, so the delta never
+    aliases a live event. Volatile (identity/scheduling) fields are skipped.
+    """
+    before_dump = before.model_dump()
+    after_dump = after.model_dump()
+    return {
+        name: copy.deepcopy(getattr(after, name))
+        for name, value in after_dump.items()
+        if name not in _VOLATILE_FIELDS and before_dump.get(name) != value
+    }
+
+
+class EnrichmentCache:
+    """
+    Bounded in-memory LRU cache of per-event agent outputs.
+
+    Values are the top-level EventSchema fields an agent changed, stored as
+    deep copies so cached results never alias live events.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        """Initialize the cache, evicting least-recently-used entries past max_entries."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            tuple[str, str, str], tuple[dict[str, Any], float | None]
+        ] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @staticmethod
+    def fingerprint(event: "EventSchema") -> str:
+        """Return a stable hash of the event's content, ignoring volatile fields."""
+        payload = event.model_dump(mode="json", exclude=set(_VOLATILE_FIELDS))
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return blake2b(blob.encode(), digest_size=16).hexdigest()
+
+    def get(
+        self, agent_name: str, prompt_version: str, fingerprint: str
+    ) -> dict[str, Any] | None:
+        """Return the cached field delta for a fingerprint, or None on a miss."""
+        key = (agent_name, prompt_version, fingerprint)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def confidence(
+        self, agent_name: str, prompt_version: str, fingerprint: str
+    ) -> float | None:
+        """Return the cached confidence score for a fingerprint, if one was stored."""
+        entry = self._entries.get((agent_name, prompt_version, fingerprint))
+        return entry[1] if entry is not None else None
+
+    def put(
+        self,
+        agent_name: str,
+        prompt_version: str,
+        fingerprint: str,
+        delta: dict[str, Any],
+        confidence: float | None = None,
+    ) -> None:
+        """
+        Record the field delta (and confidence score) an agent produced.
+
+        Empty deltas are not cached, so an event the agent left untouched
+        (e.g. after a transient LLM failure) is retried on the next run.
+        """
+        if not delta:
+            return
+
+        key = (agent_name, prompt_version, fingerprint)
+        self._entries[key] = (delta, confidence)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def apply(event: "EventSchema", delta: dict[str, Any]) -> "EventSchema":
+        """Return a copy of the event with the cached fields applied."""
+        return event.model_copy(update=copy.deepcopy(delta))
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -65,9 +65,10 @@ class ArtistEnricherAgent(BaseAgent):
         errors: list[str] = []
         enriched_events = list(task.events)
 
-        for i, event in enumerate(enriched_events):
+        async def _enrich_event(i: int) -> None:
+            event = enriched_events[i]
             if not event.artists:
-                continue
+                return
 
             enriched_artists: list[ArtistInfo] = []
             for artist in event.artists:
@@ -82,6 +83,13 @@ class ArtistEnricherAgent(BaseAgent):
 
             enriched_events[i].artists = enriched_artists
 
+        await self._gather_bounded(
+            list(range(len(enriched_events))),
+            _enrich_event,
+            task.max_concurrency,
+            limiter=task.limiter,
+        )
+
         return AgentResult(
             agent_name=self.name,
             prompt_name=self.prompt_name,
@@ -32,6 +32,9 @@ class DataQualityAgent(BaseAgent):
 
     name = "data_quality"
     prompt_name = "data_quality"
+    # The audit reads identity and date fields the cache fingerprint ignores
+    # (e.g. flags a start_datetime in the past), so results are per event
+    cacheable = False
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the DataQualityAgent with optional config overrides."""
@@ -75,7 +78,7 @@ class DataQualityAgent(BaseAgent):
             str(e.source.source_event_id): i for i, e in enumerate(enriched_events)
         }
 
-        for chunk in self._chunk(enriched_events, batch_size):
+        async def _enrich_chunk(chunk: list) -> None:
             batch_ctx = self._build_batch_context(chunk)
             chunk_ids = [str(e.source.source_event_id) for e in chunk]
             try:
@@ -120,6 +123,13 @@ class DataQualityAgent(BaseAgent):
                 logger.warning(f"{self.name} batch error: {msg}")
                 errors.append(msg)
 
+        await self._gather_bounded(
+            list(self._chunk(enriched_events, batch_size)),
+            _enrich_chunk,
+            task.max_concurrency,
+            limiter=task.limiter,
+        )
+
         return AgentResult(
             agent_name=self.name,
             prompt_name=self.prompt_name,
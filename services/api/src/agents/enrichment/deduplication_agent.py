@@ -27,7 +27,6 @@ The persistence layer (not this agent) is responsible for:
   - Setting events.duplicate_group_id FK on all member events
 """
 
-import json
 import logging
 import time
 import uuid
@@ -81,6 +80,7 @@ class DeduplicationAgent(BaseAgent):
 
     name = "deduplication"
     prompt_name = "deduplication"  # rules_v1_llama3_threshold_0.8
+    cacheable = False  # groups depend on the whole batch, not a single event
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the DeduplicationAgent with optional config overrides."""
@@ -280,7 +280,7 @@ class DeduplicationAgent(BaseAgent):
                 }
             )
 
-        events_json = json.dumps(event_summaries, indent=2, ensure_ascii=False)
+        events_json = self._dumps_items(event_summaries)
         # Cap to avoid blowing the context window
         if len(events_json) > 8000:
             events_json = events_json[:8000] + "\n... (truncated)"
@@ -77,7 +77,7 @@ class FeatureAlignmentAgent(BaseAgent):
             str(e.source.source_event_id): i for i, e in enumerate(enriched_events)
         }
 
-        for chunk in self._chunk(enriched_events, batch_size):
+        async def _enrich_chunk(chunk: list) -> None:
             batch_ctx = self._build_batch_context(chunk)
             chunk_ids = [str(e.source.source_event_id) for e in chunk]
             try:
@@ -131,6 +131,13 @@ class FeatureAlignmentAgent(BaseAgent):
                 logger.warning(f"{self.name} batch error: {msg}")
                 errors.append(msg)
 
+        await self._gather_bounded(
+            list(self._chunk(enriched_events, batch_size)),
+            _enrich_chunk,
+            task.max_concurrency,
+            limiter=task.limiter,
+        )
+
         return AgentResult(
             agent_name=self.name,
             prompt_name=self.prompt_name,
@@ -14,7 +14,6 @@ Two-pass RAG architecture:
     best-matching activity_id + activity_name for each event in the group.
 """
 
-import json
 import logging
 import time
 from typing import Any
@@ -99,7 +98,7 @@ class TaxonomyClassifierAgent(BaseAgent):
         # ------------------------------------------------------------------
         # Pass 1 — classify primary_category, subcategory + attributes
         # ------------------------------------------------------------------
-        for chunk in self._chunk(enriched_events, batch_size):
+        async def _enrich_chunk(chunk: list) -> None:
             batch_ctx = self._build_batch_context(chunk)
             chunk_ids = [str(e.source.source_event_id) for e in chunk]
             try:
@@ -183,6 +182,13 @@ class TaxonomyClassifierAgent(BaseAgent):
                 logger.warning(f"{self.name} pass-1 batch error: {msg}")
                 errors.append(msg)
 
+        await self._gather_bounded(
+            list(self._chunk(enriched_events, batch_size)),
+            _enrich_chunk,
+            task.max_concurrency,
+            limiter=task.limiter,
+        )
+
         # ------------------------------------------------------------------
         # Pass 2 — RAG activity selection grouped by subcategory
         # ------------------------------------------------------------------
@@ -301,7 +307,7 @@ class TaxonomyClassifierAgent(BaseAgent):
 
             # Build name-only list — keep UUIDs out of the LLM prompt entirely
             valid_names = [a["name"] for a in activities if a.get("name")]
-            activity_names_json = json.dumps(valid_names, ensure_ascii=False, indent=2)
+            activity_names_json = self._dumps_items(valid_names)
 
             # Chunk the subcategory group to avoid overwhelming small models
             for chunk in self._chunk(group_events, batch_size):
@@ -319,9 +325,7 @@ class TaxonomyClassifierAgent(BaseAgent):
                     "subcategory_id": subcategory_id,
                     "subcategory_name": subcategory_name,
                     "activity_names_json": activity_names_json,
-                    "events_json": json.dumps(
-                        event_items, ensure_ascii=False, indent=2
-                    ),
+                    "events_json": self._dumps_items(event_items),
                     "event_count": len(chunk),
                 }
                 system_prompt = self._render_template(system_raw, variables)
@@ -392,9 +396,7 @@ class TaxonomyClassifierAgent(BaseAgent):
                     retry_stubs = [stub for _, stub in retry_events]
                     retry_variables = {
                         **variables,
-                        "events_json": json.dumps(
-                            retry_stubs, ensure_ascii=False, indent=2
-                        ),
+                        "events_json": self._dumps_items(retry_stubs),
                         "event_count": len(retry_stubs),
                     }
                     retry_system = self._render_template(
@@ -5,18 +5,30 @@ Uses claude-haiku-4-5-20251001 by default (configurable via agents.yaml).
 """
 
 import logging
-from typing import TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pydantic import BaseModel
 
-from src.agents.llm.base_llm_client import BaseLLMClient
+from src.agents.llm.base_llm_client import DEFAULT_MAX_RETRIES, BaseLLMClient
 from src.configs.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.agents.llm.batch_client import BatchOutcome, BatchRequest
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def _tool_def(output_schema: type[BaseModel]) -> dict[str, Any]:
+    """Tool definition that forces output matching the Pydantic schema."""
+    return {
+        "name": "structured_output",
+        "description": f"Return structured output matching {output_schema.__name__}",
+        "input_schema": output_schema.model_json_schema(),
+    }
+
+
 class AnthropicLLMClient(BaseLLMClient):
     """
     Anthropic Claude client for enrichment agents.
@@ -26,6 +38,7 @@ class AnthropicLLMClient(BaseLLMClient):
     """
 
     provider = "anthropic"
+    supports_batch = True
 
     def __init__(
         self,
@@ -50,8 +63,8 @@ class AnthropicLLMClient(BaseLLMClient):
 
     @property
     def is_available(self) -> bool:
-        """Return True if an Anthropic API key is configured."""
-        return bool(self._api_key)
+        """Return True if an API key is configured and the provider breaker is closed."""
+        return bool(self._api_key) and not self._breaker.is_open
 
     def _get_client(self):
         if self._client is not None:
@@ -61,7 +74,9 @@ class AnthropicLLMClient(BaseLLMClient):
         try:
             import anthropic
 
-            self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self._api_key, max_retries=DEFAULT_MAX_RETRIES
+            )
             return self._client
         except ImportError:
             logger.warning("anthropic package not installed — pip install anthropic")
@@ -109,13 +124,7 @@ class AnthropicLLMClient(BaseLLMClient):
         client = self._get_client()
         if not client:
             return output_schema()
-
-        schema = output_schema.model_json_schema()
-        tool_def = {
-            "name": "structured_output",
-            "description": f"Return structured output matching {output_schema.__name__}",
-            "input_schema": schema,
-        }
+        self._check_circuit()
 
         try:
             resp = await client.messages.create(
@@ -125,7 +134,7 @@ class AnthropicLLMClient(BaseLLMClient):
                     temperature if temperature is not None else self.temperature
                 ),
                 system=system_prompt,
-                tools=[tool_def],
+                tools=[_tool_def(output_schema)],
                 tool_choice={"type": "tool", "name": "structured_output"},
                 messages=[{"role": "user", "content": user_prompt}],
             )
@@ -134,15 +143,67 @@ class AnthropicLLMClient(BaseLLMClient):
                 "completion_tokens": resp.usage.output_tokens,
                 "total": resp.usage.input_tokens + resp.usage.output_tokens,
             }
+            self._breaker.record_success()
             # Extract tool_use block
             for block in resp.content:
                 if block.type == "tool_use":
                     return output_schema.model_validate(block.input)
             return output_schema()
         except Exception as e:
+            self._record_call_error(e)
             logger.warning(f"AnthropicLLMClient structured output failed: {e}")
             return output_schema()
 
+    async def submit_batch(self, requests: list["BatchRequest"]) -> str:
+        """Create a Message Batch with one tool_use request per BatchRequest."""
+        client = self._get_client()
+        job = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": r.custom_id,
+                    "params": {
+                        "model": self.model_name,
+                        "max_tokens": r.max_tokens,
+                        "temperature": r.temperature,
+                        "system": r.system_prompt,
+                        "tools": [_tool_def(r.output_schema)],
+                        "tool_choice": {"type": "tool", "name": "structured_output"},
+                        "messages": [{"role": "user", "content": r.user_prompt}],
+                    },
+                }
+                for r in requests
+            ]
+        )
+        return job.id
+
+    async def fetch_batch(self, job_id: str) -> dict[str, "BatchOutcome"] | None:
+        """Return parsed outcomes once the batch has ended, else None."""
+        from src.agents.llm.batch_client import BatchOutcome
+
+        client = self._get_client()
+        job = await client.messages.batches.retrieve(job_id)
+        if job.processing_status != "ended":
+            return None
+
+        outcomes: dict[str, BatchOutcome] = {}
+        async for entry in await client.messages.batches.results(job_id):
+            if entry.result.type != "succeeded":
+                outcomes[entry.custom_id] = BatchOutcome(error=entry.result.type)
+                continue
+            message = entry.result.message
+            data = next(
+                (b.input for b in message.content if b.type == "tool_use"), None
+            )
+            outcomes[entry.custom_id] = BatchOutcome(
+                data=data,
+                usage={
+                    "prompt_tokens": message.usage.input_tokens,
+                    "completion_tokens": message.usage.output_tokens,
+                    "total": message.usage.input_tokens + message.usage.output_tokens,
+                },
+            )
+        return outcomes
+
     def get_token_usage(self) -> dict[str, int]:
         """Return the token usage from the most recent LLM call."""
         return self._last_usage
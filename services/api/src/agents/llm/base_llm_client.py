@@ -7,14 +7,27 @@ The interface is async-first and returns structured Pydantic outputs.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from pydantic import BaseModel
 
+from src.agents.llm.circuit_breaker import (
+    CircuitBreaker,
+    LLMCircuitOpenError,
+    get_circuit_breaker,
+    is_provider_error,
+)
+
+if TYPE_CHECKING:
+    from src.agents.llm.batch_client import BatchOutcome, BatchRequest
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# SDK-level retries (exponential backoff with jitter on 429/5xx/connection errors)
+DEFAULT_MAX_RETRIES = 4
+
 
 class BaseLLMClient(ABC):
     """
@@ -25,6 +38,7 @@ class BaseLLMClient(ABC):
     """
 
     provider: str = "base"
+    supports_batch: bool = False  # provider batch API (see batch_client.py)
 
     @abstractmethod
     async def complete(
@@ -59,5 +73,27 @@ class BaseLLMClient(ABC):
         """Returns True if the client has a valid API key and can make calls."""
         return False
 
+    async def submit_batch(self, requests: list["BatchRequest"]) -> str:
+        """Submit structured requests as one provider batch job; returns the job id."""
+        raise NotImplementedError(f"{self.provider} has no batch API")
+
+    async def fetch_batch(self, job_id: str) -> dict[str, "BatchOutcome"] | None:
+        """Return outcomes by custom_id once the job has ended, else None."""
+        raise NotImplementedError(f"{self.provider} has no batch API")
+
     def _empty_usage(self) -> dict[str, int]:
         return {"prompt_tokens": 0, "completion_tokens": 0, "total": 0}
+
+    @property
+    def _breaker(self) -> CircuitBreaker:
+        return get_circuit_breaker(self.provider)
+
+    def _check_circuit(self) -> None:
+        """Raise LLMCircuitOpenError while this provider's breaker is open."""
+        if not self._breaker.allow_request():
+            raise LLMCircuitOpenError(f"circuit_open: {self.provider}")
+
+    def _record_call_error(self, exc: BaseException) -> None:
+        """Count provider failures (after SDK retries) towards the breaker."""
+        if is_provider_error(exc):
+            self._breaker.record_failure()
@@ -0,0 +1,197 @@
+"""
+Provider batch-API mode for LLM clients.
+
+Offline runs (nightly, backfills) don't need per-call latency. Provider batch
+APIs (OpenAI /v1/batches, Anthropic /v1/messages/batches) bill at roughly
+half price and don't count against online rate limits.
+
+BatchLLMClient wraps a provider client without changing agent code: every
+complete_structured() call made while a collection window is open is queued,
+the queue is submitted as one batch job, the job is polled with exponential
+backoff, and each caller receives its own parsed result. Agents that fan out
+their LLM batches concurrently therefore submit one job per pass.
+
+Providers opt in with supports_batch = True and implement submit_batch() /
+fetch_batch() (see OpenAILLMClient, AnthropicLLMClient).
+"""
+
+import asyncio
+import itertools
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.agents.llm.base_llm_client import BaseLLMClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Token usage of the current task's last batched call — each awaiting agent
+# chunk runs in its own task, so concurrent callers don't see each other's usage
+_last_usage: ContextVar[dict[str, int]] = ContextVar("batch_llm_usage")
+
+
+@dataclass
+class BatchRequest:
+    """One structured completion queued for a provider batch job."""
+
+    custom_id: str
+    system_prompt: str
+    user_prompt: str
+    output_schema: type[BaseModel]
+    temperature: float
+    max_tokens: int
+
+
+@dataclass
+class BatchOutcome:
+    """Result of one request in a finished batch job."""
+
+    data: dict[str, Any] | None = None
+    usage: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+
+
+class BatchLLMClient(BaseLLMClient):
+    """
+    Routes structured completions through a provider batch API.
+
+    Plain-text complete() calls are passed through to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: BaseLLMClient,
+        collect_seconds: float = 1.0,
+        poll_initial_seconds: float = 30.0,
+        poll_max_seconds: float = 300.0,
+    ):
+        """
+        Args:
+            client: Provider client with supports_batch = True
+            collect_seconds: Quiet period after the last queued call before submitting
+            poll_initial_seconds: First poll delay; doubles up to poll_max_seconds
+            poll_max_seconds: Upper bound on the poll delay
+        """
+        self.provider = client.provider
+        self._client = client
+        self._collect_seconds = collect_seconds
+        self._poll_initial = poll_initial_seconds
+        self._poll_max = poll_max_seconds
+        self._pending: list[tuple[BatchRequest, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._ids = itertools.count()
+        self.job_ids: list[str] = []
+
+    @property
+    def is_available(self) -> bool:
+        """Return True when the wrapped client is available."""
+        return self._client.is_available
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Plain-text completion via the wrapped client (not batched)."""
+        return await self._client.complete(
+            system_prompt, user_prompt, temperature=temperature, max_tokens=max_tokens
+        )
+
+    async def complete_structured(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        output_schema: type[T],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> T:
+        """
+        Queue a structured completion and wait for its batch job to finish.
+
+        Raises if the job fails or returns no result for this request, so the
+        calling agent records the chunk as an error.
+        """
+        self._check_circuit()
+        request = BatchRequest(
+            custom_id=f"req-{next(self._ids)}",
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            output_schema=output_schema,
+            temperature=(
+                temperature
+                if temperature is not None
+                else getattr(self._client, "temperature", 0.1)
+            ),
+            max_tokens=(
+                max_tokens
+                if max_tokens is not None
+                else int(getattr(self._client, "max_tokens", 2000))
+            ),
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+        outcome: BatchOutcome = await future
+        _last_usage.set(outcome.usage)
+        return output_schema.model_validate(outcome.data or {})
+
+    def get_token_usage(self) -> dict[str, int]:
+        """Return the token usage of the calling task's last batched request."""
+        return _last_usage.get(self._empty_usage())
+
+    async def _flush(self) -> None:
+        # Wait until concurrent callers stop queuing, then submit what we have
+        queued = -1
+        while queued != len(self._pending):
+            queued = len(self._pending)
+            await asyncio.sleep(self._collect_seconds)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+
+        try:
+            job_id = await self._client.submit_batch([r for r, _ in batch])
+            self.job_ids.append(job_id)
+            logger.info(
+                f"BatchLLMClient[{self.provider}]: submitted {len(batch)} "
+                f"requests as batch {job_id}"
+            )
+            delay = self._poll_initial
+            outcomes = None
+            while outcomes is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._poll_max)
+                outcomes = await self._client.fetch_batch(job_id)
+        except Exception as e:
+            # Deliberately broad: any error not forwarded below would leave
+            # the queued callers awaiting their futures forever
+            logger.exception(
+                f"BatchLLMClient[{self.provider}]: batch of {len(batch)} "
+                f"requests failed"
+            )
+            self._client._record_call_error(e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._client._breaker.record_success()
+        for request, future in batch:
+            if future.done():
+                continue
+            outcome = outcomes.get(request.custom_id)
+            if outcome is None or outcome.error:
+                reason = outcome.error if outcome else "no result"
+                future.set_exception(
+                    RuntimeError(f"batch {job_id} {request.custom_id}: {reason}")
+                )
+            else:
+                future.set_result(outcome)
@@ -0,0 +1,156 @@
+"""
+Per-provider circuit breaker for LLM clients.
+
+Transient provider errors (rate limits, 5xx, connection failures) are already
+retried with exponential backoff inside the provider SDKs (see
+DEFAULT_MAX_RETRIES). When a provider keeps failing after those retries, the
+breaker opens and clients report is_available=False, so agents skip cleanly
+instead of burning a timeout per batch against a degraded endpoint.
+
+State machine:
+  closed    — calls allowed; provider errors within `window_seconds` are counted
+  open      — after `failure_threshold` errors; calls rejected for `cooldown_seconds`
+  half-open — after the cooldown allow_request() admits a single trial call;
+              success closes the breaker, another failure reopens it
+              immediately. Other callers stay rejected while the trial runs
+              (for at most another cooldown, in case it never reports back).
+
+is_open is a read-only check for availability reporting; callers about to
+make a request must go through allow_request().
+
+Breakers are shared per provider name across all client instances.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import cache
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the provider's breaker is open."""
+
+
+class CircuitBreaker:
+    """Counts provider failures and rejects calls while the provider is degraded."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        window_seconds: float = 60.0,
+        cooldown_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker for the named provider."""
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._window = window_seconds
+        self._cooldown = cooldown_seconds
+        self._clock = clock
+        self._failures: deque[float] = deque()
+        self._opened_at: float | None = None
+        self._half_open = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while calls would be rejected (does not change state)."""
+        return (
+            self._opened_at is not None
+            and self._clock() - self._opened_at < self._cooldown
+        )
+
+    def allow_request(self) -> bool:
+        """
+        Return True if a call may proceed now.
+
+        Once the cooldown has elapsed, only the first caller is admitted as
+        the half-open trial; the breaker stays open for everyone else until
+        that trial records a success or failure.
+        """
+        if self._opened_at is None:
+            return True
+        now = self._clock()
+        if now - self._opened_at < self._cooldown:
+            return False
+        self._opened_at = now
+        self._half_open = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count after a successful call."""
+        self._failures.clear()
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        """Count a provider failure, opening the breaker at the threshold."""
+        now = self._clock()
+        if self._half_open:
+            self._open(now)
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self._window:
+            self._failures.popleft()
+        if len(self._failures) >= self._failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._half_open = False
+        self._failures.clear()
+        logger.warning(
+            f"CircuitBreaker[{self.name}]: open for {self._cooldown:.0f}s "
+            f"after repeated provider errors"
+        )
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a provider, creating it on first use."""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(provider)
+    return breaker
+
+
+@cache
+def _provider_error_types() -> tuple[type[BaseException], ...]:
+    error_types: list[type[BaseException]] = []
+    try:
+        import openai
+
+        error_types += [
+            openai.APIConnectionError,
+            openai.RateLimitError,
+            openai.InternalServerError,
+        ]
+    except ImportError:
+        pass
+    try:
+        import anthropic
+
+        error_types += [
+            anthropic.APIConnectionError,
+            anthropic.RateLimitError,
+            anthropic.InternalServerError,
+        ]
+    except ImportError:
+        pass
+    return tuple(error_types)
+
+
+def is_provider_error(exc: BaseException) -> bool:
+    """
+    Return True for connection, rate-limit and server errors from the SDKs.
+
+    Schema/validation failures are not counted — they say nothing about the
+    provider's health.
+    """
+    return isinstance(exc, _provider_error_types())
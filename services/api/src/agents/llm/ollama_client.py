@@ -27,7 +27,7 @@ from typing import TypeVar
 
 from pydantic import BaseModel
 
-from src.agents.llm.base_llm_client import BaseLLMClient
+from src.agents.llm.base_llm_client import DEFAULT_MAX_RETRIES, BaseLLMClient
 
 logger = logging.getLogger(__name__)
 
@@ -84,11 +84,10 @@ class OllamaLLMClient(BaseLLMClient):
 
     @property
     def is_available(self) -> bool:
-        """Check if Ollama is reachable and the model is installed."""
-        if self._available is not None:
-            return self._available
-        self._available = self._check_ollama()
-        return self._available
+        """Check Ollama is reachable, the model is installed and the breaker is closed."""
+        if self._available is None:
+            self._available = self._check_ollama()
+        return self._available and not self._breaker.is_open
 
     def _check_ollama(self) -> bool:
         """Ping Ollama once per (base_url, model_name) pair; subsequent calls use cache."""
@@ -136,6 +135,7 @@ class OllamaLLMClient(BaseLLMClient):
             raw = AsyncOpenAI(
                 base_url=self.base_url,
                 api_key=_OLLAMA_API_KEY,
+                max_retries=DEFAULT_MAX_RETRIES,
             )
             # JSON mode is more reliable than TOOLS for local models
             self._instructor_client = instructor.from_openai(
@@ -208,6 +208,7 @@ class OllamaLLMClient(BaseLLMClient):
                 "instructor and openai packages are required for structured output. "
                 "Install with: pip install instructor openai"
             )
+        self._check_circuit()
 
         # Enrich system prompt with schema hint for better JSON adherence
         schema_hint = _build_schema_hint(output_schema)
@@ -232,8 +233,10 @@ class OllamaLLMClient(BaseLLMClient):
                     "completion_tokens": completion.usage.completion_tokens,
                     "total": completion.usage.total_tokens,
                 }
+            self._breaker.record_success()
             return result
         except Exception as e:
+            self._record_call_error(e)
             logger.warning(f"OllamaLLMClient structured output failed: {e}")
             return output_schema()
 
@@ -4,14 +4,18 @@ OpenAI client using Instructor for structured output.
 Uses gpt-4o-mini by default (configurable via agents.yaml).
 """
 
+import json
 import logging
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from pydantic import BaseModel
 
-from src.agents.llm.base_llm_client import BaseLLMClient
+from src.agents.llm.base_llm_client import DEFAULT_MAX_RETRIES, BaseLLMClient
 from src.configs.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.agents.llm.batch_client import BatchOutcome, BatchRequest
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
@@ -25,6 +29,7 @@ class OpenAILLMClient(BaseLLMClient):
     """
 
     provider = "openai"
+    supports_batch = True
 
     def __init__(
         self,
@@ -45,12 +50,13 @@ class OpenAILLMClient(BaseLLMClient):
             else None
         )
         self._client = None
+        self._raw_client = None
         self._last_usage: dict[str, int] = self._empty_usage()
 
     @property
     def is_available(self) -> bool:
-        """Return True if an OpenAI API key is configured."""
-        return bool(self._api_key)
+        """Return True if an API key is configured and the provider breaker is closed."""
+        return bool(self._api_key) and not self._breaker.is_open
 
     def _get_client(self):
         if self._client is not None:
@@ -62,7 +68,7 @@ class OpenAILLMClient(BaseLLMClient):
             from openai import AsyncOpenAI
 
             self._client = instructor.from_openai(
-                AsyncOpenAI(api_key=self._api_key),
+                AsyncOpenAI(api_key=self._api_key, max_retries=DEFAULT_MAX_RETRIES),
                 mode=instructor.Mode.TOOLS,
             )
             return self._client
@@ -70,6 +76,16 @@ class OpenAILLMClient(BaseLLMClient):
             logger.warning("instructor or openai package not installed")
             return None
 
+    def _get_raw_client(self):
+        """Plain AsyncOpenAI client (files and batches aren't wrapped by Instructor)."""
+        if self._raw_client is None:
+            from openai import AsyncOpenAI
+
+            self._raw_client = AsyncOpenAI(
+                api_key=self._api_key, max_retries=DEFAULT_MAX_RETRIES
+            )
+        return self._raw_client
+
     async def complete(
         self,
         system_prompt: str,
@@ -84,7 +100,7 @@ class OpenAILLMClient(BaseLLMClient):
         # Use raw openai for plain text
         from openai import AsyncOpenAI
 
-        raw = AsyncOpenAI(api_key=self._api_key)
+        raw = AsyncOpenAI(api_key=self._api_key, max_retries=DEFAULT_MAX_RETRIES)
         resp = await raw.chat.completions.create(
             model=self.model_name,
             temperature=temperature if temperature is not None else self.temperature,
@@ -114,6 +130,7 @@ class OpenAILLMClient(BaseLLMClient):
         client = self._get_client()
         if not client:
             return output_schema()
+        self._check_circuit()
         try:
             result, completion = await client.chat.completions.create_with_completion(
                 model=self.model_name,
@@ -133,11 +150,88 @@ class OpenAILLMClient(BaseLLMClient):
                     "completion_tokens": completion.usage.completion_tokens,
                     "total": completion.usage.total_tokens,
                 }
+            self._breaker.record_success()
             return result
         except Exception as e:
+            self._record_call_error(e)
             logger.warning(f"OpenAILLMClient structured output failed: {e}")
             return output_schema()
 
+    async def submit_batch(self, requests: list["BatchRequest"]) -> str:
+        """Upload the requests as JSONL and create a /v1/chat/completions batch."""
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": r.custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model_name,
+                        "temperature": r.temperature,
+                        "max_tokens": r.max_tokens,
+                        "messages": [
+                            {"role": "system", "content": r.system_prompt},
+                            {"role": "user", "content": r.user_prompt},
+                        ],
+                        "response_format": {
+                            "type": "json_schema",
+                            "json_schema": {
+                                "name": r.output_schema.__name__,
+                                "schema": r.output_schema.model_json_schema(),
+                            },
+                        },
+                    },
+                }
+            )
+            for r in requests
+        ]
+        raw = self._get_raw_client()
+        upload = await raw.files.create(
+            file=("enrichment_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        job = await raw.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return job.id
+
+    async def fetch_batch(self, job_id: str) -> dict[str, "BatchOutcome"] | None:
+        """Return parsed outcomes once the batch has ended, else None."""
+        from src.agents.llm.batch_client import BatchOutcome
+
+        raw = self._get_raw_client()
+        job = await raw.batches.retrieve(job_id)
+        if job.status in ("validating", "in_progress", "finalizing", "cancelling"):
+            return None
+
+        outcomes: dict[str, BatchOutcome] = {}
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            content = await raw.files.content(file_id)
+            for line in content.text.splitlines():
+                row = json.loads(line)
+                response = row.get("response") or {}
+                body = response.get("body") or {}
+                if row.get("error") or response.get("status_code") != 200:
+                    error = row.get("error") or body.get("error") or "request failed"
+                    outcomes[row["custom_id"]] = BatchOutcome(error=str(error))
+                    continue
+                usage = body.get("usage") or {}
+                outcomes[row["custom_id"]] = BatchOutcome(
+                    data=json.loads(body["choices"][0]["message"]["content"] or "{}"),
+                    usage={
+                        "prompt_tokens": usage.get("prompt_tokens", 0),
+                        "completion_tokens": usage.get("completion_tokens", 0),
+                        "total": usage.get("total_tokens", 0),
+                    },
+                )
+        if not outcomes:
+            logger.warning(f"OpenAILLMClient: batch {job_id} ended as {job.status}")
+        return outcomes
+
     def get_token_usage(self) -> dict[str, int]:
         """Return the token usage from the most recent LLM call."""
         return self._last_usage
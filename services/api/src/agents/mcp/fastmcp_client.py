@@ -47,13 +47,26 @@ class LocalMCPClient(MCPClient):
       - Goes through the full MCP protocol (tool definitions, JSON serialization)
       - Validates tool call schemas just like a real client would
       - Useful for testing the server tools without starting an HTTP server
+
+    With fast_path=True, operations skip the MCP protocol and call the
+    server's native store operations directly, returning plain dicts with no
+    JSON round-trip. Use it when only the shared event store is needed.
     """
 
-    def __init__(self, events: list["EventSchema"] | None = None):
+    def __init__(
+        self,
+        events: list["EventSchema"] | None = None,
+        fast_path: bool = False,
+    ):
         """Initialize LocalMCPClient and optionally pre-load events into the in-process server."""
-        from src.agents.mcp.fastmcp_server import get_server, load_events
+        from src.agents.mcp.fastmcp_server import (
+            get_native_operations,
+            get_server,
+            load_events,
+        )
 
         self._server = get_server()
+        self._native_ops = get_native_operations() if fast_path else None
         if events:
             load_events(events)
 
@@ -65,11 +78,16 @@ class LocalMCPClient(MCPClient):
 
     async def read(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
         """Call a read tool on the in-process FastMCP server."""
+        if self._native_ops is not None:
+            return self._call_native(operation, params)
         return await self._call_tool(operation, params)
 
     async def write(self, operation: str, payload: dict[str, Any]) -> WriteResult:
         """Call a write tool on the in-process FastMCP server."""
-        data = await self._call_tool(operation, payload)
+        if self._native_ops is not None:
+            data = self._call_native(operation, payload)
+        else:
+            data = await self._call_tool(operation, payload)
         return WriteResult(
             success=data.get("success", False),
             operation=operation,
@@ -78,6 +96,23 @@ class LocalMCPClient(MCPClient):
             error=data.get("error"),
         )
 
+    def _call_native(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Call a native store operation directly (fast path, no JSON).
+
+        Follows the _call_tool error contract: any failure is logged and
+        reported as an empty dict rather than raised.
+        """
+        op = self._native_ops.get(operation) if self._native_ops else None
+        if op is None:
+            logger.warning(f"LocalMCPClient: unknown operation '{operation}'")
+            return {}
+        try:
+            return op(**params)
+        except Exception as e:  # noqa: BLE001 — same contract as _call_tool
+            logger.warning(f"LocalMCPClient operation '{operation}' failed: {e}")
+            return {}
+
     async def _call_tool(
         self, tool_name: str, params: dict[str, Any]
     ) -> dict[str, Any]:
@@ -17,22 +17,43 @@ Entry points:
   # Get server instance (local mode — used by LocalMCPClient)
   from src.agents.mcp.fastmcp_server import get_server, load_events
 
+  # JSON-free store operations (local mode fast path)
+  from src.agents.mcp.fastmcp_server import get_native_operations
+
 Tools exposed:
-  READ:  fetch_event_row, fetch_missing_features, list_events, fetch_taxonomy_enums
+  READ:  fetch_event_row, fetch_missing_features, fetch_all_missing, list_events,
+         fetch_taxonomy_enums
   WRITE: write_features, write_taxonomy, write_emotions, write_tags, load_events_tool
+  BATCH: batch_execute
 """
 
 import json
 import logging
+import sys
+import threading
+from collections.abc import Callable, ValuesView
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 from fastmcp import FastMCP
 
+try:
+    import simdjson
+except ImportError:  # optional SIMD parser for bulk loads; stdlib json otherwise
+    simdjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # optional typed decoder for write payloads; stdlib otherwise
+    msgspec = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Shared in-memory event store
-# Keyed by source_event_id (str). Values are model_dump() dicts.
+# Keyed by interned source_event_id (str). Values are JSON-safe dicts
+# (model_dump(mode="json") or _json_safe), so reads never need an encoder.
 # =============================================================================
 _event_store: dict[str, dict[str, Any]] = {}
 _taxonomy_enums: dict[str, list[str]] = {
@@ -47,6 +68,35 @@ _taxonomy_enums: dict[str, list[str]] = {
     "cost_level": ["free", "low", "medium", "high"],
     "time_scale": ["short", "long", "recurring"],
 }
+# The enums are static at runtime, so serialize them once at import.
+_TAXONOMY_ENUMS_JSON: str = json.dumps(_taxonomy_enums)
+
+# Values json.dumps emits as-is (see _json_safe)
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Pre-serialized responses for invariant tool outcomes
+_EMPTY_EVENT_JSON = "{}"
+_WRITE_OK_JSON = json.dumps({"success": True, "error": None})
+
+# Per-thread simdjson parser (see _parse_json_array)
+_parser_local = threading.local()
+
+# Typed list[str] decoder for write payloads (see _parse_str_list)
+_decode_str_list = (
+    msgspec.json.Decoder(list[str]).decode if msgspec is not None else None
+)
+
+# Striped write locks. FastMCP runs sync tools in a threadpool, so concurrent
+# writes to the same event are serialized on one stripe while writes to
+# unrelated events proceed independently. Reads stay lock-free.
+_LOCK_STRIPES = 64
+_write_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+# list_events response cache. _store_version is bumped whenever the key set
+# changes (loads, clears); field writes leave it alone. The cache is tagged
+# with the version it was built from, so a stale entry is never served.
+_store_version: int = 0
+_list_events_cache: tuple[int, str] | None = None
 
 # =============================================================================
 # FastMCP server instance
@@ -77,35 +127,168 @@ def load_events(events: list[Any]) -> int:
         Number of events loaded
     """
     global _event_store
-    loaded = 0
-    for event in events:
-        if hasattr(event, "model_dump"):
-            data = event.model_dump()
-        elif isinstance(event, dict):
-            data = event
-        else:
-            logger.warning(f"Skipping unrecognised event type: {type(event)}")
-            continue
-
-        event_id = str(data.get("source_event_id") or id(event))
-        _event_store[event_id] = data
-        loaded += 1
-
+    # Homogeneous batches (the normal case) skip the per-item type dispatch
+    if all(isinstance(event, dict) for event in events):
+        records = [_json_safe(event) for event in events]
+    elif all(hasattr(event, "model_dump") for event in events):
+        records = [event.model_dump(mode="json") for event in events]
+    else:
+        records = []
+        for event in events:
+            if hasattr(event, "model_dump"):
+                records.append(event.model_dump(mode="json"))
+            elif isinstance(event, dict):
+                records.append(_json_safe(event))
+            else:
+                logger.warning(f"Skipping unrecognised event type: {type(event)}")
+
+    _store_records(records)
+    loaded = len(records)
     logger.info(
         f"FastMCP server: loaded {loaded} events into store (total: {len(_event_store)})"
     )
     return loaded
 
 
+def _json_safe(value: Any) -> Any:
+    """
+    Return value as the JSON tools would decode it, without encoding it.
+
+    Dicts and lists are copied; scalars JSON cannot hold become str(), like
+    json.dumps(default=str).
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else str(key): _json_safe(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list | tuple):
+        return [_json_safe(item) for item in value]
+    return str(value)
+
+
+def _store_records(records: list[dict[str, Any]]) -> None:
+    """Insert event dicts into the store keyed by interned source_event_id."""
+    _event_store.update(
+        {
+            sys.intern(str(record.get("source_event_id") or id(record))): record
+            for record in records
+        }
+    )
+    _mark_keys_changed()
+
+
+def _mark_keys_changed() -> None:
+    """Invalidate the cached list_events response after the key set changes."""
+    global _store_version
+    _store_version += 1
+
+
+def _lock_for(event_id: str) -> threading.Lock:
+    """Return the write lock stripe guarding the given event_id."""
+    return _write_locks[hash(event_id) % _LOCK_STRIPES]
+
+
+def _parse_json_array(raw: str) -> list[Any]:
+    """
+    Parse a JSON array string into a list of plain Python objects.
+
+    Uses pysimdjson when installed (one parser per thread, since FastMCP runs
+    sync tools in a threadpool and simdjson parsers are not thread-safe),
+    otherwise falls back to stdlib json.
+
+    Raises:
+        ValueError: If the input is not valid JSON or not a JSON array
+    """
+    if simdjson is None:
+        data = json.loads(raw)
+    else:
+        parser = getattr(_parser_local, "parser", None)
+        if parser is None:
+            parser = _parser_local.parser = simdjson.Parser()
+        # recursive=True materializes plain dicts/lists, so nothing keeps a
+        # reference into the parser's buffer once we return.
+        data = parser.parse(raw, True)
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array")
+    return data
+
+
+def _parse_str_list(raw: str) -> list[str]:
+    """
+    Parse and validate a JSON array of strings.
+
+    Uses a msgspec typed decoder when installed (parse and type check in one
+    C call), otherwise stdlib json plus an explicit check.
+
+    Raises:
+        ValueError: If the input is not valid JSON or not an array of strings
+    """
+    if _decode_str_list is not None:
+        return _decode_str_list(raw)
+    data = json.loads(raw)
+    if not isinstance(data, list) or not all(isinstance(v, str) for v in data):
+        raise ValueError("Expected a JSON array of strings")
+    return data
+
+
+@lru_cache(maxsize=256)
+def _compile_field_plan(
+    fields: tuple[str, ...],
+) -> tuple[tuple[str, str | None, str | None], ...]:
+    """
+    Precompute the access steps for a target_fields list.
+
+    Agents send the same target_fields on every call, so each distinct list
+    is parsed once into (field, parent, child) triples; parent/child are None
+    for plain (non-dotted) fields.
+    """
+    plan = []
+    for field in fields:
+        parent, dot, child = field.partition(".")
+        plan.append((field, parent, child) if dot else (field, None, None))
+    return tuple(plan)
+
+
+def _is_missing(
+    event: dict[str, Any], field: str, parent: str | None, child: str | None
+) -> bool:
+    """Return True if a compiled field (see _compile_field_plan) is None or empty."""
+    value = event.get(field)
+    # Dotted fields fall back to the nested dict (e.g. taxonomy.energy_level)
+    if value is None and parent is not None:
+        nested = event.get(parent)
+        if nested:
+            value = nested.get(child)
+    return value is None or value == [] or value == ""
+
+
 def get_enriched_events() -> list[dict[str, Any]]:
-    """Return all events from the store (after enrichment)."""
+    """
+    Return all events from the store (after enrichment) as a new list.
+
+    Prefer iter_enriched_events() when the events are only iterated once.
+    """
     return list(_event_store.values())
 
 
+def iter_enriched_events() -> ValuesView[dict[str, Any]]:
+    """
+    Return a live view over the events in the store, without copying.
+
+    The view reflects later loads and clears; do not load or clear the store
+    while iterating it.
+    """
+    return _event_store.values()
+
+
 def clear_store() -> None:
     """Clear the event store (useful between pipeline runs)."""
     global _event_store
     _event_store.clear()
+    _mark_keys_changed()
 
 
 def get_server() -> FastMCP:
@@ -113,9 +296,224 @@ def get_server() -> FastMCP:
     return mcp
 
 
+# =============================================================================
+# NATIVE OPERATIONS
+# =============================================================================
+# Store operations on plain Python values. The MCP tools below are thin JSON
+# wrappers around these; LocalMCPClient's fast path calls them directly so
+# in-process callers skip the JSON encode/decode round-trip. Parameter names
+# match the payload keys used by agents/mcp/readers.py and writers.py.
+
+_ALLOWED_WRITE_FIELDS = {
+    "title",
+    "description",
+    "start_datetime",
+    "end_datetime",
+    "venue_name",
+    "location",
+    "price_info",
+    "ticket_info",
+    "tags",
+    "custom_fields",
+    "source_info",
+}
+
+_ALLOWED_TAXONOMY_FIELDS = {
+    "energy_level",
+    "social_intensity",
+    "cognitive_load",
+    "physical_involvement",
+    "environment",
+    "risk_level",
+    "age_accessibility",
+    "repeatability",
+    "cost_level",
+    "time_scale",
+    "emotional_output",
+}
+
+
+def _op_fetch_event_row(event_id: str) -> dict[str, Any]:
+    """
+    Return a shallow copy of the stored event dict, or {} if not found.
+
+    Rows are stored JSON-safe, so this equals what the fetch_event_row tool
+    decodes to.
+    """
+    event = _event_store.get(event_id)
+    return dict(event) if event else {}
+
+
+def _op_fetch_missing_features(
+    event_id: str, target_fields: list[str]
+) -> dict[str, Any]:
+    """Return which target_fields are missing (None or empty) for an event."""
+    event = _event_store.get(event_id)
+    if not event:
+        return {
+            "event_id": event_id,
+            "missing": target_fields,
+            "total": len(target_fields),
+            "error": "Event not found",
+        }
+
+    missing = [
+        field
+        for field, parent, child in _compile_field_plan(tuple(target_fields))
+        if _is_missing(event, field, parent, child)
+    ]
+
+    return {"event_id": event_id, "missing": missing, "total": len(missing)}
+
+
+def _op_fetch_all_missing(field: str) -> dict[str, Any]:
+    """Return the IDs of every event where field is missing (None or empty)."""
+    ((_, parent, child),) = _compile_field_plan((field,))
+    # Snapshot items so concurrent loads cannot resize the dict mid-scan
+    event_ids = [
+        event_id
+        for event_id, event in list(_event_store.items())
+        if _is_missing(event, field, parent, child)
+    ]
+    return {"field": field, "event_ids": event_ids, "count": len(event_ids)}
+
+
+def _op_list_events() -> dict[str, Any]:
+    """Return all event IDs currently in the store."""
+    event_ids = list(_event_store)
+    return {"event_ids": event_ids, "count": len(event_ids)}
+
+
+def _op_fetch_taxonomy_enums() -> dict[str, Any]:
+    """Return a copy of the valid enum values for each taxonomy field."""
+    return {field: list(values) for field, values in _taxonomy_enums.items()}
+
+
+def _is_str_list(value: Any) -> bool:
+    """Return True if value is a list of strings."""
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def _op_write_features(event_id: str, fields: dict[str, Any]) -> dict[str, Any]:
+    """Write allowed top-level feature fields to an event."""
+    if event_id not in _event_store:
+        return {
+            "success": False,
+            "fields_written": [],
+            "error": f"Event '{event_id}' not found",
+        }
+
+    unknown = set(fields.keys()) - _ALLOWED_WRITE_FIELDS
+    if unknown:
+        return {
+            "success": False,
+            "fields_written": [],
+            "error": f"Disallowed fields: {unknown}",
+        }
+
+    with _lock_for(event_id):
+        _event_store[event_id] |= fields
+    return {"success": True, "fields_written": list(fields.keys()), "error": None}
+
+
+def _op_write_taxonomy(event_id: str, taxonomy: dict[str, Any]) -> dict[str, Any]:
+    """Write allowed taxonomy fields to an event's taxonomy sub-object."""
+    if event_id not in _event_store:
+        return {
+            "success": False,
+            "fields_written": [],
+            "error": f"Event '{event_id}' not found",
+        }
+
+    unknown = set(taxonomy.keys()) - _ALLOWED_TAXONOMY_FIELDS
+    if unknown:
+        return {
+            "success": False,
+            "fields_written": [],
+            "error": f"Disallowed taxonomy fields: {unknown}",
+        }
+
+    with _lock_for(event_id):
+        event = _event_store[event_id]
+        if "taxonomy" not in event or event["taxonomy"] is None:
+            event["taxonomy"] = {}
+        event["taxonomy"] |= taxonomy
+
+    return {"success": True, "fields_written": list(taxonomy.keys()), "error": None}
+
+
+def _op_write_emotions(event_id: str, emotional_output: list[str]) -> dict[str, Any]:
+    """Set an event's taxonomy.emotional_output list."""
+    if event_id not in _event_store:
+        return {"success": False, "error": f"Event '{event_id}' not found"}
+    if not _is_str_list(emotional_output):
+        return {
+            "success": False,
+            "error": "Invalid input: Expected a JSON array of strings",
+        }
+
+    with _lock_for(event_id):
+        event = _event_store[event_id]
+        if "taxonomy" not in event or event["taxonomy"] is None:
+            event["taxonomy"] = {}
+        event["taxonomy"]["emotional_output"] = emotional_output
+
+    return {"success": True, "error": None}
+
+
+def _op_write_tags(event_id: str, tags: list[str]) -> dict[str, Any]:
+    """Merge tags into an event's tags list, deduplicating in first-seen order."""
+    if event_id not in _event_store:
+        return {
+            "success": False,
+            "tags_count": 0,
+            "error": f"Event '{event_id}' not found",
+        }
+    if not _is_str_list(tags):
+        return {
+            "success": False,
+            "tags_count": 0,
+            "error": "Invalid input: Expected a JSON array of strings",
+        }
+
+    with _lock_for(event_id):
+        event = _event_store[event_id]
+        # dict.fromkeys dedupes in one pass and keeps first-seen tag order
+        merged = list(dict.fromkeys(chain(event.get("tags") or (), tags)))
+        event["tags"] = merged
+
+    return {"success": True, "tags_count": len(merged), "error": None}
+
+
+_NATIVE_OPERATIONS: dict[str, Callable[..., dict[str, Any]]] = {
+    "fetch_event_row": _op_fetch_event_row,
+    "fetch_missing_features": _op_fetch_missing_features,
+    "fetch_all_missing": _op_fetch_all_missing,
+    "list_events": _op_list_events,
+    "fetch_taxonomy_enums": _op_fetch_taxonomy_enums,
+    "write_features": _op_write_features,
+    "write_taxonomy": _op_write_taxonomy,
+    "write_emotions": _op_write_emotions,
+    "write_tags": _op_write_tags,
+}
+
+
+def get_native_operations() -> dict[str, Callable[..., dict[str, Any]]]:
+    """
+    Return the JSON-free store operations keyed by MCP operation name.
+
+    Used by LocalMCPClient(fast_path=True). Operations take the same keyword
+    arguments as the MCPClient read/write payloads and return plain dicts.
+    """
+    return _NATIVE_OPERATIONS
+
+
 # =============================================================================
 # READ TOOLS
 # =============================================================================
+# Tools return JSON as str on purpose: MCP carries tool output as TextContent,
+# and FastMCP decodes bytes results back to str before framing, so returning
+# pre-encoded bytes would add a decode rather than skip an encode.
 
 
 @mcp.tool()
@@ -125,7 +523,9 @@ def fetch_event_row(event_id: str) -> str:
 
     Returns a JSON string of the event dict, or '{}' if not found.
     """
-    event = _event_store.get(event_id, {})
+    event = _event_store.get(event_id)
+    if not event:
+        return _EMPTY_EVENT_JSON
     return json.dumps(event, default=str)
 
 
@@ -136,29 +536,20 @@ def fetch_missing_features(event_id: str, target_fields: list[str]) -> str:
 
     Returns JSON: {"event_id": str, "missing": [field_names], "total": int}
     """
-    event = _event_store.get(event_id, {})
-    if not event:
-        return json.dumps(
-            {
-                "event_id": event_id,
-                "missing": target_fields,
-                "total": len(target_fields),
-                "error": "Event not found",
-            }
-        )
+    return json.dumps(_op_fetch_missing_features(event_id, target_fields))
 
-    missing = []
-    for field in target_fields:
-        value = event.get(field)
-        # Check nested taxonomy fields
-        if value is None and "." in field:
-            parts = field.split(".", 1)
-            nested = event.get(parts[0], {})
-            value = (nested or {}).get(parts[1])
-        if value is None or value == [] or value == "":
-            missing.append(field)
 
-    return json.dumps({"event_id": event_id, "missing": missing, "total": len(missing)})
+@mcp.tool()
+def fetch_all_missing(field: str) -> str:
+    """
+    Find every event in the store that is missing a field (None or empty).
+
+    One store-wide scan replaces a fetch_missing_features call per event when
+    an agent only needs to know which events still lack a given field.
+
+    Returns JSON: {"field": str, "event_ids": [...], "count": int}
+    """
+    return json.dumps(_op_fetch_all_missing(field))
 
 
 @mcp.tool()
@@ -168,9 +559,15 @@ def list_events() -> str:
 
     Returns JSON: {"event_ids": [...], "count": int}
     """
-    return json.dumps(
-        {"event_ids": list(_event_store.keys()), "count": len(_event_store)}
-    )
+    global _list_events_cache
+    cached = _list_events_cache
+    if cached is not None and cached[0] == _store_version:
+        return cached[1]
+
+    version = _store_version
+    response = json.dumps(_op_list_events())
+    _list_events_cache = (version, response)
+    return response
 
 
 @mcp.tool()
@@ -180,41 +577,13 @@ def fetch_taxonomy_enums() -> str:
 
     Returns JSON dict mapping field_name → list of valid values.
     """
-    return json.dumps(_taxonomy_enums)
+    return _TAXONOMY_ENUMS_JSON
 
 
 # =============================================================================
 # WRITE TOOLS
 # =============================================================================
 
-_ALLOWED_WRITE_FIELDS = {
-    "title",
-    "description",
-    "start_datetime",
-    "end_datetime",
-    "venue_name",
-    "location",
-    "price_info",
-    "ticket_info",
-    "tags",
-    "custom_fields",
-    "source_info",
-}
-
-_ALLOWED_TAXONOMY_FIELDS = {
-    "energy_level",
-    "social_intensity",
-    "cognitive_load",
-    "physical_involvement",
-    "environment",
-    "risk_level",
-    "age_accessibility",
-    "repeatability",
-    "cost_level",
-    "time_scale",
-    "emotional_output",
-}
-
 
 @mcp.tool()
 def write_features(event_id: str, fields_json: str) -> str:
@@ -227,15 +596,9 @@ def write_features(event_id: str, fields_json: str) -> str:
 
     Returns JSON: {"success": bool, "fields_written": [...], "error": str|null}
     """
+    # Report a missing event before parsing, as the native operation does
     if event_id not in _event_store:
-        return json.dumps(
-            {
-                "success": False,
-                "fields_written": [],
-                "error": f"Event '{event_id}' not found",
-            }
-        )
-
+        return json.dumps(_op_write_features(event_id, {}))
     try:
         fields = json.loads(fields_json)
     except json.JSONDecodeError as e:
@@ -243,20 +606,7 @@ def write_features(event_id: str, fields_json: str) -> str:
             {"success": False, "fields_written": [], "error": f"Invalid JSON: {e}"}
         )
 
-    unknown = set(fields.keys()) - _ALLOWED_WRITE_FIELDS
-    if unknown:
-        return json.dumps(
-            {
-                "success": False,
-                "fields_written": [],
-                "error": f"Disallowed fields: {unknown}",
-            }
-        )
-
-    _event_store[event_id].update(fields)
-    return json.dumps(
-        {"success": True, "fields_written": list(fields.keys()), "error": None}
-    )
+    return json.dumps(_op_write_features(event_id, fields))
 
 
 @mcp.tool()
@@ -270,15 +620,9 @@ def write_taxonomy(event_id: str, taxonomy_json: str) -> str:
 
     Returns JSON: {"success": bool, "fields_written": [...], "error": str|null}
     """
+    # Report a missing event before parsing, as the native operation does
     if event_id not in _event_store:
-        return json.dumps(
-            {
-                "success": False,
-                "fields_written": [],
-                "error": f"Event '{event_id}' not found",
-            }
-        )
-
+        return json.dumps(_op_write_taxonomy(event_id, {}))
     try:
         taxonomy_data = json.loads(taxonomy_json)
     except json.JSONDecodeError as e:
@@ -286,24 +630,7 @@ def write_taxonomy(event_id: str, taxonomy_json: str) -> str:
             {"success": False, "fields_written": [], "error": f"Invalid JSON: {e}"}
         )
 
-    unknown = set(taxonomy_data.keys()) - _ALLOWED_TAXONOMY_FIELDS
-    if unknown:
-        return json.dumps(
-            {
-                "success": False,
-                "fields_written": [],
-                "error": f"Disallowed taxonomy fields: {unknown}",
-            }
-        )
-
-    event = _event_store[event_id]
-    if "taxonomy" not in event or event["taxonomy"] is None:
-        event["taxonomy"] = {}
-    event["taxonomy"].update(taxonomy_data)
-
-    return json.dumps(
-        {"success": True, "fields_written": list(taxonomy_data.keys()), "error": None}
-    )
+    return json.dumps(_op_write_taxonomy(event_id, taxonomy_data))
 
 
 @mcp.tool()
@@ -317,22 +644,16 @@ def write_emotions(event_id: str, emotional_output_json: str) -> str:
 
     Returns JSON: {"success": bool, "error": str|null}
     """
+    # Report a missing event before parsing, as the native operation does
     if event_id not in _event_store:
-        return json.dumps({"success": False, "error": f"Event '{event_id}' not found"})
-
+        return json.dumps(_op_write_emotions(event_id, []))
     try:
-        emotions = json.loads(emotional_output_json)
-        if not isinstance(emotions, list):
-            raise ValueError("Expected a JSON array")
-    except (json.JSONDecodeError, ValueError) as e:
+        emotions = _parse_str_list(emotional_output_json)
+    except ValueError as e:
         return json.dumps({"success": False, "error": f"Invalid input: {e}"})
 
-    event = _event_store[event_id]
-    if "taxonomy" not in event or event["taxonomy"] is None:
-        event["taxonomy"] = {}
-    event["taxonomy"]["emotional_output"] = emotions
-
-    return json.dumps({"success": True, "error": None})
+    result = _op_write_emotions(event_id, emotions)
+    return _WRITE_OK_JSON if result["success"] else json.dumps(result)
 
 
 @mcp.tool()
@@ -346,30 +667,17 @@ def write_tags(event_id: str, tags_json: str) -> str:
 
     Returns JSON: {"success": bool, "tags_count": int, "error": str|null}
     """
+    # Report a missing event before parsing, as the native operation does
     if event_id not in _event_store:
-        return json.dumps(
-            {
-                "success": False,
-                "tags_count": 0,
-                "error": f"Event '{event_id}' not found",
-            }
-        )
-
+        return json.dumps(_op_write_tags(event_id, []))
     try:
-        new_tags = json.loads(tags_json)
-        if not isinstance(new_tags, list):
-            raise ValueError("Expected a JSON array")
-    except (json.JSONDecodeError, ValueError) as e:
+        new_tags = _parse_str_list(tags_json)
+    except ValueError as e:
         return json.dumps(
             {"success": False, "tags_count": 0, "error": f"Invalid input: {e}"}
         )
 
-    event = _event_store[event_id]
-    existing = set(event.get("tags") or [])
-    merged = list(existing | set(new_tags))
-    event["tags"] = merged
-
-    return json.dumps({"success": True, "tags_count": len(merged), "error": None})
+    return json.dumps(_op_write_tags(event_id, new_tags))
 
 
 @mcp.tool()
@@ -386,19 +694,79 @@ def load_events_tool(events_json: str) -> str:
     """
     global _event_store
     try:
-        events = json.loads(events_json)
-        if not isinstance(events, list):
+        events = _parse_json_array(events_json)
+    except ValueError as e:
+        return json.dumps({"loaded": 0, "total": 0, "error": str(e)})
+
+    _store_records(events)
+    return json.dumps({"loaded": len(events), "total": len(_event_store)})
+
+
+# =============================================================================
+# BATCH TOOL
+# =============================================================================
+
+# Tools callable through batch_execute (bulk loading keeps its own tool)
+_BATCHABLE_TOOLS: dict[str, Callable[..., str]] = {
+    "fetch_event_row": fetch_event_row,
+    "fetch_missing_features": fetch_missing_features,
+    "fetch_all_missing": fetch_all_missing,
+    "list_events": list_events,
+    "fetch_taxonomy_enums": fetch_taxonomy_enums,
+    "write_features": write_features,
+    "write_taxonomy": write_taxonomy,
+    "write_emotions": write_emotions,
+    "write_tags": write_tags,
+}
+
+
+@mcp.tool()
+def batch_execute(calls_json: str, stop_on_error: bool = False) -> str:
+    """
+    Execute several tool calls in a single round-trip.
+
+    Agents typically read an event and then issue several writes for it;
+    batching collapses those calls into one request/response. Calls run in
+    order, so writes to the same event are applied in the order given.
+
+    Args:
+        calls_json: JSON array of {"tool": name, "args": {...}} objects, where
+            args are the same keyword arguments the individual tool takes
+        stop_on_error: Stop at the first call that fails
+
+    Returns JSON: {"results": [...], "executed": int, "error": str|null}
+    """
+    try:
+        calls = json.loads(calls_json)
+        if not isinstance(calls, list):
             raise ValueError("Expected a JSON array")
     except (json.JSONDecodeError, ValueError) as e:
-        return json.dumps({"loaded": 0, "total": 0, "error": str(e)})
+        return json.dumps(
+            {"results": [], "executed": 0, "error": f"Invalid input: {e}"}
+        )
 
-    loaded = 0
-    for event in events:
-        event_id = str(event.get("source_event_id") or id(event))
-        _event_store[event_id] = event
-        loaded += 1
+    results: list[Any] = []
+    for call in calls:
+        tool_name = call.get("tool") if isinstance(call, dict) else None
+        tool = _BATCHABLE_TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+        if tool is None:
+            result: Any = {"success": False, "error": f"Unknown tool: {tool_name}"}
+        else:
+            try:
+                result = json.loads(tool(**(call.get("args") or {})))
+            except TypeError as e:
+                result = {"success": False, "error": f"Invalid arguments: {e}"}
+            except Exception as e:  # noqa: BLE001 — recorded so stop_on_error applies
+                result = {"success": False, "error": str(e)}
+        results.append(result)
+
+        failed = isinstance(result, dict) and (
+            result.get("success") is False or bool(result.get("error"))
+        )
+        if failed and stop_on_error:
+            break
 
-    return json.dumps({"loaded": loaded, "total": len(_event_store)})
+    return json.dumps({"results": results, "executed": len(results), "error": None})
 
 
 # =============================================================================
@@ -415,6 +783,9 @@ def run_server(host: str = "localhost", port: int = 8001) -> None:
         python -m src.agents.mcp.fastmcp_server --host 0.0.0.0 --port 8001
     """
     logger.info(f"Starting Pulsecity FastMCP server at http://{host}:{port}")
+    # No socket tuning needed for the small JSON-RPC frames MCP exchanges:
+    # uvicorn serves through asyncio (or uvloop) transports, which already
+    # set TCP_NODELAY on every accepted connection, so Nagle is off.
     mcp.run(transport="streamable-http", host=host, port=port)
 
 
@@ -15,15 +15,18 @@ Mode is set in configs/agents.yaml under global.mcp_mode.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
+
     from src.schemas.event import EventSchema
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WriteResult:
     """Result of an MCP write operation."""
 
@@ -34,6 +37,28 @@ class WriteResult:
     error: str | None = None
 
 
+# Declared field names per model class; a plain dict rather than functools.cache
+# so calls are checked against the type[BaseModel] parameter
+_FIELD_NAMES: dict[type, frozenset[str]] = {}
+
+
+def _model_field_names(model_cls: type["BaseModel"]) -> frozenset[str]:
+    """Return the declared pydantic field names of a model class (cached per class)."""
+    names = _FIELD_NAMES.get(model_cls)
+    if names is None:
+        names = _FIELD_NAMES[model_cls] = frozenset(model_cls.model_fields)
+    return names
+
+
+def _field_value(obj: Any, path: str) -> Any:
+    """Resolve a plain or dotted attribute path (e.g. "taxonomy.energy_level")."""
+    head, _, rest = path.partition(".")
+    value = getattr(obj, head, None)
+    if rest and value is not None:
+        value = getattr(value, rest, None)
+    return value
+
+
 class MCPClient(ABC):
     """
     Abstract MCP interface.
@@ -141,8 +166,7 @@ class DirectMCPClient(MCPClient):
         event = self._events.get(event_id)
         if event is None:
             return {"missing": target_fields}
-        event_dict = event.model_dump()
-        missing = [f for f in target_fields if not event_dict.get(f)]
+        missing = [f for f in target_fields if not _field_value(event, f)]
         return {"event_id": event_id, "missing": missing, "total": len(missing)}
 
     async def _list_events(self, params: dict[str, Any]) -> dict[str, Any]:
@@ -163,9 +187,10 @@ class DirectMCPClient(MCPClient):
                 error="Event not found",
             )
         fields = payload.get("fields", {})
+        allowed = _model_field_names(type(event))
         written = []
         for field_name, value in fields.items():
-            if hasattr(event, field_name):
+            if field_name in allowed:
                 setattr(event, field_name, value)
                 written.append(field_name)
         return WriteResult(
@@ -187,9 +212,11 @@ class DirectMCPClient(MCPClient):
             )
         taxonomy_data = payload.get("taxonomy", {})
         if taxonomy_data and event.taxonomy:
+            taxonomy = event.taxonomy
+            allowed = _model_field_names(type(taxonomy))
             for field_name, value in taxonomy_data.items():
-                if hasattr(event.taxonomy, field_name):
-                    setattr(event.taxonomy, field_name, value)
+                if field_name in allowed:
+                    setattr(taxonomy, field_name, value)
         return WriteResult(success=True, operation="write_taxonomy", event_id=event_id)
 
     async def _write_emotions(self, payload: dict[str, Any]) -> WriteResult:
@@ -219,8 +246,7 @@ class DirectMCPClient(MCPClient):
             )
         tags = payload.get("tags", [])
         if tags:
-            existing = set(event.tags or [])
-            event.tags = list(existing | set(tags))
+            event.tags = list(dict.fromkeys(chain(event.tags or (), tags)))
         return WriteResult(success=True, operation="write_tags", event_id=event_id)
 
 
@@ -233,6 +259,7 @@ def create_mcp_client(
     mode: str = "local",
     events: "list[EventSchema] | None" = None,
     server_url: str = "http://localhost:8001",
+    fast_path: bool = False,
 ) -> MCPClient:
     """
     Create the appropriate MCP client for the given mode.
@@ -244,6 +271,8 @@ def create_mcp_client(
               server — FastMCP over HTTP SSE (requires running server)
         events: EventSchema objects to pre-load into the store
         server_url: Base URL of the FastMCP server (server mode only)
+        fast_path: Call the server's native operations directly, skipping the
+                   MCP protocol and JSON round-trip (local mode only)
 
     Returns:
         Configured MCPClient instance
@@ -262,7 +291,7 @@ def create_mcp_client(
     elif mode == "local":
         from src.agents.mcp.fastmcp_client import LocalMCPClient
 
-        return LocalMCPClient(events=events)
+        return LocalMCPClient(events=events, fast_path=fast_path)
 
     elif mode == "server":
         from src.agents.mcp.fastmcp_client import ServerMCPClient
@@ -8,22 +8,97 @@ Agent chain (ordered):
   4. data_quality        → quality_score, normalization_errors
 
 Each agent receives the events output by the previous agent (pipeline pattern).
+Events with identical content (recurring series, cross-listed gigs) are sent
+to each agent once and the result is fanned back out. When
+global.enrichment_cache is enabled, content an agent has already enriched in
+an earlier run reuses the cached output and skips that agent's LLM call.
+Inputs are also sorted by approximate prompt length before dispatch so each
+LLM batch holds similarly sized events (per-agent `length_bucketing: false`
+turns this off); results are always returned in the original order.
+
+Per-event agents work on private copies of their inputs, and only the fields
+they changed are merged back. An agent can declare `required_fields` in
+agents.yaml. Optional fields outside that list (media, engagement,
+ticketing, ...) are then reset to their defaults in the copy it receives,
+so large payloads are neither copied nor seen. Schema-required fields are
+always kept.
+
+With global.stream_window > 0 the chain runs as a pipeline: events flow
+through the agents in windows of that size, so later agents start on early
+windows while earlier agents are still working. Agents that are not
+cacheable (deduplication, data_quality) wait for the full batch.
+
+async_mode="batch" is for offline runs (nightly, backfills): agents whose
+provider has a batch API send their LLM calls as provider batch jobs at
+roughly half the cost, trading latency for price. The run is not windowed,
+each agent's batches are all submitted together, and the job ids are
+reported in EnrichmentRunResult.batch_job_ids.
 """
 
+import asyncio
+import copy
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
+
     from src.schemas.event import EventSchema
 
 from src.agents.base.base_agent import BaseAgent
-from src.agents.base.task import AgentResult, AgentTask
+from src.agents.base.task import AgentResult, AgentTask, TokenUsage
+from src.agents.cache.enrichment_cache import EnrichmentCache, field_delta
+from src.agents.llm.batch_client import BatchLLMClient
+from src.agents.orchestration.telemetry import agent_span, record_agent_result
 
 logger = logging.getLogger(__name__)
 
 
+def _project(event: "EventSchema", dropped: frozenset[str]) -> "EventSchema":
+    """Private copy of an event for an agent, with `dropped` fields at their defaults."""
+    if not dropped:
+        return event.model_copy(deep=True)
+    model_fields = type(event).model_fields
+    return event.model_copy(
+        update={
+            name: (
+                model_fields[name].get_default(call_default_factory=True)
+                if name in dropped
+                else copy.deepcopy(value)
+            )
+            for name, value in event
+        }
+    )
+
+
+def _view_delta(
+    event: "EventSchema", view: "EventSchema", dropped: frozenset[str]
+) -> dict[str, Any]:
+    """Fields an agent changed on a projected view, relative to what it was given."""
+    if not dropped:
+        return field_delta(event, view)
+    model_fields = type(event).model_fields
+    baseline = event.model_copy(
+        update={
+            name: model_fields[name].get_default(call_default_factory=True)
+            for name in dropped
+        }
+    )
+    return field_delta(baseline, view)
+
+
+def _score_key(event: "EventSchema") -> str:
+    """Key agents use for an event in AgentResult.confidence_scores."""
+    return str(event.source.source_event_id)
+
+
+def _prompt_length(event: "EventSchema") -> int:
+    """Approximate prompt size of an event (batch context caps descriptions at 400)."""
+    return len(event.title or "") + min(len(event.description or ""), 400)
+
+
 @dataclass
 class EnrichmentRunResult:
     """Aggregated result from a full BatchEnrichmentRunner execution."""
@@ -31,9 +106,10 @@ class EnrichmentRunResult:
     events: list["EventSchema"]
     agent_results: list[AgentResult]
     total_duration_seconds: float
-    total_token_usage: dict[str, int] = field(default_factory=dict)
+    total_token_usage: TokenUsage = field(default_factory=TokenUsage)
     errors_by_agent: dict[str, list[str]] = field(default_factory=dict)
     prompt_versions_used: dict[str, str] = field(default_factory=dict)
+    batch_job_ids: dict[str, list[str]] = field(default_factory=dict)
 
     @property
     def total_errors(self) -> int:
@@ -46,6 +122,41 @@ class EnrichmentRunResult:
         return len(self.events) > 0
 
 
+def _merge_results(results: list[AgentResult]) -> AgentResult:
+    """Combine one agent's per-window results into a single AgentResult."""
+    if len(results) == 1:
+        return results[0]
+
+    first = results[0]
+    token_usage: dict[str, int] = {}
+    score_sums: dict[str, float] = {}
+    score_weights: dict[str, int] = {}
+    for result in results:
+        for k, v in result.token_usage.items():
+            token_usage[k] = token_usage.get(k, 0) + v
+        # Event-weighted mean of per-window confidence scores
+        for k, v in result.confidence_scores.items():
+            score_sums[k] = score_sums.get(k, 0.0) + v * len(result.events)
+            score_weights[k] = score_weights.get(k, 0) + len(result.events)
+
+    return AgentResult(
+        agent_name=first.agent_name,
+        prompt_name=first.prompt_name,
+        prompt_version=next(
+            (r.prompt_version for r in results if r.prompt_version != "skipped"),
+            first.prompt_version,
+        ),
+        events=[e for r in results for e in r.events],
+        confidence_scores={
+            k: score_sums[k] / score_weights[k] if score_weights[k] else 0.0
+            for k in score_sums
+        },
+        token_usage=token_usage,
+        errors=[e for r in results for e in r.errors],
+        duration_seconds=sum(r.duration_seconds for r in results),
+    )
+
+
 class BatchEnrichmentRunner:
     """
     Runs the ordered enrichment agent chain on a batch of events.
@@ -57,13 +168,32 @@ class BatchEnrichmentRunner:
     def __init__(
         self,
         agents_config: dict[str, Any] | None = None,
+        async_mode: Literal["online", "batch"] = "online",
     ):
         """
         Args:
             agents_config: Full agents.yaml config dict. If None, defaults are used.
+            async_mode: "online" calls LLMs directly; "batch" uses provider
+                        batch APIs where available (cheaper, hours of latency).
         """
         self._agents_config = agents_config or {}
+        global_cfg = self._agents_config.get("global", {})
+        self._max_concurrency = int(global_cfg.get("max_concurrency", 1))
+        # Events per pipeline window; 0 runs each agent once over the whole batch
+        self._stream_window = int(global_cfg.get("stream_window", 0))
+
+        cache_cfg = global_cfg.get("enrichment_cache", {})
+        self._cache: EnrichmentCache | None = (
+            EnrichmentCache(max_entries=int(cache_cfg.get("max_entries", 10_000)))
+            if cache_cfg.get("enabled", False)
+            else None
+        )
         self._agent_chain: list[BaseAgent] = self._build_chain()
+        self._batch_clients: dict[str, BatchLLMClient] = (
+            self._use_batch_api(global_cfg.get("batch_api", {}))
+            if async_mode == "batch"
+            else {}
+        )
 
     def _build_chain(self) -> list[BaseAgent]:
         """Instantiate the ordered agent chain from config."""
@@ -81,6 +211,10 @@ class BatchEnrichmentRunner:
             "deduplication",
         ]
 
+        # Pay imports, client setup and prompt compilation up front so the
+        # first batch runs at warm throughput
+        registry.warm(self._agents_config, chain_order)
+
         chain: list[BaseAgent] = []
         for agent_name in chain_order:
             agent_config = agents_section.get(agent_name, {})
@@ -100,10 +234,30 @@ class BatchEnrichmentRunner:
 
         return chain
 
+    def _use_batch_api(self, batch_cfg: dict[str, Any]) -> dict[str, BatchLLMClient]:
+        """Route each agent's LLM calls through its provider's batch API."""
+        clients: dict[str, BatchLLMClient] = {}
+        for agent in self._agent_chain:
+            llm = getattr(agent, "_llm", None)
+            if llm is None or not llm.supports_batch:
+                logger.info(
+                    f"BatchEnrichmentRunner: {agent.name} has no batch API, "
+                    f"running online"
+                )
+                continue
+            clients[agent.name] = agent._llm = BatchLLMClient(
+                llm,
+                collect_seconds=float(batch_cfg.get("collect_seconds", 1.0)),
+                poll_initial_seconds=float(batch_cfg.get("poll_initial_seconds", 30)),
+                poll_max_seconds=float(batch_cfg.get("poll_max_seconds", 300)),
+            )
+        return clients
+
     async def run(
         self,
         events: list["EventSchema"],
         prompt_version: str = "active",
+        limiter: asyncio.Semaphore | None = None,
     ) -> EnrichmentRunResult:
         """
         Run the full agent chain on a batch of events.
@@ -111,6 +265,8 @@ class BatchEnrichmentRunner:
         Args:
             events: EventSchema objects to enrich
             prompt_version: "active" or explicit version (e.g., "v1")
+            limiter: Semaphore shared with other concurrent runs; bounds their
+                     combined in-flight LLM batches instead of max_concurrency
 
         Returns:
             EnrichmentRunResult with enriched events and per-agent metadata
@@ -123,50 +279,266 @@ class BatchEnrichmentRunner:
             )
 
         start = time.monotonic()
-        current_events = list(events)
-        agent_results: list[AgentResult] = []
-        total_tokens: dict[str, int] = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total": 0,
+        jobs_before = {name: len(c.job_ids) for name, c in self._batch_clients.items()}
+        # Batch jobs take minutes to hours; one job per agent pass beats one per window
+        window = 0 if self._batch_clients else self._stream_window
+        windows = (
+            [events[i : i + window] for i in range(0, len(events), window)]
+            if window > 0
+            else [list(events)]
+        )
+        results_by_agent: dict[str, list[AgentResult]] = {
+            agent.name: [] for agent in self._agent_chain
+        }
+        failures_by_agent: dict[str, list[str]] = {
+            agent.name: [] for agent in self._agent_chain
         }
+
+        # One stage per agent, connected by bounded queues: agent N+1 starts on
+        # a window as soon as agent N has finished it. `None` ends the stream.
+        queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=2) for _ in range(len(self._agent_chain) + 1)
+        ]
+        enriched: list[EventSchema] = []
+
+        async def _feed() -> None:
+            for chunk in windows:
+                await queues[0].put(chunk)
+            await queues[0].put(None)
+
+        async def _run_window(
+            agent: BaseAgent, chunk: list["EventSchema"]
+        ) -> list["EventSchema"]:
+            logger.info(
+                f"BatchEnrichmentRunner: running {agent.name} on {len(chunk)} events"
+            )
+            window_start = time.monotonic()
+            with agent_span(agent.name, len(chunk)) as span:
+                try:
+                    result = await self._run_agent(
+                        agent, chunk, prompt_version, limiter
+                    )
+                except Exception as e:
+                    msg = f"Agent '{agent.name}' raised an exception: {e}"
+                    logger.error(msg, exc_info=True)
+                    if span is not None:
+                        span.record_exception(e)
+                    failures_by_agent[agent.name].append(msg)
+                    return chunk  # pass the window through unchanged
+            record_agent_result(agent.name, result, time.monotonic() - window_start)
+            results_by_agent[agent.name].append(result)
+            return result.events
+
+        async def _stage(k: int, agent: BaseAgent) -> None:
+            inbox, outbox = queues[k], queues[k + 1]
+            held: list[EventSchema] = []
+            while (chunk := await inbox.get()) is not None:
+                if agent.cacheable:
+                    await outbox.put(await _run_window(agent, chunk))
+                else:
+                    # Batch-level agents (deduplication) need every event at once
+                    held.extend(chunk)
+            if held:
+                await outbox.put(await _run_window(agent, held))
+            await outbox.put(None)
+
+        async def _drain() -> None:
+            while (chunk := await queues[-1].get()) is not None:
+                enriched.extend(chunk)
+
+        await asyncio.gather(
+            _feed(),
+            *(_stage(k, agent) for k, agent in enumerate(self._agent_chain)),
+            _drain(),
+        )
+
+        agent_results: list[AgentResult] = []
+        total_tokens = TokenUsage()
         errors_by_agent: dict[str, list[str]] = {}
         prompt_versions_used: dict[str, str] = {}
 
         for agent in self._agent_chain:
-            task = AgentTask(
-                agent_name=agent.name,
-                events=current_events,
-                target_fields=[],  # each agent knows its own target fields
-                prompt_version=prompt_version,
-            )
-            try:
-                logger.info(
-                    f"BatchEnrichmentRunner: running {agent.name} on {len(current_events)} events"
-                )
-                result = await agent.run(task)
+            errors = list(failures_by_agent[agent.name])
+            if results_by_agent[agent.name]:
+                result = _merge_results(results_by_agent[agent.name])
                 agent_results.append(result)
 
-                # Pipeline — pass enriched events to next agent
-                current_events = result.events
-
                 # Aggregate metadata
-                for k in total_tokens:
-                    total_tokens[k] += result.token_usage.get(k, 0)
-                if result.errors:
-                    errors_by_agent[agent.name] = result.errors
+                total_tokens += TokenUsage.from_dict(result.token_usage)
+                errors.extend(result.errors)
                 prompt_versions_used[agent.name] = result.prompt_version
-
-            except Exception as e:
-                msg = f"Agent '{agent.name}' raised an exception: {e}"
-                logger.error(msg, exc_info=True)
-                errors_by_agent[agent.name] = [msg]
+            if errors:
+                errors_by_agent[agent.name] = errors
 
         return EnrichmentRunResult(
-            events=current_events,
+            events=enriched,
             agent_results=agent_results,
             total_duration_seconds=time.monotonic() - start,
             total_token_usage=total_tokens,
             errors_by_agent=errors_by_agent,
             prompt_versions_used=prompt_versions_used,
+            batch_job_ids={
+                name: client.job_ids[jobs_before[name] :]
+                for name, client in self._batch_clients.items()
+                if len(client.job_ids) > jobs_before[name]
+            },
+        )
+
+    def _make_task(
+        self,
+        agent: BaseAgent,
+        events: list["EventSchema"],
+        prompt_version: str,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> AgentTask:
+        # Batch-API agents queue every LLM batch at once so they share a job
+        batched = agent.name in self._batch_clients
+        return AgentTask(
+            agent_name=agent.name,
+            events=events,
+            target_fields=[],  # each agent knows its own target fields
+            prompt_version=prompt_version,
+            max_concurrency=len(events) if batched else self._max_concurrency,
+            limiter=None if batched else limiter,
+        )
+
+    async def _run_agent(
+        self,
+        agent: BaseAgent,
+        events: list["EventSchema"],
+        prompt_version: str,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> AgentResult:
+        """
+        Run one agent, sending it each distinct event content only once.
+
+        Events are grouped by content fingerprint. Groups already in the
+        enrichment cache are served from it; the rest are sent to the agent
+        as one representative each, and the representative's changed fields
+        and confidence score are copied onto its siblings. Returned events
+        keep their input order and their own identity fields.
+        """
+        if not agent.cacheable:
+            return await agent.run(
+                self._make_task(agent, events, prompt_version, limiter)
+            )
+
+        cache = self._cache
+        version = (
+            self._resolve_prompt_version(agent, prompt_version)
+            if cache is not None
+            else prompt_version
         )
+        output = list(events)
+        # Confidence scores are keyed per event, so served and sibling events
+        # need their own entries
+        scores: dict[str, float] = {}
+        groups: dict[str, list[int]] = {}
+        for i, event in enumerate(events):
+            fingerprint = EnrichmentCache.fingerprint(event)
+            if (
+                cache is not None
+                and (delta := cache.get(agent.name, version, fingerprint)) is not None
+            ):
+                output[i] = EnrichmentCache.apply(event, delta)
+                score = cache.confidence(agent.name, version, fingerprint)
+                if score is not None:
+                    scores[_score_key(event)] = score
+            else:
+                groups.setdefault(fingerprint, []).append(i)
+
+        pending = sum(len(indices) for indices in groups.values())
+        if pending < len(events):
+            logger.info(
+                f"BatchEnrichmentRunner: {agent.name} cache served "
+                f"{len(events) - pending}/{len(events)} events"
+            )
+        if len(groups) < pending:
+            logger.info(
+                f"BatchEnrichmentRunner: {agent.name} grouped {pending} events "
+                f"into {len(groups)} distinct inputs"
+            )
+
+        if not groups:
+            return AgentResult(
+                agent_name=agent.name,
+                prompt_name=agent.prompt_name,
+                prompt_version=version,
+                events=output,
+                confidence_scores=scores,
+            )
+
+        if self._length_bucketing(agent):
+            groups = dict(
+                sorted(
+                    groups.items(), key=lambda item: _prompt_length(events[item[1][0]])
+                )
+            )
+
+        # Agents mutate their inputs in place, so each gets a private
+        # (projected) copy and only the changed fields are merged back.
+        dropped = self._dropped_fields(agent, type(events[0]))
+        representatives = [events[indices[0]] for indices in groups.values()]
+        result = await agent.run(
+            self._make_task(
+                agent,
+                [_project(e, dropped) for e in representatives],
+                prompt_version,
+                limiter,
+            )
+        )
+
+        # Partial failures can't be attributed to single events, so only
+        # fully successful runs populate the cache.
+        store = (
+            cache is not None
+            and result.prompt_version != "skipped"
+            and not result.errors
+        )
+        for (fingerprint, indices), before, after in zip(
+            groups.items(), representatives, result.events, strict=True
+        ):
+            delta = _view_delta(before, after, dropped)
+            if delta:
+                for i in indices:
+                    output[i] = EnrichmentCache.apply(events[i], delta)
+            score = result.confidence_scores.get(_score_key(before))
+            if score is not None:
+                for i in indices:
+                    scores[_score_key(events[i])] = score
+            if store and cache is not None:
+                cache.put(agent.name, version, fingerprint, delta, score)
+
+        result.events = output
+        result.confidence_scores = {**result.confidence_scores, **scores}
+        return result
+
+    def _dropped_fields(
+        self, agent: BaseAgent, model_cls: type["BaseModel"]
+    ) -> frozenset[str]:
+        """Optional fields outside the agent's configured `required_fields`."""
+        agent_cfg = self._agents_config.get("agents", {}).get(agent.name, {})
+        required = agent_cfg.get("required_fields")
+        if not required:
+            return frozenset()
+        return frozenset(
+            name
+            for name, info in model_cls.model_fields.items()
+            if not info.is_required() and name not in required
+        )
+
+    def _length_bucketing(self, agent: BaseAgent) -> bool:
+        agent_cfg = self._agents_config.get("agents", {}).get(agent.name, {})
+        return bool(agent_cfg.get("length_bucketing", True))
+
+    @staticmethod
+    def _resolve_prompt_version(agent: BaseAgent, prompt_version: str) -> str:
+        """Resolve "active" to a concrete version so prompt bumps invalidate the cache."""
+        if prompt_version != "active":
+            return prompt_version
+        from src.agents.registry.prompt_registry import get_prompt_registry
+
+        try:
+            return get_prompt_registry().get_active_version(agent.prompt_name)
+        except FileNotFoundError:
+            return prompt_version
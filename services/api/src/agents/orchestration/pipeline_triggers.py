@@ -12,11 +12,21 @@ Usage without DB (notebook / testing):
 Usage with DB persistence (production):
     trigger = PostIngestionTrigger(agents_config)
     result = await trigger.on_pipeline_complete(pipeline_result, db_connection=conn)
+
+Several sources finishing together (enriched concurrently):
+    results = await trigger.on_many([gyg_result, eventbrite_result])
 """
 
+import asyncio
+import copy
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import yaml
+
 if TYPE_CHECKING:
     from src.ingestion.pipelines.base_pipeline import PipelineExecutionResult
 
@@ -27,6 +37,10 @@ from src.agents.orchestration.agent_runner import (
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_AGENTS_CONFIG = str(
+    Path(__file__).parent.parent.parent / "configs" / "agents.yaml"
+)
+
 
 class PostIngestionTrigger:
     """
@@ -50,6 +64,7 @@ class PostIngestionTrigger:
         pipeline_result: "PipelineExecutionResult",
         prompt_version: str = "active",
         db_connection=None,
+        limiter: asyncio.Semaphore | None = None,
     ) -> EnrichmentRunResult:
         """
         Run enrichment on all successfully ingested events, and optionally
@@ -61,6 +76,7 @@ class PostIngestionTrigger:
             db_connection:   Optional psycopg2 connection. When provided, the
                              enriched events are persisted via EventDataWriter.
                              The caller is responsible for closing the connection.
+            limiter:         Semaphore shared with other concurrent runs (see on_many)
 
         Returns:
             EnrichmentRunResult with enriched events and per-agent metadata
@@ -82,12 +98,14 @@ class PostIngestionTrigger:
             f"PostIngestionTrigger: starting enrichment of {len(events)} events from '{source}'"
         )
 
-        result = await self._runner.run(events=events, prompt_version=prompt_version)
+        result = await self._runner.run(
+            events=events, prompt_version=prompt_version, limiter=limiter
+        )
 
         logger.info(
             f"PostIngestionTrigger: enrichment complete — "
             f"{len(result.events)} events, "
-            f"{result.total_token_usage.get('total', 0)} tokens, "
+            f"{result.total_token_usage.total} tokens, "
             f"{result.total_duration_seconds:.1f}s, "
             f"{result.total_errors} errors"
         )
@@ -104,11 +122,53 @@ class PostIngestionTrigger:
 
         return result
 
+    async def on_many(
+        self,
+        pipeline_results: list["PipelineExecutionResult"],
+        prompt_version: str = "active",
+        db_connection=None,
+    ) -> list[EnrichmentRunResult]:
+        """
+        Enrich several pipeline results concurrently.
+
+        Each source runs through the shared runner (and its enrichment cache)
+        in its own task, so total time tracks the slowest source rather than
+        the sum. All sources share one limiter, so LLM batches in flight
+        across every source stay within global.max_concurrency.
+
+        Args:
+            pipeline_results: Results from several BasePipeline.execute() calls
+            prompt_version:   "active" or explicit version string
+            db_connection:    Optional psycopg2 connection, passed to each
+                              on_pipeline_complete() call
+
+        Returns:
+            One EnrichmentRunResult per input, in the same order
+        """
+        max_concurrency = int(
+            self._agents_config.get("global", {}).get("max_concurrency", 1)
+        )
+        limiter = asyncio.Semaphore(max(max_concurrency, 1))
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self.on_pipeline_complete(
+                        result, prompt_version, db_connection, limiter
+                    )
+                )
+                for result in pipeline_results
+            ]
+        return [task.result() for task in tasks]
+
 
 def load_agents_config(config_path: str | None = None) -> dict[str, Any]:
     """
     Load agents.yaml config from disk.
 
+    Parsed configs are cached per (path, mtime), so repeated calls only stat
+    the file; edits on disk are picked up on the next call. Each call returns
+    its own copy, so callers may mutate the result freely.
+
     Args:
         config_path: Explicit path to agents.yaml. Defaults to
                      services/api/src/configs/agents.yaml relative to this file.
@@ -116,21 +176,22 @@ def load_agents_config(config_path: str | None = None) -> dict[str, Any]:
     Returns:
         Parsed config dict
     """
-    from pathlib import Path
-
-    import yaml
-
     if config_path is None:
-        config_path = str(
-            Path(__file__).parent.parent.parent / "configs" / "agents.yaml"
-        )
+        config_path = _DEFAULT_AGENTS_CONFIG
 
     try:
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+        config = _parse_agents_config(config_path, os.stat(config_path).st_mtime_ns)
     except FileNotFoundError:
         logger.warning(f"agents.yaml not found at {config_path}, using defaults")
         return {}
     except Exception as e:
         logger.error(f"Failed to load agents.yaml: {e}")
         return {}
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=16)
+def _parse_agents_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path) as f:
+        return yaml.load(f, Loader=loader) or {}
@@ -0,0 +1,60 @@
+"""
+Optional OpenTelemetry instrumentation for the enrichment chain.
+
+When opentelemetry-api is installed, each agent window runs inside an
+`agent.<name>` span and records:
+  llm.tokens      — counter, {token}, attributes: agent, prompt_version, token.type
+  agent.duration  — histogram, ms, attributes: agent, prompt_version
+
+Without an SDK/exporter configured the API calls are no-ops; without the
+package installed every helper here degrades to a no-op as well.
+"""
+
+import logging
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.agents.base.task import AgentResult
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import metrics, trace
+
+    _tracer = trace.get_tracer("src.agents.enrichment")
+    _meter = metrics.get_meter("enrichment")
+    _tokens = _meter.create_counter(
+        "llm.tokens", unit="{token}", description="LLM tokens used by enrichment agents"
+    )
+    _duration = _meter.create_histogram(
+        "agent.duration", unit="ms", description="Wall time per agent window"
+    )
+except ImportError:
+    _tracer = None  # type: ignore[assignment]
+    _tokens = None  # type: ignore[assignment]
+    _duration = None  # type: ignore[assignment]
+
+
+def agent_span(agent_name: str, event_count: int) -> AbstractContextManager[Any]:
+    """Return a span context for one agent window (nullcontext without OTel)."""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(
+        f"agent.{agent_name}",
+        attributes={"agent.name": agent_name, "event.count": event_count},
+    )
+
+
+def record_agent_result(
+    agent_name: str, result: "AgentResult", duration_seconds: float
+) -> None:
+    """Record token usage and duration for one agent window."""
+    if _tokens is None or _duration is None:
+        return
+    attributes = {"agent": agent_name, "prompt_version": result.prompt_version}
+    for token_type in ("prompt_tokens", "completion_tokens"):
+        count = result.token_usage.get(token_type, 0)
+        if count:
+            _tokens.add(count, {**attributes, "token.type": token_type})
+    _duration.record(duration_seconds * 1000.0, attributes)
@@ -4,7 +4,9 @@ Agent registry — maps agent name → class for the orchestrator.
 Used by BatchEnrichmentRunner to instantiate agents from agents.yaml config.
 """
 
+import importlib
 import logging
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -23,11 +25,26 @@ _AGENT_MAP: dict[str, str] = {
 }
 
 
+@cache
+def _resolve_class(agent_name: str) -> type:
+    """Import and return the agent class for a registered name (memoized)."""
+    class_path = _AGENT_MAP.get(agent_name)
+    if not class_path:
+        raise ValueError(
+            f"Unknown agent: '{agent_name}'. Add it to AgentRegistry._AGENT_MAP"
+        )
+
+    module_path, class_name = class_path.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
 class AgentRegistry:
     """
     Instantiates agents by name using agents.yaml config.
 
-    Agents are created lazily on first request and reused.
+    Agents are created lazily on first request and reused; agent classes are
+    imported once per process and shared across registry instances.
     """
 
     def __init__(self):
@@ -48,21 +65,42 @@ class AgentRegistry:
         if agent_name in self._instances:
             return self._instances[agent_name]
 
-        class_path = _AGENT_MAP.get(agent_name)
-        if not class_path:
-            raise ValueError(
-                f"Unknown agent: '{agent_name}'. Add it to AgentRegistry._AGENT_MAP"
-            )
-
-        module_path, class_name = class_path.rsplit(".", 1)
-        import importlib
-
-        module = importlib.import_module(module_path)
-        cls = getattr(module, class_name)
+        cls = _resolve_class(agent_name)
         instance = cls(config=agent_config)
         self._instances[agent_name] = instance
         return instance
 
+    def warm(
+        self, agents_config: dict[str, Any], names: list[str] | None = None
+    ) -> None:
+        """
+        Instantiate enabled agents and pre-compile their active prompts.
+
+        Moves the one-off costs of the first enrichment call (class imports,
+        client setup, manifest/template YAML loads and Jinja2 compilation)
+        to startup. A missing optional dependency or prompt file is logged as
+        a warning and left for get()/render() to surface on first real use;
+        any other error (bad config, broken template) is raised.
+
+        Args:
+            agents_config: Full agents.yaml config dict
+            names: Agents to warm (default: every registered agent)
+        """
+        from src.agents.registry.prompt_registry import get_prompt_registry
+
+        prompts = get_prompt_registry()
+        agents_section = agents_config.get("agents", {})
+        for agent_name in names if names is not None else _AGENT_MAP:
+            agent_config = agents_section.get(agent_name, {})
+            if not agent_config.get("enabled", True):
+                continue
+            try:
+                agent = self.get(agent_name, agent_config)
+                if agent.prompt_name:
+                    prompts.preload(agent.prompt_name)
+            except (ImportError, FileNotFoundError) as e:
+                logger.warning(f"AgentRegistry: could not warm '{agent_name}': {e}")
+
     def list_registered(self) -> list[str]:
         """Return all registered agent names."""
         return list(_AGENT_MAP.keys())
@@ -5,6 +5,9 @@ Prompts live in src/agents/prompts/{name}/:
   manifest.yaml   — active_version + per-version metadata
   v1.yaml         — prompt content (system_prompt + user_prompt, Jinja2 templates)
 
+Manifests and templates are cached and re-read only when the file's mtime
+changes, so editing a prompt in place takes effect without a restart.
+
 Usage:
     registry = PromptRegistry()
     system, user = registry.render("feature_alignment", variables={"title": "Techno Night"})
@@ -17,36 +20,68 @@ from typing import Any
 
 import yaml
 
+try:
+    from jinja2 import Environment, Undefined
+
+    class SilentUndefined(Undefined):
+        """Render missing template variables as `[name]` instead of raising."""
+
+        def __str__(self) -> str:
+            """Render the placeholder as `[name]`."""
+            return f"[{self._undefined_name}]"
+
+except ImportError:
+    # Fallback: simple str.replace substitution
+    Environment = None  # type: ignore[misc, assignment]
+    SilentUndefined = None  # type: ignore[misc, assignment]
+
 logger = logging.getLogger(__name__)
 
 _PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
+# libyaml-backed loader when available (several times faster than pure Python)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _mtime_ns(path: Path, kind: str) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt {kind} not found: {path}") from None
+
 
 class PromptRegistry:
     """
     Loads prompt manifests + renders Jinja2 templates for enrichment agents.
 
-    Thread-safe: manifests are loaded once and cached.
+    Thread-safe: manifests are cached and each template is compiled once per
+    name/version, then reused for every render until its file changes.
     """
 
     def __init__(self, prompts_dir: Path | None = None):
         """Initialize the PromptRegistry, optionally pointing to a custom prompts directory."""
         self._dir = prompts_dir or _PROMPTS_DIR
         self._manifests: dict[str, dict[str, Any]] = {}
-        self._templates: dict[str, dict[str, Any]] = {}  # key = "name/version"
+        # key = "name/version" → {"raw": yaml dict, "system"/"user"/"batch_user": compiled}
+        self._templates: dict[str, dict[str, Any]] = {}
+        self._mtimes: dict[Path, int] = {}  # file → st_mtime_ns when last loaded
+        self._env = (
+            Environment(undefined=SilentUndefined, autoescape=False, cache_size=400)
+            if Environment is not None
+            else None
+        )
 
     def _load_manifest(self, prompt_name: str) -> dict[str, Any]:
-        if prompt_name in self._manifests:
-            return self._manifests[prompt_name]
-
         manifest_path = self._dir / prompt_name / "manifest.yaml"
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Prompt manifest not found: {manifest_path}")
+        mtime = _mtime_ns(manifest_path, "manifest")
+        if prompt_name in self._manifests and self._mtimes.get(manifest_path) == mtime:
+            return self._manifests[prompt_name]
 
         with manifest_path.open() as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YAML_LOADER)
 
         self._manifests[prompt_name] = manifest
+        self._mtimes[manifest_path] = mtime
         return manifest
 
     def _resolve_version(self, prompt_name: str, version: str) -> str:
@@ -58,17 +93,27 @@ class PromptRegistry:
 
     def _load_template(self, prompt_name: str, version: str) -> dict[str, Any]:
         cache_key = f"{prompt_name}/{version}"
-        if cache_key in self._templates:
-            return self._templates[cache_key]
-
         template_path = self._dir / prompt_name / f"{version}.yaml"
-        if not template_path.exists():
-            raise FileNotFoundError(f"Prompt template not found: {template_path}")
+        mtime = _mtime_ns(template_path, "template")
+        if cache_key in self._templates and self._mtimes.get(template_path) == mtime:
+            return self._templates[cache_key]
 
         with template_path.open() as f:
-            template = yaml.safe_load(f)
+            template_data = yaml.load(f, Loader=_YAML_LOADER)
+
+        user_raw = template_data.get("user_prompt", "")
+        sources = {
+            "system": template_data.get("system_prompt", ""),
+            "user": user_raw,
+            "batch_user": template_data.get("batch_user_prompt", user_raw),
+        }
+        template = {"raw": template_data, "sources": sources}
+        if self._env is not None:
+            for part, source in sources.items():
+                template[part] = self._env.from_string(source)
 
         self._templates[cache_key] = template
+        self._mtimes[template_path] = mtime
         return template
 
     def render(
@@ -95,42 +140,19 @@ class PromptRegistry:
         Returns:
             Tuple of (system_prompt, user_prompt) as rendered strings
         """
-        try:
-            from jinja2 import Template, Undefined
-
-            class SilentUndefined(Undefined):
-                def __str__(self) -> str:
-                    return f"[{self._undefined_name}]"
-
-        except ImportError:
-            # Fallback: simple str.replace substitution
-            Template = None  # type: ignore[misc, assignment]
-            SilentUndefined = None  # type: ignore[misc, assignment]
-
         resolved_version = self._resolve_version(prompt_name, version)
-        template_data = self._load_template(prompt_name, resolved_version)
+        template = self._load_template(prompt_name, resolved_version)
 
         variables = variables or {}
-        system_raw = template_data.get("system_prompt", "")
+        user_part = "batch_user" if batch else "user"
 
-        if batch:
-            user_raw = template_data.get(
-                "batch_user_prompt", template_data.get("user_prompt", "")
-            )
-        else:
-            user_raw = template_data.get("user_prompt", "")
-
-        if Template is not None:
-            system_rendered = Template(system_raw, undefined=SilentUndefined).render(
-                **variables
-            )
-            user_rendered = Template(user_raw, undefined=SilentUndefined).render(
-                **variables
-            )
+        if self._env is not None:
+            system_rendered = template["system"].render(**variables)
+            user_rendered = template[user_part].render(**variables)
         else:
             # Simple substitution fallback
-            system_rendered = system_raw
-            user_rendered = user_raw
+            system_rendered = template["sources"]["system"]
+            user_rendered = template["sources"][user_part]
             for k, v in variables.items():
                 system_rendered = system_rendered.replace(f"{{{{ {k} }}}}", str(v))
                 user_rendered = user_rendered.replace(f"{{{{ {k} }}}}", str(v))
@@ -149,6 +171,17 @@ class PromptRegistry:
 
         return system_rendered, user_rendered
 
+    def preload(self, prompt_name: str, version: str = "active") -> str:
+        """
+        Load and compile a prompt ahead of its first render.
+
+        Returns:
+            The resolved version string
+        """
+        resolved_version = self._resolve_version(prompt_name, version)
+        self._load_template(prompt_name, resolved_version)
+        return resolved_version
+
     def get_active_version(self, prompt_name: str) -> str:
         """Return the active version string for a prompt."""
         return self._resolve_version(prompt_name, "active")
@@ -1,6 +1,9 @@
 """Schema validation and confidence scoring utilities for enrichment agents."""
 
-from src.agents.validation.confidence import compute_confidence_score
+from src.agents.validation.confidence import (
+    compute_confidence_batch,
+    compute_confidence_score,
+)
 from src.agents.validation.schema_validator import SchemaValidator
 
-__all__ = ["SchemaValidator", "compute_confidence_score"]
+__all__ = ["SchemaValidator", "compute_confidence_batch", "compute_confidence_score"]
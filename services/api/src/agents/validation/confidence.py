@@ -6,19 +6,21 @@ Events below the threshold (agents.yaml: global.confidence_threshold) are
 flagged for human review.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from src.schemas.event import EventSchema
 
 # Fields that contribute to enrichment confidence
-_ENRICHMENT_FIELDS = [
+_ENRICHMENT_FIELDS = (
     "event_type",
     "tags",
     "format",
-]
+)
 
-_TAXONOMY_FIELDS = [
+_TAXONOMY_FIELDS = (
     "primary_category",
     "subcategory",
     "energy_level",
@@ -32,7 +34,7 @@ _TAXONOMY_FIELDS = [
     "risk_level",
     "age_accessibility",
     "repeatability",
-]
+)
 
 
 def compute_confidence_score(
@@ -53,16 +55,14 @@ def compute_confidence_score(
     Returns:
         Confidence score in [0.0, 1.0]
     """
-    event_dict = event.model_dump()
-
     # Completeness score from event-level fields
-    filled = sum(1 for f in _ENRICHMENT_FIELDS if event_dict.get(f))
+    filled = sum(1 for f in _ENRICHMENT_FIELDS if getattr(event, f, None))
     completeness_score = filled / len(_ENRICHMENT_FIELDS)
 
     # Taxonomy field completeness
-    if event.taxonomy_dimension:
-        tax_dict: dict[str, Any] = event.taxonomy_dimension.model_dump()
-        tax_filled = sum(1 for f in _TAXONOMY_FIELDS if tax_dict.get(f))
+    taxonomy = event.taxonomy_dimension
+    if taxonomy:
+        tax_filled = sum(1 for f in _TAXONOMY_FIELDS if getattr(taxonomy, f, None))
         taxonomy_completeness = tax_filled / len(_TAXONOMY_FIELDS)
     else:
         taxonomy_completeness = 0.0
@@ -79,6 +79,46 @@ def compute_confidence_score(
     return round(overall, 4)
 
 
+def compute_confidence_batch(
+    events: list["EventSchema"],
+    agent_scores: dict[str, dict[str, float]] | None = None,
+) -> np.ndarray:
+    """
+    Vectorized compute_confidence_score over a batch of events.
+
+    Field presence is collected in one pass over the events; the scoring
+    arithmetic then runs as whole-array NumPy operations.
+
+    Args:
+        events: List of enriched events
+        agent_scores: Optional dict mapping source_event_id → per-agent scores
+
+    Returns:
+        Array of confidence scores in [0.0, 1.0], aligned with `events`
+    """
+    agent_scores = agent_scores or {}
+    n = len(events)
+    enrichment = np.zeros((n, len(_ENRICHMENT_FIELDS)), dtype=bool)
+    taxonomy_presence = np.zeros((n, len(_TAXONOMY_FIELDS)), dtype=bool)
+    avg_agent_score = np.full(n, np.nan)
+
+    for i, event in enumerate(events):
+        enrichment[i] = [bool(getattr(event, f, None)) for f in _ENRICHMENT_FIELDS]
+        taxonomy = event.taxonomy_dimension
+        if taxonomy:
+            taxonomy_presence[i] = [
+                bool(getattr(taxonomy, f, None)) for f in _TAXONOMY_FIELDS
+            ]
+        scores = agent_scores.get(str(event.source.source_event_id))
+        if scores:
+            avg_agent_score[i] = sum(scores.values()) / len(scores)
+
+    field_score = (enrichment.mean(axis=1) + taxonomy_presence.mean(axis=1)) / 2.0
+    # Fall back to the field score for events without agent scores
+    avg_agent_score = np.where(np.isnan(avg_agent_score), field_score, avg_agent_score)
+    return np.round(0.6 * field_score + 0.4 * avg_agent_score, 4)
+
+
 def flag_low_confidence(
     events: list["EventSchema"],
     threshold: float = 0.6,
@@ -95,11 +135,7 @@ def flag_low_confidence(
     Returns:
         List of (event, score) tuples for events below threshold
     """
-    flagged = []
-    for event in events:
-        event_id = str(event.source.source_event_id)
-        scores = (agent_scores or {}).get(event_id)
-        score = compute_confidence_score(event, scores)
-        if score < threshold:
-            flagged.append((event, score))
-    return flagged
+    if not events:
+        return []
+    scores = compute_confidence_batch(events, agent_scores)
+    return [(events[i], float(scores[i])) for i in np.flatnonzero(scores < threshold)]
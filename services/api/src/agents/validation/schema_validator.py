@@ -5,8 +5,9 @@ Validates EventSchema fields against data contract constraints and enum sets.
 Prevents hallucinated writes from entering the dataset.
 """
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.schemas.event import EventSchema
@@ -25,6 +26,20 @@ _VALID_REPEATABILITIES = {"high", "medium", "low"}
 _VALID_COST_LEVELS = {"free", "low", "medium", "high"}
 _VALID_TIME_SCALES = {"short", "long", "recurring"}
 
+# (taxonomy attribute, allowed values) — checked in order by validate_event
+_TAXONOMY_ENUM_CHECKS: tuple[tuple[str, frozenset[str]], ...] = (
+    ("energy_level", frozenset(_VALID_ENERGY_LEVELS)),
+    ("social_intensity", frozenset(_VALID_SOCIAL_INTENSITIES)),
+    ("cognitive_load", frozenset(_VALID_COGNITIVE_LOADS)),
+    ("physical_involvement", frozenset(_VALID_PHYSICAL_INVOLVEMENTS)),
+    ("environment", frozenset(_VALID_ENVIRONMENTS)),
+    ("risk_level", frozenset(_VALID_RISK_LEVELS)),
+    ("age_accessibility", frozenset(_VALID_AGE_ACCESSIBILITIES)),
+    ("repeatability", frozenset(_VALID_REPEATABILITIES)),
+    ("cost_level", frozenset(_VALID_COST_LEVELS)),
+    ("time_scale", frozenset(_VALID_TIME_SCALES)),
+)
+
 
 class SchemaValidator:
     """
@@ -43,53 +58,14 @@ class SchemaValidator:
         """
         errors: list[str] = []
 
-        if event.taxonomy:
-            tax = event.taxonomy
-            self._check_enum(
-                "taxonomy.energy_level", tax.energy_level, _VALID_ENERGY_LEVELS, errors
-            )
-            self._check_enum(
-                "taxonomy.social_intensity",
-                tax.social_intensity,
-                _VALID_SOCIAL_INTENSITIES,
-                errors,
-            )
-            self._check_enum(
-                "taxonomy.cognitive_load",
-                tax.cognitive_load,
-                _VALID_COGNITIVE_LOADS,
-                errors,
-            )
-            self._check_enum(
-                "taxonomy.physical_involvement",
-                tax.physical_involvement,
-                _VALID_PHYSICAL_INVOLVEMENTS,
-                errors,
-            )
-            self._check_enum(
-                "taxonomy.environment", tax.environment, _VALID_ENVIRONMENTS, errors
-            )
-            self._check_enum(
-                "taxonomy.risk_level", tax.risk_level, _VALID_RISK_LEVELS, errors
-            )
-            self._check_enum(
-                "taxonomy.age_accessibility",
-                tax.age_accessibility,
-                _VALID_AGE_ACCESSIBILITIES,
-                errors,
-            )
-            self._check_enum(
-                "taxonomy.repeatability",
-                tax.repeatability,
-                _VALID_REPEATABILITIES,
-                errors,
-            )
-            self._check_enum(
-                "taxonomy.cost_level", tax.cost_level, _VALID_COST_LEVELS, errors
-            )
-            self._check_enum(
-                "taxonomy.time_scale", tax.time_scale, _VALID_TIME_SCALES, errors
-            )
+        tax = event.taxonomy
+        if tax:
+            for attr, valid_values in _TAXONOMY_ENUM_CHECKS:
+                value = getattr(tax, attr)
+                if value is not None and value not in valid_values:
+                    errors.append(
+                        f"taxonomy.{attr}='{value}' not in {sorted(valid_values)}"
+                    )
 
             # Validate emotional_output is a list of non-empty strings
             if tax.emotional_output is not None:
@@ -122,12 +98,20 @@ class SchemaValidator:
                 results[str(event.source_event_id)] = event_errors
         return results
 
-    @staticmethod
-    def _check_enum(
-        field_name: str,
-        value: Any,
-        valid_values: set[str],
-        errors: list[str],
-    ) -> None:
-        if value is not None and value not in valid_values:
-            errors.append(f"{field_name}='{value}' not in {sorted(valid_values)}")
+    async def validate_batch_async(
+        self, events: list["EventSchema"], chunk_size: int = 512
+    ) -> dict[str, list[str]]:
+        """
+        Validate a batch off the event loop, one worker thread per chunk.
+
+        Keeps the loop free for in-flight LLM calls while large batches are
+        checked. The validator holds no state, so chunks run independently.
+
+        Returns:
+            Dict mapping source_event_id → list of validation errors
+        """
+        chunks = [events[i : i + chunk_size] for i in range(0, len(events), chunk_size)]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.validate_batch, chunk) for chunk in chunks)
+        )
+        return {k: v for chunk_result in results for k, v in chunk_result.items()}
@@ -1,5 +1,6 @@
 """Configuration loader for the event intelligence platform."""
 
+import re
 from functools import lru_cache
 from pathlib import Path
 
@@ -9,6 +10,9 @@ from src.configs.settings import get_settings
 
 settings = get_settings()
 
+# ${NAME} placeholders in YAML configs, filled from Settings
+_PLACEHOLDER_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
 
 class Config:
     """Configuration for the event intelligence platform."""
@@ -31,18 +35,22 @@ class Config:
         with open(cls.INGESTION_CONFIG_PATH, encoding="utf-8") as f:
             content = f.read()
 
-            # Substitute environment variables from settings
-            # This handles placeholders like ${DATABASE_URL} in the YAML
-            for key, value in settings.model_dump().items():
-                placeholder = f"${{{key}}}"
-                if placeholder in content:
-                    # Handle SecretStr
-                    val_str = (
-                        value.get_secret_value()
-                        if hasattr(value, "get_secret_value")
-                        else str(value)
-                    )
-                    content = content.replace(placeholder, val_str)
+            # Substitute environment variables from settings in one pass
+            # This handles placeholders like ${DATABASE_URL} in the YAML;
+            # unknown placeholders are left untouched.
+            settings_map = settings.model_dump()
+
+            def _substitute(match: re.Match[str]) -> str:
+                key = match.group(1)
+                if key not in settings_map:
+                    return match.group(0)
+                value = settings_map[key]
+                # Handle SecretStr
+                if hasattr(value, "get_secret_value"):
+                    return value.get_secret_value()
+                return str(value)
+
+            content = _PLACEHOLDER_RE.sub(_substitute, content)
 
             return yaml.safe_load(content)
 
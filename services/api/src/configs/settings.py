@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING, Self
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, PrivateAttr, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import make_url
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import URL
+
+# services/api — resolved once at import and shared by BASE_DIR and env_file
+_BASE_DIR = Path(__file__).resolve().parents[2]
 
 
 class Settings(BaseSettings):
@@ -39,6 +45,21 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     DATABASE_URL: str = Field(..., min_length=1)
 
+    _parsed_url: URL = PrivateAttr()
+
+    @model_validator(mode="after")
+    def parse_database_url(self) -> Self:
+        """Parse DATABASE_URL once, so a malformed URL fails at startup."""
+        # Imported here so importing this module does not pull in sqlalchemy
+        from sqlalchemy import make_url
+        from sqlalchemy.exc import ArgumentError
+
+        try:
+            self._parsed_url = make_url(self.DATABASE_URL)
+        except (ArgumentError, ValueError):
+            raise ValueError("DATABASE_URL is not a valid database URL") from None
+        return self
+
     # -------------------------------------------------------------------------
     # SOURCE API KEYS
     # -------------------------------------------------------------------------
@@ -72,7 +93,7 @@ class Settings(BaseSettings):
     # PATHS
     # -------------------------------------------------------------------------
     # BASE_DIR points to services/api
-    BASE_DIR: Path = Path(__file__).resolve().parents[2]
+    BASE_DIR: Path = _BASE_DIR
 
     TAXONOMY_DATA_PATH: Path = (
         BASE_DIR / "src" / "assets" / "human_experience_taxonomy_master.json"
@@ -84,24 +105,31 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     model_config = SettingsConfigDict(
         # Look for .env in the services/api directory
-        env_file=str(Path(__file__).resolve().parents[2] / ".env"),
+        env_file=str(_BASE_DIR / ".env"),
         env_file_encoding="utf-8",
         # Allow extra fields in .env but ignore them in the model
         extra="ignore",
     )
 
-    def get_psycopg2_params(self) -> dict:
+    @property
+    def parsed_url(self) -> URL:
+        """DATABASE_URL as the sqlalchemy URL parsed during validation."""
+        return self._parsed_url
+
+    @cached_property
+    def psycopg2_params(self) -> dict:
         """
-        Parse DATABASE_URL into psycopg2-compatible connection parameters.
+        DATABASE_URL parsed into psycopg2-compatible connection parameters.
 
-        Uses sqlalchemy.make_url for robust parsing of complex connection strings.
+        Built from parsed_url (sqlalchemy.make_url, which decodes
+        percent-encoded credentials); computed once per Settings instance.
 
         Returns
         -------
         dict
             psycopg2 connection arguments (host, port, dbname, user, password).
         """
-        url = make_url(self.DATABASE_URL)
+        url = self.parsed_url
         return {
             "host": url.host,
             "port": url.port,
@@ -110,12 +138,27 @@ class Settings(BaseSettings):
             "password": url.password,
         }
 
+    def get_psycopg2_params(self) -> dict:
+        """
+        Return psycopg2 connection parameters (a copy of psycopg2_params).
 
-@lru_cache
+        Returns
+        -------
+        dict
+            psycopg2 connection arguments (host, port, dbname, user, password).
+        """
+        return dict(self.psycopg2_params)
+
+
+@cache
 def get_settings() -> Settings:
     """
     Get cached application settings.
 
+    The environment and .env file are read once per process on first call;
+    src.main calls this before building the app so a pre-forking server
+    parses them in the parent and workers inherit the result.
+
     Returns
     -------
     Settings
@@ -10,16 +10,38 @@ Usage:
 
     # For API sources
     adapter = APIAdapter(config)
-    raw_data = adapter.fetch(city="barcelona")
+    raw_data = await adapter.fetch(city="barcelona")
 
     # For scraper sources
     adapter = ScraperAdapter(scraper_config)
-    raw_data = adapter.fetch(max_pages=2)
+    raw_data = await adapter.fetch(max_pages=2)
 """
 
-from .api_adapter import APIAdapter
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base_adapter import BaseSourceAdapter, FetchResult, SourceType
-from .scraper_adapter import ScraperAdapter
+
+if TYPE_CHECKING:
+    from .api_adapter import APIAdapter
+    from .scraper_adapter import ScraperAdapter
+
+# Adapter classes load on first access (PEP 562) so importing the package for
+# one source type doesn't pull in the HTTP client stack for the other.
+_LAZY_ADAPTERS = {
+    "APIAdapter": ".api_adapter",
+    "ScraperAdapter": ".scraper_adapter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseSourceAdapter",
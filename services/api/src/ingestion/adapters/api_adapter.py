@@ -5,19 +5,72 @@ Adapter for fetching data from API-based sources (REST, GraphQL).
 """
 
 import asyncio
+import json
 import logging
+import random
+import time
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, Literal
+from urllib.parse import urlparse
 
 import httpx
 
 from .base_adapter import AdapterConfig, BaseSourceAdapter, FetchResult, SourceType
+from .rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401  — enables httpx HTTP/2 support
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Connection pool per shared client: keep-alive connections are reused across
+# pages, retries and adapters so TLS handshakes amortize over a whole run.
+_CLIENT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "application/json",
+}
+
+# Shared clients keyed by (host, headers, connect retries), each with the event
+# loop it was created on — httpx connections can't be reused across loops.
+# They outlive adapter.close(); processes release them with
+# close_shared_clients() (FastAPI shutdown, PipelineOrchestrator runs).
+_CLIENTS: dict[
+    tuple[str, frozenset[tuple[str, str]], int],
+    tuple[httpx.AsyncClient, asyncio.AbstractEventLoop | None],
+] = {}
+
+# Clients replaced after an event-loop change, still being closed
+_CLOSING: set[asyncio.Task] = set()
+
+# Failures the transport already retried (AsyncHTTPTransport(retries=N))
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Longest wait between retries, for both the backoff and Retry-After paths
+_MAX_RETRY_WAIT_S = 30.0
+
+# Most a response's Content-Length may preallocate; larger bodies grow past it
+_MAX_PREALLOCATE_BYTES = 8 << 20
+
+
+@dataclass(slots=True, frozen=True)
 class APIAdapterConfig(AdapterConfig):
     """Configuration for API-based adapters."""
 
@@ -29,9 +82,146 @@ class APIAdapterConfig(AdapterConfig):
     graphql_endpoint: str | None = None
     graphql_query: str | None = None
 
+    # Request settings resolved once from the fields above (see __post_init__)
+    _method: Literal["GET", "POST"] = field(init=False, repr=False, compare=False)
+    _url: str = field(init=False, repr=False, compare=False)
+    _headers: MappingProxyType[str, str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Set source type to API."""
-        self.source_type = SourceType.API
+        """Set source type to API and resolve the request settings."""
+        headers = {**_DEFAULT_HEADERS, **self.headers}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        # Frozen dataclass: derived fields are set past the __setattr__ guard
+        object.__setattr__(self, "source_type", SourceType.API)
+        object.__setattr__(self, "_method", "POST" if self.graphql_endpoint else "GET")
+        object.__setattr__(self, "_url", self.graphql_endpoint or self.base_url)
+        object.__setattr__(self, "_headers", MappingProxyType(headers))
+
+    def with_base_url(self, base_url: str) -> "APIAdapterConfig":
+        """Return a copy pointing at a new REST URL (e.g. per-area endpoint paths)."""
+        return replace(self, base_url=base_url)
+
+
+def _retry_after(error: httpx.HTTPError) -> float | None:
+    """
+    Seconds to wait from a 429/503 Retry-After header, if present.
+
+    Capped at _MAX_RETRY_WAIT_S, so a server can't park the adapter for days.
+    """
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    if error.response.status_code not in (429, 503):
+        return None
+    value = error.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        # "-0000" dates parse as naive; HTTP dates are always UTC
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), _MAX_RETRY_WAIT_S)
+
+
+def _get_shared_client(config: APIAdapterConfig) -> httpx.AsyncClient:
+    """Return the client shared by adapters with the same host and headers."""
+    # The headers themselves (not their hash) are part of the key, so adapters
+    # with different credentials can never end up sharing a client
+    key = (
+        urlparse(config._url).netloc,
+        frozenset(config._headers.items()),
+        config.max_retries,
+    )
+
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    cached = _CLIENTS.get(key)
+    if cached is not None:
+        client, owner = cached
+        if owner is loop and not client.is_closed:
+            return client
+        _discard_client(client, loop)
+
+    # Connection failures are retried inside the transport, before any bytes
+    # are sent, without going back through the adapter's rate limiter
+    transport = httpx.AsyncHTTPTransport(
+        verify=True, http2=_HTTP2, limits=_CLIENT_LIMITS, retries=config.max_retries
+    )
+    client = httpx.AsyncClient(headers=config._headers, transport=transport)
+    _CLIENTS[key] = (client, loop)
+    return client
+
+
+def _discard_client(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a shared client that is being replaced (e.g. after a loop change)."""
+    if client.is_closed:
+        return
+    if loop is None:
+        # Nothing to await it on; its sockets are released when it is collected
+        return
+    task = loop.create_task(_aclose_quietly(client))
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except (httpx.HTTPError, RuntimeError, OSError) as e:
+        # Connections from a finished loop may fail to shut down cleanly
+        logger.debug("Error closing replaced API client: %s", e)
+
+
+async def _read_json(response: httpx.Response) -> Any:
+    """
+    Decode a streamed JSON response from a single buffer.
+
+    httpx's aread() keeps every chunk and then joins them, briefly holding the
+    body twice; here chunks are copied into one buffer sized from
+    Content-Length as they arrive and released immediately. The header comes
+    from the server, so it presizes at most _MAX_PREALLOCATE_BYTES.
+    """
+    size = response.headers.get("Content-Length", "")
+    # Content-Length is the encoded size, so only trust it for identity bodies
+    if size.isdigit() and "Content-Encoding" not in response.headers:
+        body = bytearray(min(int(size), _MAX_PREALLOCATE_BYTES))
+    else:
+        body = bytearray()
+    filled = 0
+    async for chunk in response.aiter_bytes():
+        end = filled + len(chunk)
+        body[filled:end] = chunk
+        filled = end
+    del body[filled:]
+    return _json_loads(body)
+
+
+async def close_shared_clients() -> None:
+    """
+    Close every shared API client.
+
+    APIAdapter.close() leaves the shared pool open for other adapters, so
+    every process that runs API adapters must call this when it is done:
+    the FastAPI app does on shutdown and PipelineOrchestrator.run_full_ingestion
+    after its pipelines finish; scripts and notebooks that drive pipelines
+    directly should await it at the end of their run.
+    """
+    clients = [client for client, _ in _CLIENTS.values()]
+    _CLIENTS.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
 
 
 class APIAdapter(BaseSourceAdapter):
@@ -63,6 +253,7 @@ class APIAdapter(BaseSourceAdapter):
         self.response_parser = response_parser
         self._client: httpx.AsyncClient | None = None
         super().__init__(config)
+        self._limiter = AsyncRateLimiter(self.api_config.rate_limit_per_second)
 
     @property
     def api_config(self) -> APIAdapterConfig:
@@ -75,16 +266,9 @@ class APIAdapter(BaseSourceAdapter):
             raise ValueError("API adapter requires base_url or graphql_endpoint")
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                "Accept": "application/json",
-                **self.api_config.headers,
-            }
-            if self.api_config.api_key:
-                headers["Authorization"] = f"Bearer {self.api_config.api_key}"
-            self._client = httpx.AsyncClient(headers=headers, verify=True)
+        """Get the shared async HTTP client for this adapter's host."""
+        if self._client is None or self._client.is_closed:
+            self._client = _get_shared_client(self.api_config)
         return self._client
 
     async def fetch(self, **kwargs) -> FetchResult:
@@ -99,9 +283,10 @@ class APIAdapter(BaseSourceAdapter):
             FetchResult with raw data
         """
         fetch_started = datetime.now(UTC)
+        started_ns = time.perf_counter_ns()
         all_data = []
-        errors = []
-        metadata = {"pages_fetched": 0, "api_calls": 0}
+        errors: deque[str] = deque(maxlen=self.api_config.max_errors_recorded)
+        metadata = {"pages_fetched": 0, "api_calls": 0, "error_count": 0}
 
         try:
             client = self._get_client()
@@ -132,66 +317,83 @@ class APIAdapter(BaseSourceAdapter):
         except Exception as e:
             logger.error(f"API fetch failed: {e}")
             errors.append(str(e))
+            metadata["error_count"] += 1
 
+        # Monotonic duration; the end timestamp is derived from it
+        metadata["elapsed_ns"] = elapsed_ns = time.perf_counter_ns() - started_ns
         return FetchResult(
             success=len(all_data) > 0,
             source_type=SourceType.API,
             raw_data=all_data,
             total_fetched=len(all_data),
-            errors=errors,
+            errors=list(errors),
             metadata=metadata,
             fetch_started_at=fetch_started,
-            fetch_ended_at=datetime.now(UTC),
+            fetch_ended_at=fetch_started + timedelta(microseconds=elapsed_ns / 1000),
         )
 
     async def _make_request(
         self,
         client: httpx.AsyncClient,
         query_data: dict,
-        retry_count: int = 0,
     ) -> dict | None:
         """
         Make HTTP request with retry logic.
 
+        Connection failures are retried by the client's transport. Error
+        responses and timeouts are retried here up to max_retries times with
+        jittered exponential backoff (capped at 30s); on 429/503 a Retry-After
+        header takes precedence.
+
         Args:
             client: Async HTTP client
             query_data: Request body/params
-            retry_count: Current retry attempt
 
         Returns:
             Response JSON or None on failure
         """
-        url = self.api_config.graphql_endpoint or self.api_config.base_url
-
-        try:
-            # Rate limiting
-            await asyncio.sleep(1.0 / self.api_config.rate_limit_per_second)
-
-            if self.api_config.graphql_endpoint:
-                response = await client.post(
-                    url,
-                    json=query_data,
-                    timeout=self.api_config.request_timeout,
-                )
-            else:
-                response = await client.get(
-                    url,
-                    params=query_data,
-                    timeout=self.api_config.request_timeout,
-                )
-
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.HTTPError as e:
-            if retry_count < self.api_config.max_retries:
-                wait_time = 2**retry_count
-                logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+        config = self.api_config
+        max_retries = config.max_retries
+
+        for attempt in range(max_retries + 1):
+            try:
+                # Rate limiting (token bucket: no delay while under budget)
+                async with self._limiter:
+                    if config._method == "POST":
+                        response = await client.post(
+                            config._url,
+                            json=query_data,
+                            timeout=config.request_timeout,
+                        )
+                        response.raise_for_status()
+                        return _json_loads(response.content)
+
+                    # REST pages can be large: stream the body into one buffer
+                    async with client.stream(
+                        "GET",
+                        config._url,
+                        params=query_data,
+                        timeout=config.request_timeout,
+                    ) as response:
+                        response.raise_for_status()
+                        return await _read_json(response)
+
+            except _CONNECT_ERRORS as e:
+                logger.error(f"Request failed to connect: {e}")
+                break
+            except httpx.HTTPError as e:
+                if attempt == max_retries:
+                    logger.error(f"Request failed after {attempt} retries: {e}")
+                    break
+                wait_time = _retry_after(e)
+                if wait_time is None:
+                    wait_time = min(
+                        2**attempt + random.random() * 0.1, _MAX_RETRY_WAIT_S
+                    )
+                logger.warning(f"Request failed, retrying in {wait_time:.1f}s: {e}")
                 await asyncio.sleep(wait_time)
-                return await self._make_request(client, query_data, retry_count + 1)
 
-            logger.error(f"Request failed after {retry_count} retries: {e}")
-            return None
+        return None
 
     def _extract_total_available(self, response: dict, data: list) -> int:
         """
@@ -216,7 +418,10 @@ class APIAdapter(BaseSourceAdapter):
         return [response]
 
     async def close(self) -> None:
-        """Close async HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """
+        Release the HTTP client.
+
+        The client is shared with other adapters for the same host, so it stays
+        open; await close_shared_clients() once the run is over to close them.
+        """
+        self._client = None
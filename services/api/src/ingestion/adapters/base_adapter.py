@@ -39,18 +39,22 @@ class FetchResult:
 
     @property
     def duration_seconds(self) -> float:
-        """Calculate fetch duration."""
+        """Calculate fetch duration (monotonic metadata["elapsed_ns"] if set)."""
+        elapsed_ns = self.metadata.get("elapsed_ns")
+        if elapsed_ns is not None:
+            return elapsed_ns / 1e9
         if self.fetch_started_at and self.fetch_ended_at:
             return (self.fetch_ended_at - self.fetch_started_at).total_seconds()
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdapterConfig:
     """
     Base configuration for source adapters.
 
-    Extended by specific adapter types (API, Scraper).
+    Extended by specific adapter types (API, Scraper). Configs are immutable so
+    one instance can be shared safely; derive variants with dataclasses.replace.
     """
 
     source_id: str
@@ -58,6 +62,7 @@ class AdapterConfig:
     request_timeout: int = 30
     max_retries: int = 3
     rate_limit_per_second: float = 1.0
+    max_errors_recorded: int = 100  # most recent error messages kept per fetch
     custom_config: dict[str, Any] = field(default_factory=dict)
 
 
@@ -0,0 +1,61 @@
+"""
+Async token-bucket rate limiter for source adapters.
+
+Requests within the burst budget go out immediately; beyond it, each caller
+reserves the next free slot and sleeps only until that slot, so concurrent
+requests overlap up to the configured rate instead of queueing behind a
+fixed per-request delay.
+
+Usage:
+    limiter = AsyncRateLimiter(rate_per_second=2.0)
+    async with limiter:
+        response = await client.get(url)
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Self
+
+
+class AsyncRateLimiter:
+    """Token bucket refilled at `rate_per_second`, holding up to `burst` tokens."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate_per_second: Sustained request rate
+            burst: Bucket size (default: one second's worth, at least 1)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._rate = rate_per_second
+        self._capacity = burst if burst is not None else max(1.0, rate_per_second)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        # No await between reading and updating the bucket, so concurrent
+        # callers on the event loop each reserve a distinct slot without a lock.
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+    async def __aenter__(self) -> Self:
+        """Wait for a token on entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release nothing; tokens refill over time."""
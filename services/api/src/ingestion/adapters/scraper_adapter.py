@@ -5,17 +5,22 @@ Adapter for fetching and cleaning individual
 event page HTML using the scrapping service engines.
 """
 
+import asyncio
 import logging
+import pickle
+import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from .base_adapter import AdapterConfig, BaseSourceAdapter, FetchResult, SourceType
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScraperAdapterConfig(AdapterConfig):
     """Configuration for scraper-based adapters."""
 
@@ -23,6 +28,9 @@ class ScraperAdapterConfig(AdapterConfig):
     url_pattern: str = ""
     url_identifier: str = ""
     max_pages: int = 5
+    concurrency: int = 8  # listing/event pages fetched at once
+    parse_processes: int = 0  # >0: parse HTML in worker processes, not threads
+    store_raw_html: bool = False  # keep page HTML in raw_data as "_raw_html"
     timeout_s: float = 30.0
     min_delay_s: float = 2.0
     headless: bool = True
@@ -31,7 +39,7 @@ class ScraperAdapterConfig(AdapterConfig):
 
     def __post_init__(self):
         """Set source type to SCRAPER."""
-        self.source_type = SourceType.SCRAPER
+        object.__setattr__(self, "source_type", SourceType.SCRAPER)
 
 
 class ScraperAdapter(BaseSourceAdapter):
@@ -52,11 +60,18 @@ class ScraperAdapter(BaseSourceAdapter):
 
         Args:
             config: ScraperAdapterConfig with scraper settings
-            html_parser: Function to parse HTML into event dict
+            html_parser: Function to parse HTML into event dict. With
+                config.parse_processes > 0 it must be picklable (a module-level
+                function, not a lambda, closure or bound method of an object
+                holding live resources); otherwise parsing stays in threads.
         """
         self.html_parser = html_parser
         self._scraper = None
+        self._parse_pool: ProcessPoolExecutor | None = None
         super().__init__(config)
+        self._parse_in_processes = (
+            self.scraper_config.parse_processes > 0 and self._parser_is_picklable()
+        )
 
     @property
     def scraper_config(self) -> ScraperAdapterConfig:
@@ -68,6 +83,26 @@ class ScraperAdapter(BaseSourceAdapter):
         if not self.scraper_config.base_url:
             raise ValueError("Scraper adapter requires base_url")
 
+    def _parser_is_picklable(self) -> bool:
+        try:
+            pickle.dumps(self.html_parser)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.warning(
+                "html_parser can't be sent to worker processes (%s); "
+                "parsing in threads instead",
+                e,
+            )
+            return False
+        return True
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor | None:
+        """Return the parse process pool, or None to parse in the thread pool."""
+        if self._parse_in_processes and self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.scraper_config.parse_processes
+            )
+        return self._parse_pool
+
     def _get_scraper(self):
         """Get or create scraper instance."""
         if self._scraper is None:
@@ -101,23 +136,44 @@ class ScraperAdapter(BaseSourceAdapter):
                 - country_code: Country code
                 - max_pages: Max listing pages
                 - max_events: Max events to fetch
+                - concurrency: Max pages fetched at once
 
         Returns:
             FetchResult with raw data
         """
         fetch_started = datetime.now(UTC)
+        started_ns = time.perf_counter_ns()
         all_data = []
-        errors = []
+        # A degraded source can fail thousands of pages; keep only the latest
+        # messages and count the rest
+        errors: deque[str] = deque(maxlen=self.scraper_config.max_errors_recorded)
         metadata = {
             "pages_fetched": 0,
             "events_fetched": 0,
             "parse_failures": 0,
+            "error_count": 0,
         }
 
+        def record_error(message: str) -> None:
+            errors.append(message)
+            metadata["error_count"] += 1
+
         city = kwargs.get("city", self.scraper_config.city)
         country_code = kwargs.get("country_code", self.scraper_config.country_code)
         max_pages = kwargs.get("max_pages", self.scraper_config.max_pages)
         max_events = kwargs.get("max_events")
+        concurrency = kwargs.get("concurrency", self.scraper_config.concurrency)
+        loop = asyncio.get_running_loop()
+        # Pages are parsed in a worker thread (or process) as they arrive,
+        # overlapping HTML parsing with the fetches still in flight
+        parse_pool = self._get_parse_pool()
+        parse_jobs: dict[int, asyncio.Future] = {}
+
+        def _start_parse(result) -> None:
+            if self.html_parser and result.ok and result.html:
+                parse_jobs[id(result)] = loop.run_in_executor(
+                    parse_pool, self.html_parser, result.html, result.url
+                )
 
         try:
             scraper = self._get_scraper()
@@ -127,23 +183,30 @@ class ScraperAdapter(BaseSourceAdapter):
                 city=city,
                 country_code=country_code,
                 max_pages=max_pages,
+                concurrency=concurrency,
             )
 
-            # Extract event URLs
-            event_urls = []
+            # Extract event URLs, deduped in first-seen order. The set holds
+            # the same str objects as event_urls (no copies) and str caches its
+            # hash, so an exact set costs one table slot per URL.
+            event_urls: list[str] = []
+            seen: set[str] = set()
             for result in listing_results:
                 if result.ok and result.html:
-                    urls = scraper.extract_event_urls(result.html, result.url)
-                    event_urls.extend(urls)
+                    for url in scraper.extract_event_urls(result.html, result.url):
+                        if url not in seen:
+                            seen.add(url)
+                            event_urls.append(url)
                     metadata["pages_fetched"] += 1
 
-            # Dedupe URLs
-            event_urls = list(dict.fromkeys(event_urls))
-            logger.info(f"Found {len(event_urls)} unique event URLs")
+            logger.info("Found %d unique event URLs", len(event_urls))
 
             # Fetch event detail pages
             event_results = await scraper.fetch_event_pages(
-                event_urls, max_events=max_events
+                event_urls,
+                max_events=max_events,
+                concurrency=concurrency,
+                on_result=_start_parse,
             )
             metadata["events_fetched"] = len(event_results)
 
@@ -152,37 +215,56 @@ class ScraperAdapter(BaseSourceAdapter):
                 if result.ok and result.html:
                     try:
                         if self.html_parser:
-                            parsed = self.html_parser(result.html, result.url)
+                            job = parse_jobs.pop(id(result), None)
+                            if job is None:
+                                job = loop.run_in_executor(
+                                    parse_pool,
+                                    self.html_parser,
+                                    result.html,
+                                    result.url,
+                                )
+                            parsed = await job
                         else:
-                            parsed = {"_raw_html": result.html, "_url": result.url}
+                            parsed = {"_url": result.url}
 
+                        if self.scraper_config.store_raw_html:
+                            parsed["_raw_html"] = result.html
                         parsed["_source_url"] = result.url
                         parsed["_fetch_url"] = result.final_url
                         all_data.append(parsed)
                     except Exception as e:
-                        logger.warning(f"Failed to parse {result.url}: {e}")
+                        logger.warning("Failed to parse %s: %s", result.url, e)
                         metadata["parse_failures"] += 1
-                        errors.append(f"Parse error for {result.url}: {e}")
+                        record_error(f"Parse error for {result.url}: {e}")
+                    finally:
+                        # Parsed: drop the page HTML now rather than holding
+                        # every page until the whole fetch returns
+                        result.html = None
                 else:
-                    errors.append(f"Fetch failed for {result.url}: {result.error}")
+                    record_error(f"Fetch failed for {result.url}: {result.error}")
 
         except Exception as e:
-            logger.error(f"Scraper fetch failed: {e}")
-            errors.append(str(e))
+            logger.error("Scraper fetch failed: %s", e)
+            record_error(str(e))
 
+        # Monotonic duration; the end timestamp is derived from it
+        metadata["elapsed_ns"] = elapsed_ns = time.perf_counter_ns() - started_ns
         return FetchResult(
             success=len(all_data) > 0,
             source_type=SourceType.SCRAPER,
             raw_data=all_data,
             total_fetched=len(all_data),
-            errors=errors,
+            errors=list(errors),
             metadata=metadata,
             fetch_started_at=fetch_started,
-            fetch_ended_at=datetime.now(UTC),
+            fetch_ended_at=fetch_started + timedelta(microseconds=elapsed_ns / 1000),
         )
 
     async def close(self) -> None:
-        """Close scraper and release browser resources."""
+        """Close scraper and release browser resources and parse workers."""
         if self._scraper:
             await self._scraper.close()
             self._scraper = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
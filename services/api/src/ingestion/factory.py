@@ -33,6 +33,7 @@ SCRAPPING_SERVICE_DIR = Path(__file__).resolve().parents[3] / "scrapping"
 DEFAULT_GENERATED_SCRAPER_CONFIG_DIR = (
     SCRAPPING_SERVICE_DIR / "generated_configs" / "sources"
 )
+_URL_SCHEMES = ("http://", "https://")
 
 
 class PipelineFactory:
@@ -172,11 +173,11 @@ class PipelineFactory:
         if not seed_urls and source_config.get("base_url"):
             seed_urls.append(source_config["base_url"])
 
-        cleaned = []
-        for url in seed_urls:
-            if isinstance(url, str) and url.startswith(("http://", "https://")):
-                cleaned.append(url)
-        return cleaned
+        return [
+            url
+            for url in seed_urls
+            if isinstance(url, str) and url.startswith(_URL_SCHEMES)
+        ]
 
     def _resolve_scraper_config_output_path(
         self,
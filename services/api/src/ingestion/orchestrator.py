@@ -292,7 +292,14 @@ class PipelineOrchestrator:
         start_time = datetime.now(UTC)
 
         # 1. Execute all pipelines
-        pipeline_results = await self.execute_all_pipelines(**kwargs)
+        try:
+            pipeline_results = await self.execute_all_pipelines(**kwargs)
+        finally:
+            # Adapters leave their pooled HTTP clients open for reuse; the
+            # run's fetching is over, so release the connections
+            from src.ingestion.adapters.api_adapter import close_shared_clients
+
+            await close_shared_clients()
 
         # 2. Extract and Deduplicate
         unique_events = self.deduplicate_results(pipeline_results)
@@ -9,7 +9,10 @@ The pipeline uses:
 - TaxonomyMapper for rule-based taxonomy assignment
 """
 
+import asyncio
 import logging
+import math
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -301,7 +304,9 @@ class ConfigDrivenAPIAdapter(APIAdapter):
         """
         Fetch data with pagination support.
 
-        Handles page-based, cursor-based, and offset-based pagination.
+        Handles page-based, cursor-based, and offset-based pagination. Once a
+        page reports the total available, the pages still needed are requested
+        concurrently; the adapter's rate limiter spaces the actual calls.
         """
         all_data = []
         page = kwargs.pop("page", self.source_config.pagination_start_page)
@@ -311,21 +316,16 @@ class ConfigDrivenAPIAdapter(APIAdapter):
         total_results = 0
 
         fetch_started = datetime.now(UTC)
+        started_ns = time.perf_counter_ns()
+        fetch_page = super().fetch
 
-        end_page = self.source_config.pagination_start_page + max_pages - 1
-        while page <= end_page:
-            logger.info(f"Fetching page {page}/{end_page}...")
-
-            # Add pagination params
-            page_params = {**kwargs, "page": page, "page_size": page_size}
-
-            # Fetch single page using parent class
-            result = await super().fetch(**page_params)
-
+        def accept(result: FetchResult) -> bool:
+            """Collect one page; return False when pagination should stop."""
+            nonlocal total_results
             if not result.success or not result.raw_data:
                 if result.errors:
                     errors.extend(result.errors)
-                break
+                return False
 
             all_data.extend(result.raw_data)
 
@@ -338,15 +338,47 @@ class ConfigDrivenAPIAdapter(APIAdapter):
                 logger.info(
                     f"Received {len(result.raw_data)} events (less than page_size), stopping pagination"
                 )
-                break
+                return False
 
             # Check if we've reached total available
             if total_results > 0 and len(all_data) >= total_results:
                 logger.info(f"Fetched all {total_results} available events")
+                return False
+            return True
+
+        end_page = self.source_config.pagination_start_page + max_pages - 1
+        while page <= end_page:
+            # Unknown total: one page at a time. Known total: every page still
+            # needed, in one concurrent batch.
+            last_page = page
+            if total_results > 0:
+                remaining = math.ceil((total_results - len(all_data)) / page_size)
+                last_page = min(end_page, page + remaining - 1)
+            if last_page == page:
+                logger.info(f"Fetching page {page}/{end_page}...")
+            else:
+                logger.info(f"Fetching pages {page}-{last_page}/{end_page}...")
+
+            # Add pagination params; fetch pages using parent class
+            pages = range(page, last_page + 1)
+            results = await asyncio.gather(
+                *(
+                    fetch_page(**{**kwargs, "page": p, "page_size": page_size})
+                    for p in pages
+                )
+            )
+
+            stopped = False
+            for page, result in zip(pages, results, strict=True):
+                if not accept(result):
+                    stopped = True
+                    break
+            if stopped:
                 break
 
             page += 1
 
+        elapsed_ns = time.perf_counter_ns() - started_ns
         pages_fetched = page - self.source_config.pagination_start_page + 1
         logger.info(
             f"Pagination complete: fetched {len(all_data)} total events across {pages_fetched} pages"
@@ -362,9 +394,10 @@ class ConfigDrivenAPIAdapter(APIAdapter):
                 "pages_fetched": page,
                 "total_available": total_results,
                 "max_pages": max_pages,
+                "elapsed_ns": elapsed_ns,
             },
             fetch_started_at=fetch_started,
-            fetch_ended_at=datetime.now(UTC),
+            fetch_ended_at=fetch_started + timedelta(microseconds=elapsed_ns / 1000),
         )
 
 
@@ -493,19 +526,7 @@ class BaseAPIPipeline(BasePipeline):
 
         # Deduplication
         if self.config.deduplicate and normalized_events:
-            from src.ingestion.deduplication import (
-                DeduplicationStrategy,
-                get_deduplicator,
-            )
-
-            deduplicator = get_deduplicator(
-                DeduplicationStrategy(self.config.deduplication_strategy)
-            )
-            before_count = len(normalized_events)
-            normalized_events = deduplicator.deduplicate(normalized_events)
-            self.logger.info(
-                f"Deduplication: {before_count} -> {len(normalized_events)} events"
-            )
+            normalized_events = await self._deduplicate(normalized_events)
 
         status = PipelineStatus.SUCCESS if normalized_events else PipelineStatus.FAILED
         if normalized_events and len(normalized_events) < len(all_raw_events):
@@ -644,7 +665,7 @@ class BaseAPIPipeline(BasePipeline):
                 # Dynamic URL path substitution for sources with {{area_id}} in the endpoint path
                 # (e.g. Eventbrite: /v3/organizers/{{area_id}}/events/)
                 if area_id is not None and "{{area_id}}" in self.source_config.endpoint:
-                    self.adapter.api_config.base_url = (
+                    self.adapter.config = self.adapter.api_config.with_base_url(
                         self.source_config.endpoint.replace("{{area_id}}", str(area_id))
                     )
                 fetch_result = await self.adapter.fetch(**fetch_kwargs)
@@ -13,17 +13,119 @@ Any new data source must:
 2. Inherit from BasePipeline and implement abstract methods
 """
 
+import asyncio
+import json
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from functools import partial
 from typing import Any
 
 from src.ingestion.adapters import BaseSourceAdapter, SourceType
+from src.ingestion.deduplication import (
+    DeduplicationStrategy,
+    EventDeduplicator,
+    get_deduplicator,
+)
 from src.schemas.event import EventSchema, NormalizationSeverity
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    # Same compact, non-ASCII-escaped output as orjson
+    _json_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+# Columns of the master DataFrame built by BasePipeline.to_dataframe, in order
+_DATAFRAME_COLUMNS = (
+    "event_id",
+    "title",
+    "description",
+    "start_datetime",
+    "end_datetime",
+    "duration_minutes",
+    "is_all_day",
+    "is_recurring",
+    "recurrence_pattern",
+    "venue_name",
+    "street_address",
+    "city",
+    "state_or_region",
+    "postal_code",
+    "country_code",
+    "latitude",
+    "longitude",
+    "timezone",
+    "event_type",
+    "event_format",
+    "capacity",
+    "age_restriction",
+    "price_currency",
+    "price_is_free",
+    "price_minimum",
+    "price_maximum",
+    "price_early_bird",
+    "price_standard",
+    "price_vip",
+    "price_raw_text",
+    "ticket_url",
+    "ticket_is_sold_out",
+    "ticket_count_available",
+    "ticket_early_bird_deadline",
+    "organizer_name",
+    "organizer_url",
+    "organizer_email",
+    "organizer_phone",
+    "organizer_image_url",
+    "organizer_follower_count",
+    "organizer_verified",
+    "source_name",
+    "source_event_id",
+    "source_url",
+    "source_updated_at",
+    "source_ingestion_timestamp",
+    "media_assets_json",
+    "engagement_going_count",
+    "engagement_interested_count",
+    "engagement_views_count",
+    "engagement_shares_count",
+    "engagement_comments_count",
+    "engagement_likes_count",
+    "engagement_updated_at",
+    "primary_category",
+    "taxonomy_subcategory",
+    "taxonomy_subcategory_name",
+    "taxonomy_values",
+    "taxonomy_activity_id",
+    "taxonomy_activity_name",
+    "taxonomy_energy_level",
+    "taxonomy_social_intensity",
+    "taxonomy_cognitive_load",
+    "taxonomy_physical_involvement",
+    "taxonomy_cost_level",
+    "taxonomy_time_scale",
+    "taxonomy_environment",
+    "taxonomy_emotional_output",
+    "taxonomy_risk_level",
+    "taxonomy_age_accessibility",
+    "taxonomy_repeatability",
+    "taxonomy_dimension_json",
+    "data_quality_score",
+    "normalization_errors",
+    "tags",
+    "artists",
+    "custom_fields_json",
+    "created_at",
+    "updated_at",
+)
+
 
 class PipelineStatus(str, Enum):
     """Status of a pipeline execution."""
@@ -99,6 +201,9 @@ class BasePipeline(ABC):
     Subclasses must:
     - Provide an adapter in __init__
     - Implement all abstract methods for source-specific logic
+
+    Subclasses may override process_batch() to run steps 2-6 over a whole
+    batch at once.
     """
 
     def __init__(self, config: PipelineConfig, adapter: BaseSourceAdapter):
@@ -114,6 +219,7 @@ class BasePipeline(ABC):
         self.logger = self._setup_logger()
         self.execution_id: str | None = None
         self.execution_start_time: datetime | None = None
+        self._deduplicator: EventDeduplicator | None = None
 
     def _setup_logger(self) -> logging.Logger:
         """Set up source-specific logger."""
@@ -250,19 +356,7 @@ class BasePipeline(ABC):
 
             # Step 7: Deduplication
             if self.config.deduplicate and normalized_events:
-                from src.ingestion.deduplication import (
-                    DeduplicationStrategy,
-                    get_deduplicator,
-                )
-
-                deduplicator = get_deduplicator(
-                    DeduplicationStrategy(self.config.deduplication_strategy)
-                )
-                before_count = len(normalized_events)
-                normalized_events = deduplicator.deduplicate(normalized_events)
-                self.logger.info(
-                    f"Deduplication: {before_count} -> {len(normalized_events)} events"
-                )
+                normalized_events = await self._deduplicate(normalized_events)
 
             status = (
                 PipelineStatus.SUCCESS if normalized_events else PipelineStatus.FAILED
@@ -309,92 +403,130 @@ class BasePipeline(ABC):
     async def _process_events_batch(
         self, raw_events: list[dict[str, Any]]
     ) -> list[EventSchema]:
-        """Process a batch of raw events through the pipeline."""
-        normalized_events = []
+        """Process a batch of raw events through the pipeline (steps 2-6)."""
+        return await self.process_batch(raw_events)
 
-        for idx, raw_event in enumerate(raw_events):
-            try:
-                # Step 2: Parse
-                parsed_event = self.parse_raw_event(raw_event)
+    async def process_batch(
+        self, raw_events: list[dict[str, Any]]
+    ) -> list[EventSchema]:
+        """
+        Run parse/map/normalize/validate/enrich over a whole batch.
 
-                # Step 3: Taxonomy mapping
-                primary_cat, taxonomy_dims = self.map_to_taxonomy(parsed_event)
+        The default runs each event through the per-event hooks. Up to
+        custom_config["workers"] events (default 1) are in flight at once, so
+        subclasses whose normalize/enrich steps await I/O overlap them.
+        Results keep the input order; failed events are dropped.
 
-                # Step 4: Normalize
-                event = await self.normalize_to_schema(
-                    parsed_event, primary_cat, taxonomy_dims
-                )
+        Subclasses may override this to fuse stages across the batch (e.g.
+        map every event's taxonomy in one pass) instead of once per event.
+        """
+        slots = asyncio.Semaphore(
+            max(1, int(self.config.custom_config.get("workers", 1)))
+        )
 
-                # Step 5: Validate
-                is_valid, validation_messages = self.validate_event(event)
-                normalized_messages = []
-                for msg in validation_messages:
-                    if isinstance(msg, str):
-                        if msg.strip():
-                            normalized_messages.append({"message": msg.strip()})
-                    else:
-                        normalized_messages.append(msg)
-                event.normalization_errors.extend(normalized_messages)
+        async def _bounded(idx: int, raw_event: dict[str, Any]) -> EventSchema | None:
+            async with slots:
+                return await self._process_single(raw_event, idx)
 
-                if not is_valid:
-                    self.logger.warning(
-                        f"Validation warnings for event {idx}: {normalized_messages}"
-                    )
+        results = await asyncio.gather(
+            *(_bounded(idx, raw_event) for idx, raw_event in enumerate(raw_events))
+        )
+        return [event for event in results if event is not None]
 
-                # Step 6: Enrich
-                event = await self.enrich_event(event)
+    async def _process_single(
+        self, raw_event: dict[str, Any], idx: int
+    ) -> EventSchema | None:
+        """Run one raw event through steps 2-6, or return None if it fails."""
+        try:
+            # Step 2: Parse
+            parsed_event = self.parse_raw_event(raw_event)
 
-                # Calculate quality score
-                event.data_quality_score = self._calculate_quality_score(event)
+            # Step 3: Taxonomy mapping
+            primary_cat, taxonomy_dims = self.map_to_taxonomy(parsed_event)
 
-                normalized_events.append(event)
+            # Step 4: Normalize
+            event = await self.normalize_to_schema(
+                parsed_event, primary_cat, taxonomy_dims
+            )
 
-            except Exception as e:
-                self.logger.error(f"Failed to process event {idx}: {e}", exc_info=True)
-                continue
+            # Step 5: Validate
+            is_valid, validation_messages = self.validate_event(event)
+            normalized_messages = []
+            for msg in validation_messages:
+                if isinstance(msg, str):
+                    if msg.strip():
+                        normalized_messages.append({"message": msg.strip()})
+                else:
+                    normalized_messages.append(msg)
+            event.normalization_errors.extend(normalized_messages)
+
+            if not is_valid:
+                self.logger.warning(
+                    f"Validation warnings for event {idx}: {normalized_messages}"
+                )
 
-        return normalized_events
+            # Step 6: Enrich
+            event = await self.enrich_event(event)
+
+            # Calculate quality score
+            event.data_quality_score = self._calculate_quality_score(event)
+
+            return event
+
+        except Exception as e:
+            self.logger.error(f"Failed to process event {idx}: {e}", exc_info=True)
+            return None
+
+    async def _deduplicate(self, events: list[EventSchema]) -> list[EventSchema]:
+        """Drop duplicate events using the configured strategy."""
+        # Deduplicators hold no per-run state, so one is built per pipeline
+        deduplicator = getattr(self, "_deduplicator", None)
+        if deduplicator is None:
+            deduplicator = self._deduplicator = get_deduplicator(
+                DeduplicationStrategy(self.config.deduplication_strategy)
+            )
+        before_count = len(events)
+        # Fuzzy/metadata strategies compare event pairs; run them off the
+        # event loop so other pipelines and requests keep being served
+        events = await asyncio.to_thread(deduplicator.deduplicate, events)
+        self.logger.info(f"Deduplication: {before_count} -> {len(events)} events")
+        return events
 
     def _calculate_quality_score(self, event: EventSchema) -> float:
         """Calculate data quality score (0.0-1.0)."""
-        score = 0.0
-
         # Key fields (40%)
-        key_fields_present = all(
-            [
-                event.title,
-                event.location.city,
-                event.start_datetime,
-            ]
+        key_fields_present = (
+            event.title and event.location.city and event.start_datetime
         )
-        score += 0.4 if key_fields_present else 0.0
-
-        # Enrichment fields (30%)
-        enrichment_bonus = 0.0
-        enrichment_bonus += 0.05 if event.media_assets else 0.0
-        enrichment_bonus += 0.05 if event.location.coordinates else 0.0
-        enrichment_bonus += 0.05 if event.price and not event.price.is_free else 0.0
-        enrichment_bonus += 0.05 if event.organizer and event.organizer.name else 0.0
-        enrichment_bonus += 0.05 if event.end_datetime else 0.0
-        enrichment_bonus += 0.05 if event.description else 0.0
-        score += min(enrichment_bonus, 0.3)
-
-        # Penalize validation errors (up to -10%), excluding INFO severity
-        real_errors = [
-            e
-            for e in event.normalization_errors
-            if e.severity != NormalizationSeverity.INFO
-        ]
-        error_penalty = min(len(real_errors) * 0.02, 0.1)
-        score -= error_penalty
+        score = 0.4 if key_fields_present else 0.0
+
+        # Enrichment fields (5% each, up to 30%)
+        enrichment_count = (
+            bool(event.media_assets)
+            + bool(event.location.coordinates)
+            + bool(event.price and not event.price.is_free)
+            + bool(event.organizer and event.organizer.name)
+            + bool(event.end_datetime)
+            + bool(event.description)
+        )
+        score += min(enrichment_count * 0.05, 0.3)
+
+        # Penalize validation errors (up to -10%), excluding INFO severity.
+        # Most events have none, so skip the scan entirely for them.
+        if event.normalization_errors:
+            real_errors = sum(
+                1
+                for e in event.normalization_errors
+                if e.severity != NormalizationSeverity.INFO
+            )
+            score -= min(real_errors * 0.02, 0.1)
 
         return round(max(0.0, min(score, 1.0)), 2)
 
     def _generate_execution_id(self) -> str:
         """Generate unique execution identifier."""
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        return f"{self.config.source_name}_{timestamp}_{unique_id}"
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        return f"{self.config.source_name}_{timestamp}_{uuid.uuid4().hex[:8]}"
 
     # ========================================================================
     # HELPER METHODS
@@ -409,11 +541,16 @@ class BasePipeline(ABC):
 
         Includes ALL fields from EventSchema with proper flattening of nested objects.
         """
-        import json
-
         import pandas as pd
 
-        rows = []
+        def get_enum_value(val):
+            if val is None:
+                return None
+            return val.value if hasattr(val, "value") else str(val)
+
+        # Built column by column: pandas takes each list as-is instead of
+        # aligning ~80 keys per row dict
+        cols: dict[str, list[Any]] = {name: [] for name in _DATAFRAME_COLUMNS}
         for event in events:
             # ---- ARTISTS ----
             artists_str = ", ".join(a.name for a in event.artists)
@@ -421,7 +558,7 @@ class BasePipeline(ABC):
             # ---- TAXONOMY DIMENSION (JSON + flattened) ----
             primary_dim = event.taxonomy_dimension
             if primary_dim:
-                taxonomy_json = json.dumps(
+                taxonomy_json = _json_dumps(
                     {
                         "primary_category": primary_dim.primary_category,
                         "subcategory": primary_dim.subcategory,
@@ -445,12 +582,6 @@ class BasePipeline(ABC):
             else:
                 taxonomy_json = None
 
-            # ---- ENUM VALUE EXTRACTION ----
-            def get_enum_value(val):
-                if val is None:
-                    return None
-                return val.value if hasattr(val, "value") else str(val)
-
             # ---- LOCATION FLATTENING ----
             loc = event.location
             lat = loc.coordinates.latitude if loc.coordinates else None
@@ -473,7 +604,7 @@ class BasePipeline(ABC):
 
             # ---- MEDIA ASSETS (JSON) ----
             media_json = (
-                json.dumps(
+                _json_dumps(
                     [
                         {
                             "type": m.type,
@@ -488,166 +619,169 @@ class BasePipeline(ABC):
                 else None
             )
 
-            row = {
-                # ==== CORE EVENT INFO ====
-                "event_id": event.event_id,
-                "title": event.title,
-                "description": event.description,
-                # ==== TIMING ====
-                "start_datetime": event.start_datetime,
-                "end_datetime": event.end_datetime,
-                "duration_minutes": event.duration_minutes,
-                "is_all_day": event.is_all_day,
-                "is_recurring": event.is_recurring,
-                "recurrence_pattern": event.recurrence_pattern,
-                # ==== LOCATION (flattened) ====
-                "venue_name": loc.venue_name,
-                "street_address": loc.street_address,
-                "city": loc.city,
-                "state_or_region": loc.state_or_region,
-                "postal_code": loc.postal_code,
-                "country_code": loc.country_code,
-                "latitude": lat,
-                "longitude": lon,
-                "timezone": loc.timezone,
-                # ==== EVENT DETAILS ====
-                "event_type": get_enum_value(event.event_type),
-                "event_format": get_enum_value(event.format),
-                "capacity": event.capacity,
-                "age_restriction": event.age_restriction,
-                # ==== PRICE (flattened) ====
-                "price_currency": price.currency_code if price else None,
-                "price_is_free": price.is_free if price else None,
-                "price_minimum": (
-                    float(price.minimum_price)
-                    if price and price.minimum_price
-                    else None
-                ),
-                "price_maximum": (
-                    float(price.maximum_price)
-                    if price and price.maximum_price
-                    else None
-                ),
-                "price_early_bird": (
-                    float(price.early_bird_price)
-                    if price and price.early_bird_price
-                    else None
-                ),
-                "price_standard": (
-                    float(price.standard_price)
-                    if price and price.standard_price
-                    else None
-                ),
-                "price_vip": (
-                    float(price.vip_price) if price and price.vip_price else None
-                ),
-                "price_raw_text": price.price_raw_text if price else None,
-                # ==== TICKET INFO (flattened) ====
-                "ticket_url": ticket.url if ticket else None,
-                "ticket_is_sold_out": ticket.is_sold_out if ticket else None,
-                "ticket_count_available": (
-                    ticket.ticket_count_available if ticket else None
-                ),
-                "ticket_early_bird_deadline": (
-                    ticket.early_bird_deadline if ticket else None
-                ),
-                # ==== ORGANIZER (flattened) ====
-                "organizer_name": org.name if org else None,
-                "organizer_url": org.url if org else None,
-                "organizer_email": org.email if org else None,
-                "organizer_phone": org.phone if org else None,
-                "organizer_image_url": org.image_url if org else None,
-                "organizer_follower_count": org.follower_count if org else None,
-                "organizer_verified": org.verified if org else None,
-                # ==== SOURCE (flattened) ====
-                "source_name": src.source_name if src else None,
-                "source_event_id": src.source_event_id if src else None,
-                "source_url": src.source_url if src else None,
-                "source_updated_at": src.source_updated_at if src else None,
-                "source_ingestion_timestamp": src.ingestion_timestamp if src else None,
-                # ==== MEDIA ====
-                "media_assets_json": media_json,
-                # ==== ENGAGEMENT (flattened) ====
-                "engagement_going_count": eng.going_count if eng else None,
-                "engagement_interested_count": eng.interested_count if eng else None,
-                "engagement_views_count": eng.views_count if eng else None,
-                "engagement_shares_count": eng.shares_count if eng else None,
-                "engagement_comments_count": eng.comments_count if eng else None,
-                "engagement_likes_count": eng.likes_count if eng else None,
-                "engagement_updated_at": eng.updated_at if eng else None,
-                # ==== TAXONOMY - PRIMARY CATEGORY ====
-                "primary_category": (
-                    primary_dim.primary_category if primary_dim else None
-                ),
-                # ==== TAXONOMY - PRIMARY DIMENSION (flattened) ====
-                "taxonomy_subcategory": (
-                    primary_dim.subcategory if primary_dim else None
-                ),
-                "taxonomy_subcategory_name": (
-                    primary_dim.subcategory_name if primary_dim else None
-                ),
-                "taxonomy_values": (
-                    ", ".join(primary_dim.values)
-                    if primary_dim and primary_dim.values
-                    else None
-                ),
-                "taxonomy_activity_id": (
-                    primary_dim.activity_id if primary_dim else None
-                ),
-                "taxonomy_activity_name": (
-                    primary_dim.activity_name if primary_dim else None
-                ),
-                "taxonomy_energy_level": (
-                    primary_dim.energy_level if primary_dim else None
-                ),
-                "taxonomy_social_intensity": (
-                    primary_dim.social_intensity if primary_dim else None
-                ),
-                "taxonomy_cognitive_load": (
-                    primary_dim.cognitive_load if primary_dim else None
-                ),
-                "taxonomy_physical_involvement": (
-                    primary_dim.physical_involvement if primary_dim else None
-                ),
-                "taxonomy_cost_level": primary_dim.cost_level if primary_dim else None,
-                "taxonomy_time_scale": primary_dim.time_scale if primary_dim else None,
-                "taxonomy_environment": (
-                    primary_dim.environment if primary_dim else None
-                ),
-                "taxonomy_emotional_output": (
-                    ", ".join(primary_dim.emotional_output)
-                    if primary_dim and primary_dim.emotional_output
-                    else None
-                ),
-                "taxonomy_risk_level": primary_dim.risk_level if primary_dim else None,
-                "taxonomy_age_accessibility": (
-                    primary_dim.age_accessibility if primary_dim else None
-                ),
-                "taxonomy_repeatability": (
-                    primary_dim.repeatability if primary_dim else None
-                ),
-                # ==== FULL TAXONOMY JSON ====
-                "taxonomy_dimension_json": taxonomy_json,
-                # ==== QUALITY & ERRORS ====
-                "data_quality_score": event.data_quality_score,
-                "normalization_errors": (
-                    ", ".join(e.message for e in event.normalization_errors)
-                    if event.normalization_errors
-                    else None
-                ),
-                # ==== ADDITIONAL METADATA ====
-                "tags": ", ".join(event.tags) if event.tags else None,
-                "artists": artists_str,
-                "custom_fields_json": (
-                    json.dumps(event.custom_fields) if event.custom_fields else None
-                ),
-                # ==== PLATFORM TIMESTAMPS ====
-                "created_at": event.created_at,
-                "updated_at": event.updated_at,
-            }
-            rows.append(row)
-
-        return pd.DataFrame(rows)
+            # ==== CORE EVENT INFO ====
+            cols["event_id"].append(event.event_id)
+            cols["title"].append(event.title)
+            cols["description"].append(event.description)
+            # ==== TIMING ====
+            cols["start_datetime"].append(event.start_datetime)
+            cols["end_datetime"].append(event.end_datetime)
+            cols["duration_minutes"].append(event.duration_minutes)
+            cols["is_all_day"].append(event.is_all_day)
+            cols["is_recurring"].append(event.is_recurring)
+            cols["recurrence_pattern"].append(event.recurrence_pattern)
+            # ==== LOCATION (flattened) ====
+            cols["venue_name"].append(loc.venue_name)
+            cols["street_address"].append(loc.street_address)
+            cols["city"].append(loc.city)
+            cols["state_or_region"].append(loc.state_or_region)
+            cols["postal_code"].append(loc.postal_code)
+            cols["country_code"].append(loc.country_code)
+            cols["latitude"].append(lat)
+            cols["longitude"].append(lon)
+            cols["timezone"].append(loc.timezone)
+            # ==== EVENT DETAILS ====
+            cols["event_type"].append(get_enum_value(event.event_type))
+            cols["event_format"].append(get_enum_value(event.format))
+            cols["capacity"].append(event.capacity)
+            cols["age_restriction"].append(event.age_restriction)
+            # ==== PRICE (flattened) ====
+            cols["price_currency"].append(price.currency_code if price else None)
+            cols["price_is_free"].append(price.is_free if price else None)
+            cols["price_minimum"].append(
+                float(price.minimum_price) if price and price.minimum_price else None
+            )
+            cols["price_maximum"].append(
+                float(price.maximum_price) if price and price.maximum_price else None
+            )
+            cols["price_early_bird"].append(
+                float(price.early_bird_price)
+                if price and price.early_bird_price
+                else None
+            )
+            cols["price_standard"].append(
+                float(price.standard_price) if price and price.standard_price else None
+            )
+            cols["price_vip"].append(
+                float(price.vip_price) if price and price.vip_price else None
+            )
+            cols["price_raw_text"].append(price.price_raw_text if price else None)
+            # ==== TICKET INFO (flattened) ====
+            cols["ticket_url"].append(ticket.url if ticket else None)
+            cols["ticket_is_sold_out"].append(ticket.is_sold_out if ticket else None)
+            cols["ticket_count_available"].append(
+                ticket.ticket_count_available if ticket else None
+            )
+            cols["ticket_early_bird_deadline"].append(
+                ticket.early_bird_deadline if ticket else None
+            )
+            # ==== ORGANIZER (flattened) ====
+            cols["organizer_name"].append(org.name if org else None)
+            cols["organizer_url"].append(org.url if org else None)
+            cols["organizer_email"].append(org.email if org else None)
+            cols["organizer_phone"].append(org.phone if org else None)
+            cols["organizer_image_url"].append(org.image_url if org else None)
+            cols["organizer_follower_count"].append(org.follower_count if org else None)
+            cols["organizer_verified"].append(org.verified if org else None)
+            # ==== SOURCE (flattened) ====
+            cols["source_name"].append(src.source_name if src else None)
+            cols["source_event_id"].append(src.source_event_id if src else None)
+            cols["source_url"].append(src.source_url if src else None)
+            cols["source_updated_at"].append(src.source_updated_at if src else None)
+            cols["source_ingestion_timestamp"].append(
+                src.ingestion_timestamp if src else None
+            )
+            # ==== MEDIA ====
+            cols["media_assets_json"].append(media_json)
+            # ==== ENGAGEMENT (flattened) ====
+            cols["engagement_going_count"].append(eng.going_count if eng else None)
+            cols["engagement_interested_count"].append(
+                eng.interested_count if eng else None
+            )
+            cols["engagement_views_count"].append(eng.views_count if eng else None)
+            cols["engagement_shares_count"].append(eng.shares_count if eng else None)
+            cols["engagement_comments_count"].append(
+                eng.comments_count if eng else None
+            )
+            cols["engagement_likes_count"].append(eng.likes_count if eng else None)
+            cols["engagement_updated_at"].append(eng.updated_at if eng else None)
+            # ==== TAXONOMY - PRIMARY CATEGORY ====
+            cols["primary_category"].append(
+                primary_dim.primary_category if primary_dim else None
+            )
+            # ==== TAXONOMY - PRIMARY DIMENSION (flattened) ====
+            cols["taxonomy_subcategory"].append(
+                primary_dim.subcategory if primary_dim else None
+            )
+            cols["taxonomy_subcategory_name"].append(
+                primary_dim.subcategory_name if primary_dim else None
+            )
+            cols["taxonomy_values"].append(
+                ", ".join(primary_dim.values)
+                if primary_dim and primary_dim.values
+                else None
+            )
+            cols["taxonomy_activity_id"].append(
+                primary_dim.activity_id if primary_dim else None
+            )
+            cols["taxonomy_activity_name"].append(
+                primary_dim.activity_name if primary_dim else None
+            )
+            cols["taxonomy_energy_level"].append(
+                primary_dim.energy_level if primary_dim else None
+            )
+            cols["taxonomy_social_intensity"].append(
+                primary_dim.social_intensity if primary_dim else None
+            )
+            cols["taxonomy_cognitive_load"].append(
+                primary_dim.cognitive_load if primary_dim else None
+            )
+            cols["taxonomy_physical_involvement"].append(
+                primary_dim.physical_involvement if primary_dim else None
+            )
+            cols["taxonomy_cost_level"].append(
+                primary_dim.cost_level if primary_dim else None
+            )
+            cols["taxonomy_time_scale"].append(
+                primary_dim.time_scale if primary_dim else None
+            )
+            cols["taxonomy_environment"].append(
+                primary_dim.environment if primary_dim else None
+            )
+            cols["taxonomy_emotional_output"].append(
+                ", ".join(primary_dim.emotional_output)
+                if primary_dim and primary_dim.emotional_output
+                else None
+            )
+            cols["taxonomy_risk_level"].append(
+                primary_dim.risk_level if primary_dim else None
+            )
+            cols["taxonomy_age_accessibility"].append(
+                primary_dim.age_accessibility if primary_dim else None
+            )
+            cols["taxonomy_repeatability"].append(
+                primary_dim.repeatability if primary_dim else None
+            )
+            # ==== FULL TAXONOMY JSON ====
+            cols["taxonomy_dimension_json"].append(taxonomy_json)
+            # ==== QUALITY & ERRORS ====
+            cols["data_quality_score"].append(event.data_quality_score)
+            cols["normalization_errors"].append(
+                ", ".join(e.message for e in event.normalization_errors)
+                if event.normalization_errors
+                else None
+            )
+            # ==== ADDITIONAL METADATA ====
+            cols["tags"].append(", ".join(event.tags) if event.tags else None)
+            cols["artists"].append(artists_str)
+            cols["custom_fields_json"].append(
+                _json_dumps(event.custom_fields) if event.custom_fields else None
+            )
+            # ==== PLATFORM TIMESTAMPS ====
+            cols["created_at"].append(event.created_at)
+            cols["updated_at"].append(event.updated_at)
+
+        return pd.DataFrame(cols)
 
     async def close(self) -> None:
         """Release adapter resources."""
@@ -12,6 +12,7 @@ This module provides:
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import re
@@ -19,12 +20,13 @@ import time
 from abc import abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, Playwright
+    from playwright.async_api import Browser, BrowserContext, Playwright
 
 from src.ingestion.adapters import ScraperAdapter, SourceType
 from src.ingestion.adapters.scraper_adapter import ScraperAdapterConfig
@@ -32,6 +34,13 @@ from src.ingestion.pipelines.base_pipeline import BasePipeline, PipelineConfig
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
 
 # =============================================================================
 # DATA CLASSES
@@ -51,7 +60,7 @@ class PageFetchResult:
     elapsed_s: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScraperConfig:
     """Configuration for the EventScraper."""
 
@@ -103,10 +112,20 @@ def list_available_configs() -> list[str]:
     return [f.stem for f in SCRAPER_CONFIGS_DIR.glob("*.json")]
 
 
+@lru_cache(maxsize=64)
+def _read_config_json(config_path: Path, mtime_ns: int) -> dict[str, Any]:
+    # Keyed on mtime so an edited config file is re-read on the next load
+    with open(config_path, "rb") as f:
+        return _json_loads(f.read())
+
+
 def load_config_raw(source_name: str) -> dict[str, Any]:
     """
     Load raw config dict from JSON file.
 
+    Parsed files are cached until they change on disk; each call returns its
+    own copy, so callers may modify the result.
+
     Args:
         source_name: Name of the source
 
@@ -114,8 +133,8 @@ def load_config_raw(source_name: str) -> dict[str, Any]:
         Raw config dictionary
     """
     config_path = get_config_path(source_name)
-    with open(config_path, encoding="utf-8") as f:
-        return json.load(f)
+    raw = _read_config_json(config_path, config_path.stat().st_mtime_ns)
+    return copy.deepcopy(raw)
 
 
 def load_scraper_config(
@@ -202,6 +221,92 @@ def load_scraper_config(
 load_event_scraper_config = load_scraper_config
 
 
+# =============================================================================
+# SHARED BROWSERS
+# =============================================================================
+
+
+@dataclass
+class _SharedBrowser:
+    """A Playwright browser shared by every EventScraper on one event loop."""
+
+    key: tuple[bool, asyncio.AbstractEventLoop]
+    start: asyncio.Future[tuple[Playwright, Browser]]
+    users: int = 0
+
+    @property
+    def browser(self) -> Browser:
+        return self.start.result()[1]
+
+
+# Launching Chromium costs ~1s and a few hundred MB, so scrapers alive at the
+# same time share one browser per (headless, event loop) and each keeps only
+# its own context. The last scraper to release it shuts the browser down.
+_BROWSERS: dict[tuple[bool, asyncio.AbstractEventLoop], _SharedBrowser] = {}
+
+
+async def _launch_browser(headless: bool) -> tuple[Playwright, Browser]:
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        raise ImportError(
+            "playwright is required for scraping. Install it with: pip install playwright && playwright install"
+        )
+
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=headless)
+    except BaseException:
+        await playwright.stop()
+        raise
+    logger.info("Browser started")
+    return playwright, browser
+
+
+async def _acquire_browser(headless: bool) -> _SharedBrowser:
+    """Take a use of this loop's shared browser, launching it on first use."""
+    key = (headless, asyncio.get_running_loop())
+    shared = _BROWSERS.get(key)
+    if shared is None:
+        shared = _BROWSERS[key] = _SharedBrowser(
+            key=key, start=asyncio.ensure_future(_launch_browser(headless))
+        )
+    shared.users += 1
+    try:
+        await asyncio.shield(shared.start)
+    except BaseException:
+        if shared.start.done() and _BROWSERS.get(key) is shared:
+            # Launch failed: let the next scraper try a fresh one
+            del _BROWSERS[key]
+        await _release_browser(shared)
+        raise
+    return shared
+
+
+async def _release_browser(shared: _SharedBrowser) -> None:
+    """Give back one use of a shared browser, closing it when none are left."""
+    shared.users -= 1
+    if shared.users > 0:
+        return
+    if _BROWSERS.get(shared.key) is shared:
+        del _BROWSERS[shared.key]
+
+    if not shared.start.done():
+        shared.start.cancel()
+        return
+    if shared.start.cancelled() or shared.start.exception() is not None:
+        return
+    playwright, browser = shared.start.result()
+    try:
+        await browser.close()
+    except Exception as e:
+        logger.warning("Error closing browser: %s", e)
+    try:
+        await playwright.stop()
+    except Exception as e:
+        logger.warning("Error stopping playwright: %s", e)
+
+
 # =============================================================================
 # EVENT SCRAPER (ASYNC)
 # =============================================================================
@@ -214,7 +319,7 @@ class EventScraper:
     Handles:
     - Fetching listing pages with pagination
     - Extracting event URLs from listing pages
-    - Fetching individual event detail pages (parallel batches)
+    - Fetching individual event detail pages (bounded concurrency)
 
     Usage:
         config = ScraperConfig(...)
@@ -232,97 +337,119 @@ class EventScraper:
             config: ScraperConfig instance
         """
         self.config = config
-        self._browser: Browser | None = None
-        self._playwright: Playwright | None = None
+        self._browser: _SharedBrowser | None = None
+        self._context: BrowserContext | None = None
+        self._browser_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Future[PageFetchResult]] = {}
 
     async def _ensure_browser(self) -> None:
-        """Ensure browser is started."""
-        if self._browser is not None:
+        """Ensure browser and the shared browsing context are started."""
+        if self._context is not None:
             return
+        async with self._browser_lock:
+            if self._context is None:
+                await self._start_browser()
 
+    async def _start_browser(self) -> None:
+        shared = await _acquire_browser(self.config.headless)
         try:
-            from playwright.async_api import async_playwright
-        except ImportError:
-            raise ImportError(
-                "playwright is required for scraping. Install it with: pip install playwright && playwright install"
-            )
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.config.headless
+            self._context = await self._open_context(shared.browser)
+        except BaseException:
+            await _release_browser(shared)
+            raise
+        self._browser = shared
+
+    async def _open_context(self, browser: Browser) -> BrowserContext:
+        # One context for every page: its connection pool (and DNS/TLS
+        # session state) is reused across pages on the same host instead of
+        # opening a fresh connection per URL
+        context = await browser.new_context(
+            user_agent=(
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US",
+            timezone_id="Europe/Madrid",
+            geolocation={"latitude": 41.3851, "longitude": 2.1734},
+            permissions=["geolocation"],
         )
-        logger.info("Browser started")
+        # Add stealth scripts to avoid detection
+        await context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+            Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en', 'es'] });
+            Object.defineProperty(navigator, 'platform', { get: () => 'MacIntel' });
+        """)
+        return context
 
     async def close(self) -> None:
-        """Close browser and release resources."""
-        if self._browser:
+        """Close this scraper's context and release its use of the shared browser."""
+        if self._context:
             try:
-                await self._browser.close()
+                await self._context.close()
             except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-            self._browser = None
+                logger.warning("Error closing browser context: %s", e)
+            self._context = None
 
-        if self._playwright:
-            try:
-                await self._playwright.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
-            self._playwright = None
+        if self._browser:
+            shared, self._browser = self._browser, None
+            await _release_browser(shared)
+
+    @staticmethod
+    async def _scroll_and_read(page) -> str:
+        """Scroll to load lazy content, then return the page HTML."""
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await page.wait_for_timeout(1500)
+        return await page.content()
 
     async def _fetch_page(self, url: str) -> PageFetchResult:
-        """Fetch a single page with stealth settings."""
+        """
+        Fetch a single page, sharing one load between concurrent callers.
+
+        Overlapping listing pages or batches can ask for the same URL while it
+        is still loading; those callers await the same result instead of
+        opening another page for it.
+        """
+        pending = self._inflight.get(url)
+        if pending is None:
+            pending = self._inflight[url] = asyncio.ensure_future(self._load_page(url))
+            pending.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shielded so one cancelled caller doesn't cancel the load for the rest
+        return await asyncio.shield(pending)
+
+    async def _load_page(self, url: str) -> PageFetchResult:
+        """Load a single page with stealth settings."""
         await self._ensure_browser()
-        assert self._browser is not None  # ensured by _ensure_browser()
+        assert self._context is not None  # ensured by _ensure_browser()
 
         start_time = time.time()
         try:
-            # Create context with realistic browser fingerprint
-            context = await self._browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US",
-                timezone_id="Europe/Madrid",
-                geolocation={"latitude": 41.3851, "longitude": 2.1734},
-                permissions=["geolocation"],
-            )
-
-            page = await context.new_page()
-            page.set_default_timeout(self.config.timeout_s * 1000)
-
-            # Add stealth scripts to avoid detection
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-                Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en', 'es'] });
-                Object.defineProperty(navigator, 'platform', { get: () => 'MacIntel' });
-            """)
-
-            response = await page.goto(url, wait_until="networkidle")
-            await page.wait_for_timeout(3000)
-
-            html = await page.content()
-            if "captcha" in html.lower() or "datadome" in html.lower():
-                logger.warning(f"Captcha detected on {url}, waiting longer...")
-                await page.wait_for_timeout(5000)
-                html = await page.content()
-
-            # Scroll to load lazy content
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1500)
-
-            html = await page.content()
-            status_code = response.status if response else None
-            final_url = page.url
-
-            await page.close()
-            await context.close()
+            page = await self._context.new_page()
+            try:
+                page.set_default_timeout(self.config.timeout_s * 1000)
+
+                response = await page.goto(url, wait_until="networkidle")
+                await page.wait_for_timeout(3000)
+                html = await self._scroll_and_read(page)
+
+                # Serializing the DOM is the expensive step, so only a captcha
+                # page is read a second time (after waiting and scrolling again)
+                html_lower = html.lower()
+                if "captcha" in html_lower or "datadome" in html_lower:
+                    logger.warning("Captcha detected on %s, waiting longer...", url)
+                    await page.wait_for_timeout(5000)
+                    html = await self._scroll_and_read(page)
+                    html_lower = html.lower()
+
+                status_code = response.status if response else None
+                final_url = page.url
+            finally:
+                await page.close()
 
             elapsed = time.time() - start_time
-            is_blocked = "captcha" in html.lower() or status_code == 403
+            is_blocked = "captcha" in html_lower or status_code == 403
 
             return PageFetchResult(
                 ok=not is_blocked
@@ -337,7 +464,7 @@ class EventScraper:
 
         except Exception as e:
             elapsed = time.time() - start_time
-            logger.error(f"Failed to fetch {url}: {e}")
+            logger.error("Failed to fetch %s: %s", url, e)
             return PageFetchResult(
                 ok=False,
                 url=url,
@@ -348,48 +475,73 @@ class EventScraper:
                 elapsed_s=elapsed,
             )
 
+    async def _fetch_bounded(
+        self,
+        urls: list[str],
+        concurrency: int,
+        on_result: Callable[[PageFetchResult], None] | None = None,
+    ) -> list[PageFetchResult]:
+        """
+        Fetch pages with at most `concurrency` in flight, in URL order.
+
+        Each slot pauses min_delay_s after a fetch before taking the next
+        URL, so a slow page holds up one slot rather than a whole batch.
+        """
+        slots = asyncio.Semaphore(concurrency)
+        not_started = len(urls)
+
+        async def _fetch(url: str) -> PageFetchResult:
+            nonlocal not_started
+            async with slots:
+                not_started -= 1
+                result = await self._fetch_page(url)
+                if on_result is not None:
+                    on_result(result)
+                # Politeness delay before this slot takes the next URL
+                if not_started > 0:
+                    await asyncio.sleep(self.config.min_delay_s)
+            return result
+
+        return list(await asyncio.gather(*(_fetch(url) for url in urls)))
+
     async def fetch_listing_pages(
         self,
         *,
         city: str | None = None,
         country_code: str | None = None,
         max_pages: int | None = None,
+        concurrency: int = 5,
     ) -> list[PageFetchResult]:
         """
-        Fetch listing pages.
+        Fetch listing pages concurrently.
 
         Args:
             city: City to fetch (overrides config)
             country_code: Country code (overrides config)
             max_pages: Max pages to fetch (overrides config)
+            concurrency: Maximum concurrent page fetches
 
         Returns:
-            List of PageFetchResult for each listing page
+            List of PageFetchResult for each listing page, in page order
         """
         city = city or self.config.city
         country_code = country_code or self.config.country_code
         max_pages = max_pages if max_pages is not None else self.config.max_pages
 
-        results = []
-
-        for page_num in range(max_pages):
-            url = f"{self.config.base_url}/{country_code}/{city}"
-            if page_num > 0:
-                url = f"{url}?week={page_num}"
-
-            logger.info(f"Fetching listing page: {url}")
-
-            result = await self._fetch_page(url)
-            results.append(result)
+        url = f"{self.config.base_url}/{country_code}/{city}"
+        urls = [url] + [f"{url}?week={page_num}" for page_num in range(1, max_pages)]
+        logger.info("Fetching %d listing pages (%d concurrent)", len(urls), concurrency)
 
+        results = await self._fetch_bounded(urls, concurrency)
+        for result in results:
             if result.ok:
                 logger.info(
-                    f"Successfully fetched: {url} ({len(result.html or '')} chars)"
+                    "Successfully fetched: %s (%d chars)",
+                    result.url,
+                    len(result.html or ""),
                 )
             else:
-                logger.warning(f"Failed to fetch: {url} - {result.error}")
-
-            await asyncio.sleep(self.config.min_delay_s)
+                logger.warning("Failed to fetch: %s - %s", result.url, result.error)
 
         return results
 
@@ -426,7 +578,7 @@ class EventScraper:
                 seen.add(url)
                 urls.append(url)
 
-        logger.info(f"Extracted {len(urls)} event URLs")
+        logger.info("Extracted %d event URLs", len(urls))
         return urls
 
     async def fetch_event_pages(
@@ -435,44 +587,33 @@ class EventScraper:
         *,
         max_events: int | None = None,
         concurrency: int = 5,
+        on_result: Callable[[PageFetchResult], None] | None = None,
     ) -> list[PageFetchResult]:
         """
-        Fetch event detail pages in parallel batches.
+        Fetch event detail pages concurrently.
+
+        At most `concurrency` pages are in flight (see _fetch_bounded).
 
         Args:
             urls: List of event URLs
             max_events: Maximum events to fetch
-            concurrency: Number of concurrent fetches per batch
+            concurrency: Maximum concurrent page fetches
+            on_result: Called with each result as soon as it arrives, so
+                       callers can start processing before the rest finish
 
         Returns:
-            List of PageFetchResult for each event page
+            List of PageFetchResult for each event page, in URL order
         """
         if max_events:
             urls = urls[:max_events]
 
-        results = []
-
-        # Process in batches of `concurrency`
-        for i in range(0, len(urls), concurrency):
-            batch = urls[i : i + concurrency]
-            logger.info(
-                f"Fetching event batch {i // concurrency + 1} ({len(batch)} URLs)"
-            )
-
-            batch_results = await asyncio.gather(
-                *[self._fetch_page(url) for url in batch]
-            )
-            results.extend(batch_results)
-
-            ok_count = sum(1 for r in batch_results if r.ok)
-            logger.debug(f"Batch complete: {ok_count}/{len(batch)} successful")
-
-            # Delay between batches (not between individual pages)
-            if i + concurrency < len(urls):
-                await asyncio.sleep(self.config.min_delay_s)
+        logger.info("Fetching %d event pages (%d concurrent)", len(urls), concurrency)
+        results = await self._fetch_bounded(urls, concurrency, on_result)
 
         logger.info(
-            f"Fetched {len(results)} event pages, {sum(1 for r in results if r.ok)} successful"
+            "Fetched %d event pages, %d successful",
+            len(results),
+            sum(1 for r in results if r.ok),
         )
         return results
 
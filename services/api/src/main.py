@@ -35,6 +35,7 @@ from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.configs.settings import get_settings
+from src.ingestion.adapters.api_adapter import close_shared_clients
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,7 @@ async def lifespan(app: FastAPI):
     global _POOL
     if _POOL is not None:
         _POOL.closeall()
+    await close_shared_clients()
 
 
 app = FastAPI(
@@ -3,7 +3,8 @@
 Features:
 - session reuse + connection pooling
 - retry with backoff (shared policy)
-- rate limiting (shared bucket)
+- rate limiting (per-host bucket, backs off when the host throttles us)
+- per-host circuit breaker after repeated blocks
 - basic proxy support
 - redirect tracking
 """
@@ -13,11 +14,12 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
-from scrapping.runtime.blocks import classify_blocks
-from scrapping.runtime.resilience import RateLimiter, RetryPolicy
+from scrapping.runtime.blocks import classify_blocks, is_throttled
+from scrapping.runtime.resilience import HostThrottle, RetryPolicy
 from scrapping.runtime.results import (
     EngineError,
     FetchResult,
@@ -47,6 +49,10 @@ class HttpEngineOptions:
     min_delay_s: float | None = None
     jitter_s: float | None = None
 
+    # circuit breaker: skip a host for cooldown after N throttled responses in a row
+    breaker_threshold: int = 5
+    breaker_cooldown_s: float = 60.0
+
     # headers
     user_agent: str | None = None
 
@@ -71,11 +77,13 @@ class HttpEngine(BaseEngine):
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
 
-        self._limiter = RateLimiter(
+        self._throttle = HostThrottle(
             rps=self.options.rps,
             burst=self.options.burst,
             min_delay_s=self.options.min_delay_s,
             jitter_s=self.options.jitter_s,
+            breaker_threshold=self.options.breaker_threshold,
+            breaker_cooldown_s=self.options.breaker_cooldown_s,
         )
         self._retry_policy = RetryPolicy(
             max_retries=self.options.max_retries,
@@ -116,8 +124,22 @@ class HttpEngine(BaseEngine):
         last_result: FetchResult | None = None
         trace: list[dict[str, Any]] = []
 
+        host = urlsplit(url).netloc
+        limiter = self._throttle.limiter(host)
+
         for attempt in range(0, self._retry_policy.max_retries + 1):
-            self._limiter.wait()
+            # Re-checked per attempt: our own retries (or other workers) may
+            # have tripped the breaker since the previous one
+            if self._throttle.is_open(host):
+                return FetchResult(
+                    final_url=url,
+                    error=EngineError(
+                        type="CircuitOpen",
+                        message=f"{host} is blocking requests; skipped during cooldown",
+                    ),
+                    engine_trace=trace,
+                )
+            limiter.wait()
 
             req_meta = RequestMeta(
                 method="GET",
@@ -166,6 +188,7 @@ class HttpEngine(BaseEngine):
 
                 # Block detection
                 result.block_signals = classify_blocks(result.text)
+                self._throttle.record(host, throttled=is_throttled(result))
 
                 if result.ok:
                     return result
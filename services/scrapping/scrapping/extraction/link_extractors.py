@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 
@@ -78,10 +79,11 @@ def extract_links(req: LinkExtractRequest) -> list[str]:
     else:
         raise ValueError(f"unknown link extract method: {method}")
 
-    # join with base_url if relative
+    # join with base_url if relative. Listing pages repeat the same href many
+    # times (card image + title + nav), so drop exact repeats before paying
+    # for urljoin/canonicalize on each one.
     cooked: list[str] = []
-    for u in raw:
-        u = u.strip()
+    for u in dict.fromkeys(u.strip() for u in raw):
         if not u:
             continue
         if req.base_url:
@@ -250,7 +252,7 @@ def canonicalize_url(
     query_pairs = parse_qsl(parts.query, keep_blank_values=True)
 
     if drop_tracking_params and tracking_params:
-        drop = set(p.lower() for p in tracking_params)
+        drop = _lowered(tuple(tracking_params))
         query_pairs = [(k, v) for (k, v) in query_pairs if k.lower() not in drop]
 
     # stable sort
@@ -263,6 +265,11 @@ def canonicalize_url(
     return normalized
 
 
+@lru_cache(maxsize=32)
+def _lowered(params: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(p.lower() for p in params)
+
+
 def normalize_url(url: str, **kwargs) -> str:
     """Alias for canonicalize_url with notebook-friendly parameter mapping."""
     if "drop_fragments" in kwargs:
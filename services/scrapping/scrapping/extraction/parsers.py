@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
 
@@ -107,6 +108,23 @@ def xpath_values(html: str, xpath: str) -> list[str]:
 # ---------------------------------------------------------------------
 
 
+@cache
+def _load_trafilatura() -> tuple[Any, Any, str | None]:
+    """Import trafilatura and build its config once per process.
+
+    Called for every detail page: retrying a missing optional import searches
+    sys.path each time, and use_config() re-reads trafilatura's settings file.
+    Returns (module, config, None) or (None, None, error type name).
+    """
+    try:
+        import trafilatura  # type: ignore
+        from trafilatura.settings import use_config  # type: ignore
+    except Exception as e:
+        return None, None, type(e).__name__
+    # Use trafilatura defaults (can be configured later)
+    return trafilatura, use_config(), None
+
+
 def extract_structured_trafilatura(
     html: str, *, url: str | None = None
 ) -> TextExtractResult:
@@ -115,12 +133,10 @@ def extract_structured_trafilatura(
 
     This is useful for post-processing/QA stages (like your current analyze pipeline).
     """
-    try:
-        import trafilatura  # type: ignore
-        from trafilatura.settings import use_config  # type: ignore
-    except Exception as e:
+    trafilatura, config, import_error = _load_trafilatura()
+    if trafilatura is None:
         return TextExtractResult(
-            ok=False, text="", error=f"trafilatura not available: {type(e).__name__}"
+            ok=False, text="", error=f"trafilatura not available: {import_error}"
         )
 
     try:
@@ -128,8 +144,6 @@ def extract_structured_trafilatura(
         if not downloaded:
             return TextExtractResult(ok=False, text="", error="empty html")
 
-        # Use trafilatura defaults (can be configured later)
-        config = use_config()
         text = trafilatura.extract(
             downloaded,
             config=config,
@@ -15,7 +15,7 @@ This is engine-agnostic and config-driven.
 from __future__ import annotations
 
 from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -158,20 +158,14 @@ def fetch_pages(
             return engine.get_rendered(u, ctx=ctx, actions=actions, wait_for=wait_for)
         return engine.get(u, ctx=ctx)
 
-    results: list[FetchResult] = []
-    if parallelism <= 1:
-        for u in urls:
-            results.append(_one(u))
-        return results
-
-    with ThreadPoolExecutor(max_workers=int(parallelism)) as ex:
-        futs = {ex.submit(_one, u): u for u in urls}
-        for fut in as_completed(futs):
-            results.append(fut.result())
-    # keep stable by sorting according to original order
-    order = {u: i for i, u in enumerate(urls)}
-    results.sort(key=lambda r: order.get(r.final_url, 10**9))
-    return results
+    workers = min(int(parallelism), len(urls))
+    if workers <= 1:
+        return [_one(u) for u in urls]
+
+    # map() yields in input order, so redirected pages (whose final_url differs
+    # from the requested one) keep their position without re-sorting
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_one, urls))
 
 
 # ---------------------------------------------------------------------
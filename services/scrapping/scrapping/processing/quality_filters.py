@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from scrapping.extraction.transforms import normalize_ws, strip_or_none
@@ -62,6 +63,14 @@ _DEFAULT_BLOCK_PATTERNS = [
 _WS = re.compile(r"\s+")
 
 
+@lru_cache(maxsize=64)
+def _compile_block_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[tuple[str, re.Pattern[str]], ...]:
+    # Compiled once per pattern set instead of per item and per pattern
+    return tuple((p, re.compile(p, flags=re.IGNORECASE)) for p in patterns)
+
+
 def evaluate_quality(
     item: dict[str, Any], *, rules: dict[str, Any] | None = None
 ) -> QualityResult:
@@ -119,8 +128,9 @@ def evaluate_quality(
     # anti-bot / blocked page patterns
     patterns = rules.get("block_patterns") or _DEFAULT_BLOCK_PATTERNS
     try:
-        for p in patterns:
-            if re.search(p, text.lower(), flags=re.IGNORECASE):
+        text_lower = text.lower()
+        for p, rx in _compile_block_patterns(tuple(patterns)):
+            if rx.search(text_lower):
                 issues.append(
                     QualityIssue("error", "blocked_page", f"Matched block pattern: {p}")
                 )
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import re
 
-from .results import BlockSignal
+from .results import BlockSignal, FetchResult
 
 _PATTERNS = {
     BlockSignal.CAPTCHA_PRESENT: [
@@ -43,3 +43,14 @@ def classify_blocks(text: str | None) -> list[BlockSignal]:
                 signals.append(signal)
                 break
     return signals
+
+
+_THROTTLE_STATUS = (403, 429)
+_THROTTLE_SIGNALS = (BlockSignal.CAPTCHA_PRESENT, BlockSignal.LIKELY_BLOCKED)
+
+
+def is_throttled(result: FetchResult) -> bool:
+    """Return True when a response shows the host is rate-limiting or blocking us."""
+    if result.status_code in _THROTTLE_STATUS:
+        return True
+    return any(s in _THROTTLE_SIGNALS for s in result.block_signals)
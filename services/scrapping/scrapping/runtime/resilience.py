@@ -1,13 +1,15 @@
 """scrapping.runtime.resilience.
 
-Shared resilience utilities: retries, rate limiting.
+Shared resilience utilities: retries, rate limiting, per-host throttling.
 """
 
 from __future__ import annotations
 
 import asyncio
 import random
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
 
@@ -39,7 +41,12 @@ class RetryPolicy:
 
 
 class RateLimiter:
-    """Simple process-local leaky bucket."""
+    """Process-local token bucket with an optional minimum delay between calls.
+
+    Each call reserves the next free slot under a lock and then sleeps until
+    that slot, so concurrent callers (threads or tasks) get distinct slots and
+    idle time accumulates up to `burst` tokens.
+    """
 
     def __init__(
         self,
@@ -50,62 +57,158 @@ class RateLimiter:
         burst: int | None = None,
     ) -> None:
         """Initialize the instance."""
-        self.rps = rps
+        self._lock = threading.Lock()
+        self._rps = rps
         self.min_delay_s = min_delay_s or 0.0
         self.jitter_s = jitter_s or 0.0
         self.burst = burst or 1
 
-        self._last_call_s: float = 0.0
+        self._last_call_s: float = float("-inf")
         self._tokens: float = float(self.burst)
-        self._last_refill_s: float = time.time()
+        self._last_refill_s: float = time.monotonic()
+
+    @property
+    def rps(self) -> float | None:
+        """Requests per second allowed by the bucket (None disables it)."""
+        return self._rps
+
+    @rps.setter
+    def rps(self, value: float | None) -> None:
+        # Taken under our own lock so a rate change never lands mid-reservation
+        with self._lock:
+            self._rps = value
+
+    def _reserve(self) -> float:
+        """Claim the next call slot and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            # Enforce min delay + jitter between calls
+            target_delay = self.min_delay_s + (
+                random.random() * self.jitter_s if self.jitter_s else 0.0
+            )
+            start = max(now, self._last_call_s + target_delay)
+
+            # Token bucket throttle (if rps set)
+            if self._rps and self._rps > 0:
+                rps = float(self._rps)
+                self._tokens = min(
+                    float(self.burst),
+                    self._tokens + (start - self._last_refill_s) * rps,
+                )
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                else:
+                    # Start once the missing fraction of a token has refilled
+                    start += (1.0 - self._tokens) / rps
+                    self._tokens = 0.0
+                self._last_refill_s = start
 
-    def _refill(self) -> None:
-        now = time.time()
-        if self.rps and self.rps > 0:
-            dt = now - self._last_refill_s
-            self._tokens = min(float(self.burst), self._tokens + dt * float(self.rps))
-        self._last_refill_s = now
+            self._last_call_s = start
+            return start - now
 
     def wait(self) -> None:
         """Wait to enforce rate limiting before the next call."""
-        # Enforce min delay + jitter between calls
-        now = time.time()
-        since_last = now - self._last_call_s
-        target_delay = self.min_delay_s + (
-            random.random() * self.jitter_s if self.jitter_s else 0.0
-        )
-        if target_delay > since_last:
-            time.sleep(target_delay - since_last)
-
-        # Token bucket throttle (if rps set)
-        if self.rps and self.rps > 0:
-            while True:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    break
-                time.sleep(0.05)
-
-        self._last_call_s = time.time()
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
 
     async def await_wait(self) -> None:
         """Wait asynchronously to enforce rate limiting before the next call."""
-        # Enforce min delay + jitter between calls
-        now = time.time()
-        since_last = now - self._last_call_s
-        target_delay = self.min_delay_s + (
-            random.random() * self.jitter_s if self.jitter_s else 0.0
-        )
-        if target_delay > since_last:
-            await asyncio.sleep(target_delay - since_last)
-
-        # Token bucket throttle (if rps set)
-        if self.rps and self.rps > 0:
-            while True:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    break
-                await asyncio.sleep(0.05)
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class _HostState:
+    limiter: RateLimiter
+    consecutive_blocks: int = 0
+    ok_streak: int = 0
+    open_until: float = 0.0
+
 
-        self._last_call_s = time.time()
+class HostThrottle:
+    """Per-host rate limiters that adapt to blocks, with a per-host circuit breaker.
+
+    Every host gets its own RateLimiter built from the shared settings. A
+    throttled response (429/403, captcha, access denied) halves that host's
+    rate; `recover_after` clean responses in a row raise it by 10% again, up
+    to the configured rps. After `breaker_threshold` throttled responses in a
+    row the host is skipped for `breaker_cooldown_s`.
+    """
+
+    def __init__(
+        self,
+        *,
+        rps: float | None = None,
+        burst: int | None = None,
+        min_delay_s: float | None = None,
+        jitter_s: float | None = None,
+        breaker_threshold: int = 5,
+        breaker_cooldown_s: float = 60.0,
+        recover_after: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the instance."""
+        self.rps = rps
+        self.burst = burst
+        self.min_delay_s = min_delay_s
+        self.jitter_s = jitter_s
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown_s = breaker_cooldown_s
+        self.recover_after = recover_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            with self._lock:
+                state = self._hosts.setdefault(
+                    host,
+                    _HostState(
+                        limiter=RateLimiter(
+                            rps=self.rps,
+                            burst=self.burst,
+                            min_delay_s=self.min_delay_s,
+                            jitter_s=self.jitter_s,
+                        )
+                    ),
+                )
+        return state
+
+    def limiter(self, host: str) -> RateLimiter:
+        """Return the rate limiter for a host."""
+        return self._state(host).limiter
+
+    def is_open(self, host: str) -> bool:
+        """Return True while requests to the host should be skipped."""
+        return self._clock() < self._state(host).open_until
+
+    def record(self, host: str, *, throttled: bool) -> None:
+        """Adjust the host's rate and breaker from one response."""
+        state = self._state(host)
+        limiter = state.limiter
+        with self._lock:
+            if not throttled:
+                state.consecutive_blocks = 0
+                state.ok_streak += 1
+                if (
+                    self.rps
+                    and limiter.rps
+                    and limiter.rps < self.rps
+                    and state.ok_streak >= self.recover_after
+                ):
+                    limiter.rps = min(float(self.rps), limiter.rps * 1.1)
+                    state.ok_streak = 0
+                return
+
+            state.ok_streak = 0
+            state.consecutive_blocks += 1
+            if self.rps and limiter.rps:
+                # Floor keeps a long block streak from stalling the host for hours
+                limiter.rps = max(float(self.rps) / 32, limiter.rps / 2)
+            if state.consecutive_blocks >= self.breaker_threshold:
+                state.open_until = self._clock() + self.breaker_cooldown_s
+                state.consecutive_blocks = 0
@@ -0,0 +1,35 @@
+import time
+
+from scrapping.engines.base import EngineContext
+from scrapping.extraction.link_extractors import LinkExtractRequest, extract_links
+from scrapping.pipeline.stages import fetch_pages
+from scrapping.runtime.results import FetchResult
+
+
+class _RedirectingEngine:
+    """Every URL redirects elsewhere; earlier URLs take longer to answer."""
+
+    def get(self, url, *, ctx=None):
+        time.sleep(0.01 * (3 - int(url[-1])))
+        return FetchResult(final_url=f"{url}/moved", status_code=200)
+
+
+def test_fetch_pages_keeps_input_order_across_redirects():
+    urls = [f"https://example.com/{i}" for i in range(3)]
+    results = fetch_pages(
+        urls, engine=_RedirectingEngine(), ctx=EngineContext(), parallelism=3
+    )
+    assert [r.final_url for r in results] == [f"{u}/moved" for u in urls]
+
+
+def test_extract_links_dedupes_repeated_hrefs_in_order():
+    html = (
+        '<a href="/e/2?utm_source=x">'
+        '<a href="/e/1"><a href="/e/2?utm_source=x"><a href="/e/2">'
+    )
+    links = extract_links(
+        LinkExtractRequest(
+            html=html, base_url="https://Example.com", pattern=r'href="([^"]+)"'
+        )
+    )
+    assert links == ["https://example.com/e/2", "https://example.com/e/1"]
@@ -32,3 +32,24 @@ def test_html_to_structured_empty():
     res = html_to_structured("   ")
     assert res.ok is False
     assert res.error == "empty_html"
+
+
+def test_quality_filters_custom_block_patterns():
+    item = {"text": "Please SOLVE the Puzzle to continue", "title": "Check"}
+    q = evaluate_quality(item, rules={"min_text_len": 5, "block_patterns": ["Puzzle"]})
+    assert any(i.message == "Matched block pattern: Puzzle" for i in q.issues)
+
+    q = evaluate_quality(item, rules={"min_text_len": 5, "block_patterns": ["("]})
+    assert q.keep is True
+    assert any(i.code == "bad_block_patterns" for i in q.issues)
+
+
+def test_trafilatura_is_loaded_once():
+    from scrapping.extraction import parsers
+
+    parsers._load_trafilatura.cache_clear()
+    parsers.extract_structured_trafilatura("<html><p>a</p></html>")
+    parsers.extract_structured_trafilatura("<html><p>b</p></html>")
+
+    info = parsers._load_trafilatura.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -1,7 +1,7 @@
 import time
 
-from scrapping.runtime.blocks import classify_blocks
-from scrapping.runtime.resilience import RateLimiter, RetryPolicy
+from scrapping.runtime.blocks import classify_blocks, is_throttled
+from scrapping.runtime.resilience import HostThrottle, RateLimiter, RetryPolicy
 from scrapping.runtime.results import EngineError, FetchResult
 
 
@@ -54,3 +54,89 @@ def test_block_detection():
 
     signals = classify_blocks("Please login to continue")
     assert "login_required" in [s.value for s in signals]
+
+
+def test_rate_limiter_bursts_then_paces():
+    limiter = RateLimiter(rps=20, burst=3)
+    delays = [limiter._reserve() for _ in range(5)]
+    # Burst tokens go out immediately, the rest are spaced 1/rps apart
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert 0.04 <= delays[3] <= 0.06
+    assert 0.09 <= delays[4] <= 0.11
+
+
+def test_host_throttle_backs_off_and_opens_breaker():
+    now = [0.0]
+    throttle = HostThrottle(
+        rps=8,
+        breaker_threshold=3,
+        breaker_cooldown_s=60,
+        recover_after=2,
+        clock=lambda: now[0],
+    )
+
+    throttle.record("a.com", throttled=True)
+    assert throttle.limiter("a.com").rps == 4
+    assert throttle.limiter("b.com").rps == 8  # other hosts unaffected
+
+    throttle.record("a.com", throttled=False)
+    throttle.record("a.com", throttled=False)
+    assert throttle.limiter("a.com").rps == 4.4
+
+    for _ in range(3):
+        throttle.record("a.com", throttled=True)
+    assert throttle.is_open("a.com")
+    assert not throttle.is_open("b.com")
+    now[0] = 61.0
+    assert not throttle.is_open("a.com")
+
+
+def test_is_throttled():
+    assert is_throttled(FetchResult(final_url="http://a", status_code=429))
+    assert not is_throttled(FetchResult(final_url="http://a", status_code=404))
+    blocked = FetchResult(final_url="http://a", status_code=200)
+    blocked.block_signals = classify_blocks("Access Denied")
+    assert is_throttled(blocked)
+
+
+def test_rate_limiter_rps_setter_waits_for_reservation_lock():
+    import threading
+
+    limiter = RateLimiter(rps=10)
+    with limiter._lock:
+        setter = threading.Thread(target=setattr, args=(limiter, "rps", 5.0))
+        setter.start()
+        setter.join(timeout=0.05)
+        assert setter.is_alive()
+        assert limiter.rps == 10
+    setter.join(timeout=1)
+    assert limiter.rps == 5.0
+
+
+def test_http_engine_stops_retrying_once_breaker_opens(monkeypatch):
+    import requests
+
+    from scrapping.engines.http import HttpEngine, HttpEngineOptions
+
+    engine = HttpEngine(
+        options=HttpEngineOptions(
+            max_retries=5, backoff_mode="none", breaker_threshold=2
+        )
+    )
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        resp = requests.Response()
+        resp.status_code = 429
+        resp.url = url
+        resp._content = b""
+        return resp
+
+    monkeypatch.setattr(engine._session, "get", fake_get)
+    result = engine.get("http://a.com/page")
+
+    assert len(calls) == 2
+    assert result.error is not None
+    assert result.error.type == "CircuitOpen"
+    assert [t["status"] for t in result.engine_trace] == [429, 429]
@@ -4,12 +4,18 @@ Unit tests for agents core utilities.
 Covers:
   - agents/base/task.py         — AgentTask / AgentResult dataclasses
   - agents/base/output_models.py — Pydantic extraction schemas
-  - agents/base/base_agent.py   — BaseAgent helper methods (_chunk, context builders)
+  - agents/base/base_agent.py   — BaseAgent helper methods (_chunk, _gather_bounded, context builders)
   - agents/validation/confidence.py — confidence scoring and flagging
+  - agents/validation/schema_validator.py — taxonomy enum validation
+  - agents/registry/agent_registry.py — agent class resolution
   - agents/llm/provider_router.py   — LLM client factory routing
+  - agents/llm/circuit_breaker.py   — per-provider circuit breaker
+  - agents/llm/batch_client.py      — provider batch-API mode
 """
 
+import asyncio
 import json
+from types import SimpleNamespace
 
 import pytest
 
@@ -37,6 +43,7 @@ class TestAgentTask:
         assert task.prompt_version == "active"
         assert task.priority == 1
         assert task.retry_limit == 2
+        assert task.max_concurrency == 1
         assert task.metadata == {}
 
     def test_custom_values(self):
@@ -101,6 +108,22 @@ class TestAgentResult:
         assert result.duration_seconds == 1.23
 
 
+class TestTokenUsage:
+    """Tests for the TokenUsage accumulator."""
+
+    def test_iadd_and_dict_round_trip(self):
+        """+= should sum each count; to_dict() should mirror from_dict()."""
+        from src.agents.base.task import TokenUsage
+
+        usage = {"prompt_tokens": 100, "completion_tokens": 50, "total": 150}
+        total = TokenUsage()
+        total += TokenUsage.from_dict(usage)
+        total += TokenUsage.from_dict({"total": 5})
+
+        assert total == TokenUsage(prompt=100, completion=50, total=155)
+        assert TokenUsage.from_dict(usage).to_dict() == usage
+
+
 # =============================================================================
 # AGENTS/BASE/OUTPUT_MODELS.PY
 # =============================================================================
@@ -265,6 +288,60 @@ class TestBaseAgentChunk:
         assert chunks == [[1, 2]]
 
 
+class TestBaseAgentGatherBounded:
+    """Tests for BaseAgent._gather_bounded."""
+
+    @staticmethod
+    def _run(concrete_agent, items, max_concurrency):
+        state = {"active": 0, "peak": 0}
+
+        async def worker(item):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later items finish first to prove ordering is by input, not completion
+            await asyncio.sleep(0.001 * (len(items) - item))
+            state["active"] -= 1
+            return item * 10
+
+        results = asyncio.run(
+            concrete_agent._gather_bounded(items, worker, max_concurrency)
+        )
+        return results, state["peak"]
+
+    def test_sequential_by_default(self, concrete_agent):
+        """max_concurrency=1 should behave like a plain loop."""
+        results, peak = self._run(concrete_agent, [0, 1, 2], 1)
+        assert results == [0, 10, 20]
+        assert peak == 1
+
+    def test_bounded_and_ordered(self, concrete_agent):
+        """Should never exceed max_concurrency and keep input order."""
+        results, peak = self._run(concrete_agent, list(range(8)), 3)
+        assert results == [i * 10 for i in range(8)]
+        assert peak == 3
+
+    def test_shared_limiter_bounds_concurrent_calls(self, concrete_agent):
+        """Two gathers sharing a limiter should stay within its combined bound."""
+        state = {"active": 0, "peak": 0}
+
+        async def worker(item):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.001)
+            state["active"] -= 1
+            return item
+
+        async def _both():
+            limiter = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                concrete_agent._gather_bounded([0, 1, 2], worker, 2, limiter=limiter),
+                concrete_agent._gather_bounded([3, 4, 5], worker, 2, limiter=limiter),
+            )
+
+        assert asyncio.run(_both()) == [[0, 1, 2], [3, 4, 5]]
+        assert state["peak"] == 2
+
+
 class TestBaseAgentContextBuilders:
     """Tests for BaseAgent._build_event_context and _build_batch_context."""
 
@@ -307,6 +384,14 @@ class TestBaseAgentContextBuilders:
         assert all("source_event_id" in item for item in items)
         assert items[0]["title"] == "Event 0"
 
+    def test_dumps_items_one_item_per_line(self, concrete_agent):
+        """Prompt JSON should round-trip and put each item on its own line."""
+        items = [{"title": "Café"}, {"title": "B", "tags": ["x"]}]
+        text = concrete_agent._dumps_items(items)
+        assert json.loads(text) == items
+        assert text.splitlines()[1] == '{"title": "Café"},'
+        assert concrete_agent._dumps_items([]) == "[]"
+
     def test_build_batch_context_empty(self, concrete_agent):
         """Empty event list should produce zero count and empty JSON array."""
         ctx = concrete_agent._build_batch_context([])
@@ -358,6 +443,44 @@ class TestComputeConfidenceScore:
         assert isinstance(score, float)
 
 
+class TestComputeConfidenceBatch:
+    """Tests for compute_confidence_batch."""
+
+    def test_matches_per_event_scores(self, create_event):
+        """Vectorized scores should equal compute_confidence_score per event."""
+        from src.agents.validation.confidence import (
+            compute_confidence_batch,
+            compute_confidence_score,
+        )
+        from src.schemas.event import TaxonomyDimension
+
+        events = [
+            create_event(),
+            create_event(tags=["jazz"]),
+            create_event(
+                tags=["techno"],
+                taxonomy_dimension=TaxonomyDimension(
+                    primary_category="1", energy_level="high"
+                ),
+            ),
+        ]
+        agent_scores = {
+            str(events[1].source.source_event_id): {"a": 0.9, "b": 0.5},
+        }
+        scores = compute_confidence_batch(events, agent_scores)
+        expected = [
+            compute_confidence_score(e, agent_scores.get(str(e.source.source_event_id)))
+            for e in events
+        ]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_empty_batch(self):
+        """Empty input should produce an empty array."""
+        from src.agents.validation.confidence import compute_confidence_batch
+
+        assert compute_confidence_batch([]).shape == (0,)
+
+
 class TestFlagLowConfidence:
     """Tests for flag_low_confidence."""
 
@@ -402,6 +525,159 @@ class TestFlagLowConfidence:
         assert len(flagged) == 1
 
 
+# =============================================================================
+# AGENTS/VALIDATION/SCHEMA_VALIDATOR.PY
+# =============================================================================
+
+
+def _validator_event(event_id="e1", **taxonomy):
+    """Minimal object exposing the attributes SchemaValidator reads."""
+    fields = {
+        "energy_level": None,
+        "social_intensity": None,
+        "cognitive_load": None,
+        "physical_involvement": None,
+        "environment": None,
+        "risk_level": None,
+        "age_accessibility": None,
+        "repeatability": None,
+        "cost_level": None,
+        "time_scale": None,
+        "emotional_output": None,
+    }
+    fields.update(taxonomy)
+    return SimpleNamespace(source_event_id=event_id, taxonomy=SimpleNamespace(**fields))
+
+
+class TestSchemaValidator:
+    """Tests for SchemaValidator."""
+
+    def test_valid_event_has_no_errors(self):
+        """Allowed enum values should pass."""
+        from src.agents.validation.schema_validator import SchemaValidator
+
+        event = _validator_event(energy_level="high", time_scale="short")
+        assert SchemaValidator().validate_event(event) == []
+
+    def test_invalid_enum_values_reported(self):
+        """Each out-of-contract value should produce one error."""
+        from src.agents.validation.schema_validator import SchemaValidator
+
+        event = _validator_event(energy_level="extreme", cost_level="priceless")
+        errors = SchemaValidator().validate_event(event)
+        assert errors == [
+            "taxonomy.energy_level='extreme' not in ['high', 'low', 'medium']",
+            "taxonomy.cost_level='priceless' not in ['free', 'high', 'low', 'medium']",
+        ]
+
+    def test_validate_batch_keys_by_event_id(self):
+        """Only events with errors should appear in the batch result."""
+        from src.agents.validation.schema_validator import SchemaValidator
+
+        events = [
+            _validator_event("ok"),
+            _validator_event("bad", emotional_output=["joy", ""]),
+        ]
+        assert SchemaValidator().validate_batch(events) == {
+            "bad": ["taxonomy.emotional_output contains invalid entries"]
+        }
+
+    def test_validate_batch_async_matches_sync(self):
+        """Chunked async validation should merge to the same result."""
+        from src.agents.validation.schema_validator import SchemaValidator
+
+        events = [
+            _validator_event(f"e{i}", risk_level="high" if i % 3 else None)
+            for i in range(10)
+        ]
+        validator = SchemaValidator()
+        result = asyncio.run(validator.validate_batch_async(events, chunk_size=4))
+        assert result == validator.validate_batch(events)
+        assert len(result) == 6
+
+
+# =============================================================================
+# AGENTS/REGISTRY/AGENT_REGISTRY.PY
+# =============================================================================
+
+
+class TestAgentRegistryResolveClass:
+    """Tests for agent_registry._resolve_class."""
+
+    def test_resolves_and_memoizes_class(self):
+        """Registered names should resolve to the agent class, imported once."""
+        from src.agents.enrichment.deduplication_agent import DeduplicationAgent
+        from src.agents.registry.agent_registry import _resolve_class
+
+        assert _resolve_class("deduplication") is DeduplicationAgent
+        assert _resolve_class.cache_info().currsize >= 1
+
+    def test_unknown_agent_raises(self):
+        """Unregistered names should raise ValueError."""
+        from src.agents.registry.agent_registry import AgentRegistry
+
+        with pytest.raises(ValueError, match="Unknown agent"):
+            AgentRegistry().get("nope", {})
+
+    def test_warm_instantiates_and_preloads_enabled_agents(self, monkeypatch):
+        """warm() should cache enabled agent instances and preload their prompts."""
+        from src.agents.registry import prompt_registry
+        from src.agents.registry.agent_registry import AgentRegistry
+
+        preloaded: list[str] = []
+        fake_prompts = SimpleNamespace(preload=preloaded.append)
+        monkeypatch.setattr(
+            prompt_registry, "get_prompt_registry", lambda: fake_prompts
+        )
+
+        registry = AgentRegistry()
+        registry.warm(
+            {"agents": {"emotion_mapper": {"enabled": False}}},
+            ["deduplication", "emotion_mapper"],
+        )
+
+        assert list(registry._instances) == ["deduplication"]
+        assert preloaded == ["deduplication"]
+
+    def test_warm_warns_on_missing_prompt_and_continues(self, monkeypatch, caplog):
+        """A missing prompt file should be logged as a warning, not raised."""
+        from src.agents.registry import prompt_registry
+        from src.agents.registry.agent_registry import AgentRegistry
+
+        def _preload(prompt_name):
+            raise FileNotFoundError(f"{prompt_name}/manifest.yaml")
+
+        monkeypatch.setattr(
+            prompt_registry,
+            "get_prompt_registry",
+            lambda: SimpleNamespace(preload=_preload),
+        )
+
+        registry = AgentRegistry()
+        with caplog.at_level("WARNING"):
+            registry.warm({}, ["deduplication"])
+
+        assert list(registry._instances) == ["deduplication"]
+        assert "could not warm 'deduplication'" in caplog.text
+
+    def test_warm_raises_on_unexpected_errors(self, monkeypatch):
+        """Errors other than missing dependencies or files should propagate."""
+        from src.agents.registry import prompt_registry
+        from src.agents.registry.agent_registry import AgentRegistry
+
+        def _preload(prompt_name):
+            raise KeyError(prompt_name)
+
+        monkeypatch.setattr(
+            prompt_registry,
+            "get_prompt_registry",
+            lambda: SimpleNamespace(preload=_preload),
+        )
+
+        with pytest.raises(KeyError):
+            AgentRegistry().warm({}, ["deduplication"])
+
+
 # =============================================================================
 # AGENTS/LLM/PROVIDER_ROUTER.PY
 # =============================================================================
@@ -464,3 +740,220 @@ class TestGetLLMClient:
 
         client = get_llm_client(provider="Anthropic")
         assert isinstance(client, AnthropicLLMClient)
+
+
+# =============================================================================
+# AGENTS/LLM/CIRCUIT_BREAKER.PY
+# =============================================================================
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for the per-provider CircuitBreaker."""
+
+    def _breaker(self, clock):
+        from src.agents.llm.circuit_breaker import CircuitBreaker
+
+        return CircuitBreaker("test", failure_threshold=3, clock=clock)
+
+    def test_opens_after_threshold_failures(self):
+        """Breaker should open once failures reach the threshold."""
+        breaker = self._breaker(_FakeClock())
+        for _ in range(2):
+            breaker.record_failure()
+        assert not breaker.is_open
+        breaker.record_failure()
+        assert breaker.is_open
+
+    def test_failures_outside_window_expire(self):
+        """Failures older than the window should not count."""
+        clock = _FakeClock()
+        breaker = self._breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 61.0
+        breaker.record_failure()
+        assert not breaker.is_open
+
+    def test_success_resets_count(self):
+        """A successful call should reset the consecutive-failure count."""
+        breaker = self._breaker(_FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
+
+    def test_half_open_after_cooldown(self):
+        """After cooldown one trial is allowed; a failure reopens immediately."""
+        clock = _FakeClock()
+        breaker = self._breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        assert not breaker.is_open
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow_request()
+
+    def test_half_open_admits_a_single_trial(self):
+        """Only the first caller after cooldown is admitted until it reports."""
+        clock = _FakeClock()
+        breaker = self._breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        assert breaker.is_open
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.allow_request()
+
+    def test_is_open_does_not_change_state(self):
+        """Reading is_open after cooldown must not consume the trial slot."""
+        clock = _FakeClock()
+        breaker = self._breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        for _ in range(3):
+            assert not breaker.is_open
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+    def test_stalled_trial_is_replaced_after_cooldown(self):
+        """A trial that never reports back does not keep the breaker open forever."""
+        clock = _FakeClock()
+        breaker = self._breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        assert breaker.allow_request()
+        clock.now = 60.0
+        assert breaker.allow_request()
+
+    def test_open_breaker_marks_client_unavailable(self, monkeypatch):
+        """Clients should report unavailable while their provider breaker is open."""
+        from src.agents.llm import circuit_breaker
+        from src.agents.llm.anthropic_client import AnthropicLLMClient
+
+        monkeypatch.setattr(circuit_breaker, "_breakers", {})
+        client = AnthropicLLMClient(api_key="test-key")
+        assert client.is_available
+        for _ in range(5):
+            client._breaker.record_failure()
+        assert not client.is_available
+
+
+# =============================================================================
+# AGENTS/LLM/BATCH_CLIENT.PY
+# =============================================================================
+
+
+class _FakeBatchProvider:
+    """Stand-in provider client: answers each request with its user prompt."""
+
+    provider = "fake"
+    supports_batch = True
+    is_available = True
+
+    def __init__(self, pending_polls=1):
+        from src.agents.llm.circuit_breaker import CircuitBreaker
+
+        self.submitted: list[list[str]] = []
+        self.max_tokens_seen: list[int] = []
+        self._pending_polls = pending_polls
+        self._breaker = CircuitBreaker("fake")
+
+    def _record_call_error(self, exc):
+        self._breaker.record_failure()
+
+    async def submit_batch(self, requests):
+        self.submitted.append([r.custom_id for r in requests])
+        self.max_tokens_seen.extend(r.max_tokens for r in requests)
+        self._requests = requests
+        return f"job-{len(self.submitted)}"
+
+    async def fetch_batch(self, job_id):
+        from src.agents.llm.batch_client import BatchOutcome
+
+        if self._pending_polls:
+            self._pending_polls -= 1
+            return None
+        return {
+            r.custom_id: BatchOutcome(
+                data={"tags": [r.user_prompt]}, usage={"total": 2}
+            )
+            for r in self._requests
+            if r.user_prompt != "missing"
+        }
+
+
+class TestBatchLLMClient:
+    """Tests for BatchLLMClient request collection and result mapping."""
+
+    def _client(self, provider):
+        from src.agents.llm.batch_client import BatchLLMClient
+
+        return BatchLLMClient(
+            provider, collect_seconds=0, poll_initial_seconds=0, poll_max_seconds=0
+        )
+
+    def test_concurrent_calls_share_one_job(self):
+        """Concurrent structured calls should be submitted together and mapped back."""
+        from src.agents.base.output_models import MissingFieldsExtraction
+
+        provider = _FakeBatchProvider()
+        client = self._client(provider)
+
+        async def _call(prompt):
+            result = await client.complete_structured(
+                "sys", prompt, MissingFieldsExtraction
+            )
+            return result.tags, client.get_token_usage()
+
+        async def _main():
+            return await asyncio.gather(*(_call(p) for p in ("1", "2", "3")))
+
+        results = asyncio.run(_main())
+
+        assert results == [([p], {"total": 2}) for p in ("1", "2", "3")]
+        assert provider.submitted == [["req-0", "req-1", "req-2"]]
+        assert client.job_ids == ["job-1"]
+
+    def test_explicit_max_tokens_kept(self):
+        """max_tokens=0 is an explicit value, not a cue to use the client default."""
+        from src.agents.base.output_models import MissingFieldsExtraction
+
+        provider = _FakeBatchProvider(pending_polls=0)
+        client = self._client(provider)
+
+        async def _main():
+            await client.complete_structured(
+                "sys", "1", MissingFieldsExtraction, max_tokens=0
+            )
+            await client.complete_structured("sys", "2", MissingFieldsExtraction)
+
+        asyncio.run(_main())
+
+        assert provider.max_tokens_seen == [0, 2000]
+
+    def test_missing_result_raises(self):
+        """A request without a result should raise so the agent records an error."""
+        from src.agents.base.output_models import MissingFieldsExtraction
+
+        client = self._client(_FakeBatchProvider(pending_polls=0))
+
+        with pytest.raises(RuntimeError, match="no result"):
+            asyncio.run(
+                client.complete_structured("sys", "missing", MissingFieldsExtraction)
+            )
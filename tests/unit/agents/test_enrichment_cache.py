@@ -0,0 +1,576 @@
+"""
+Unit tests for per-event enrichment caching.
+
+Covers:
+  - agents/cache/enrichment_cache.py      — fingerprinting, LRU, deltas
+  - agents/orchestration/agent_runner.py  — grouping, length ordering, cache hits,
+                                            windowed pipeline, batch-API mode,
+                                            input projection
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from src.agents.base.base_agent import BaseAgent
+from src.agents.base.task import AgentResult, AgentTask
+from src.agents.cache.enrichment_cache import EnrichmentCache, field_delta
+from src.agents.orchestration.agent_runner import BatchEnrichmentRunner
+
+# =============================================================================
+# AGENTS/CACHE/ENRICHMENT_CACHE.PY
+# =============================================================================
+
+
+class TestEnrichmentCache:
+    """Tests for EnrichmentCache."""
+
+    def test_fingerprint_ignores_ids_and_dates(self, create_event):
+        """Occurrences of a recurring event should share a fingerprint."""
+        a = create_event(title="Weekly Jazz")
+        b = create_event(
+            title="Weekly Jazz", start_datetime=datetime(2024, 6, 22, 20, tzinfo=UTC)
+        )
+        c = create_event(title="Other Night")
+        assert EnrichmentCache.fingerprint(a) == EnrichmentCache.fingerprint(b)
+        assert EnrichmentCache.fingerprint(a) != EnrichmentCache.fingerprint(c)
+
+    def test_put_get_apply(self, create_event):
+        """Changed fields should be replayed onto a matching event."""
+        cache = EnrichmentCache()
+        before = create_event(title="Weekly Jazz")
+        after = before.model_copy(update={"tags": ["jazz"]})
+        fp = EnrichmentCache.fingerprint(before)
+        cache.put("feature_alignment", "v1", fp, field_delta(before, after))
+
+        other = create_event(title="Weekly Jazz")
+        other_fp = EnrichmentCache.fingerprint(other)
+        delta = cache.get("feature_alignment", "v1", other_fp)
+        assert delta == {"tags": ["jazz"]}
+        patched = cache.apply(other, delta)
+        assert patched.tags == ["jazz"]
+        assert patched.event_id == other.event_id
+
+        assert cache.get("feature_alignment", "v2", other_fp) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_unchanged_events_not_cached(self, create_event):
+        """An agent that changed nothing should not poison the cache."""
+        cache = EnrichmentCache()
+        event = create_event()
+        delta = field_delta(event, event)
+        assert delta == {}
+        cache.put("feature_alignment", "v1", EnrichmentCache.fingerprint(event), delta)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, create_event):
+        """Oldest entries should be evicted past max_entries."""
+        cache = EnrichmentCache(max_entries=1)
+        cache.put("x", "v1", "fp-a", {"tags": ["a"]})
+        cache.put("x", "v1", "fp-b", {"tags": ["b"]})
+        assert len(cache) == 1
+        assert cache.get("x", "v1", "fp-a") is None
+        assert cache.get("x", "v1", "fp-b") == {"tags": ["b"]}
+
+
+# =============================================================================
+# AGENTS/ORCHESTRATION/AGENT_RUNNER.PY
+# =============================================================================
+
+
+class _TaggingAgent(BaseAgent):
+    name = "tagging"
+    prompt_name = "tagging"
+
+    def __init__(self, name="tagging"):
+        self.name = name
+        self.seen: list[int] = []
+        self.titles: list[str] = []
+
+    async def run(self, task: AgentTask) -> AgentResult:
+        self.seen.append(len(task.events))
+        self.titles.extend(e.title for e in task.events)
+        return AgentResult(
+            agent_name=self.name,
+            prompt_name=self.prompt_name,
+            prompt_version="v1",
+            events=[
+                e.model_copy(update={"tags": [*e.tags, e.title]}) for e in task.events
+            ],
+            token_usage={"total": 1},
+        )
+
+
+class _BatchAgent(BaseAgent):
+    name = "batch"
+    prompt_name = "batch"
+    cacheable = False
+
+    def __init__(self):
+        self.seen: list[int] = []
+
+    async def run(self, task: AgentTask) -> AgentResult:
+        self.seen.append(len(task.events))
+        return AgentResult(
+            agent_name=self.name,
+            prompt_name=self.prompt_name,
+            prompt_version="v1",
+            events=task.events,
+        )
+
+
+@pytest.fixture
+def make_runner(monkeypatch):
+    monkeypatch.setattr(BatchEnrichmentRunner, "_build_chain", lambda self: [])
+
+    def _make(agent, enabled=True, agents=None, stream_window=0):
+        runner = BatchEnrichmentRunner(
+            {
+                "global": {
+                    "enrichment_cache": {"enabled": enabled},
+                    "stream_window": stream_window,
+                },
+                "agents": agents or {},
+            }
+        )
+        runner._agent_chain = agent if isinstance(agent, list) else [agent]
+        return runner
+
+    return _make
+
+
+class TestRunnerCache:
+    """Tests for BatchEnrichmentRunner's enrichment cache integration."""
+
+    def test_repeated_content_skips_agent(self, make_runner, create_event):
+        """Second run with the same content should be served from the cache."""
+        agent = _TaggingAgent()
+        runner = make_runner(agent)
+
+        first = asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+        events = [create_event(title="B"), create_event(title="A")]
+        second = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert agent.seen == [1, 1]
+        assert first.events[0].tags == ["A"]
+        assert [e.tags for e in second.events] == [["B"], ["A"]]
+        assert [e.event_id for e in second.events] == [e.event_id for e in events]
+
+    def test_identical_events_in_batch_run_once(self, make_runner, create_event):
+        """Duplicates within one batch should share a single agent input."""
+        agent = _TaggingAgent()
+        runner = make_runner(agent, enabled=False)
+        events = [
+            create_event(title="A"),
+            create_event(title="B"),
+            create_event(
+                title="A", start_datetime=datetime(2024, 6, 22, 20, tzinfo=UTC)
+            ),
+        ]
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert agent.seen == [2]
+        assert [e.tags for e in result.events] == [["A"], ["B"], ["A"]]
+        assert [e.event_id for e in result.events] == [e.event_id for e in events]
+        assert result.events[2].start_datetime == events[2].start_datetime
+
+    def test_in_place_agent_reaches_every_duplicate(self, make_runner, create_event):
+        """Enrichment an agent applies in place should fan out to all duplicates."""
+        agent = _InPlaceAgent()
+        runner = make_runner(agent, enabled=False)
+        events = [
+            create_event(title="A"),
+            create_event(title="A"),
+            create_event(title="A"),
+        ]
+
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert len(agent.seen_capacity) == 1
+        assert [e.tags for e in result.events] == [["tagged"]] * 3
+        assert [e.event_id for e in result.events] == [e.event_id for e in events]
+
+    def test_inputs_sorted_by_length_output_in_order(self, make_runner, create_event):
+        """Agents should see short prompts first; results keep input order."""
+        agent = _TaggingAgent()
+        runner = make_runner(agent, enabled=False)
+        events = [
+            create_event(title="long", description="x" * 300),
+            create_event(title="short"),
+            create_event(title="mid", description="x" * 50),
+        ]
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert agent.titles == ["short", "mid", "long"]
+        assert [e.tags for e in result.events] == [["long"], ["short"], ["mid"]]
+
+    def test_length_bucketing_can_be_disabled(self, make_runner, create_event):
+        """length_bucketing: false should keep the original dispatch order."""
+        agent = _TaggingAgent()
+        runner = make_runner(
+            agent, enabled=False, agents={"tagging": {"length_bucketing": False}}
+        )
+        events = [
+            create_event(title="long", description="x" * 300),
+            create_event(title="short"),
+        ]
+        asyncio.run(runner.run(events, prompt_version="v1"))
+        assert agent.titles == ["long", "short"]
+
+    def test_disabled_cache_calls_agent(self, make_runner, create_event):
+        """With the cache disabled the runner should call the agent every time."""
+        agent = _TaggingAgent()
+        runner = make_runner(agent, enabled=False)
+        for _ in range(2):
+            asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+        assert agent.seen == [1, 1]
+
+    def test_in_place_agent_output_replayed_from_cache(self, make_runner, create_event):
+        """A later run should reuse what an in-place agent produced."""
+        agent = _InPlaceAgent()
+        runner = make_runner(agent)
+
+        asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+        second = asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+
+        assert len(agent.seen_capacity) == 1
+        assert second.events[0].tags == ["tagged"]
+        assert runner._cache.hits == 1
+
+
+class _InPlaceAgent(BaseAgent):
+    """Mutates its input events in place, like the enrichment agents do."""
+
+    name = "in_place"
+    prompt_name = "in_place"
+
+    def __init__(self):
+        self.seen_capacity: list[int | None] = []
+
+    async def run(self, task: AgentTask) -> AgentResult:
+        for e in task.events:
+            self.seen_capacity.append(e.capacity)
+            e.tags = [*e.tags, "tagged"]
+        return AgentResult(
+            agent_name=self.name,
+            prompt_name=self.prompt_name,
+            prompt_version="v1",
+            events=task.events,
+        )
+
+
+class _ScoringAgent(_TaggingAgent):
+    """Tags events and scores each one by source_event_id."""
+
+    async def run(self, task: AgentTask) -> AgentResult:
+        result = await super().run(task)
+        result.confidence_scores = {
+            str(e.source.source_event_id): 0.7 for e in task.events
+        }
+        return result
+
+
+class TestRunnerConfidenceScores:
+    """Per-event confidence scores for grouped and cache-served events."""
+
+    def test_siblings_get_representative_score(self, make_runner, create_event):
+        """Every duplicate should carry the score of the event sent to the agent."""
+        agent = _ScoringAgent()
+        runner = make_runner(agent, enabled=False)
+        events = [create_event(title="A") for _ in range(3)]
+
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert agent.seen == [1]
+        assert result.agent_results[0].confidence_scores == {
+            str(e.source.source_event_id): 0.7 for e in events
+        }
+
+    def test_cache_served_events_keep_score(self, make_runner, create_event):
+        """Events served from the cache should get the cached score."""
+        agent = _ScoringAgent()
+        runner = make_runner(agent)
+        asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+
+        event = create_event(title="A")
+        result = asyncio.run(runner.run([event], prompt_version="v1"))
+
+        assert agent.seen == [1]
+        assert result.agent_results[0].confidence_scores == {
+            str(event.source.source_event_id): 0.7
+        }
+
+
+class TestRunnerProjection:
+    """Tests for private/projected agent inputs."""
+
+    def test_in_place_agent_fans_out_and_leaves_inputs(self, make_runner, create_event):
+        """Enrichment applied in place should reach duplicates, not the inputs."""
+        runner = make_runner(_InPlaceAgent())
+        events = [create_event(title="A"), create_event(title="A")]
+
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert [e.tags for e in result.events] == [["tagged"], ["tagged"]]
+        assert [e.tags for e in events] == [[], []]
+        assert len(runner._cache) == 1
+
+    def test_required_fields_blank_other_optional_fields(
+        self, make_runner, create_event
+    ):
+        """Undeclared fields should be hidden from the agent but kept on output."""
+        agent = _InPlaceAgent()
+        runner = make_runner(agent, agents={"in_place": {"required_fields": ["tags"]}})
+
+        result = asyncio.run(
+            runner.run([create_event(capacity=500)], prompt_version="v1")
+        )
+
+        assert agent.seen_capacity == [None]
+        assert result.events[0].capacity == 500
+        assert result.events[0].tags == ["tagged"]
+
+
+class TestRunnerStreaming:
+    """Tests for BatchEnrichmentRunner's windowed pipeline."""
+
+    def test_windows_flow_through_chain_in_order(self, make_runner, create_event):
+        """Each agent should see every window; output keeps input order."""
+        first, second, batch = (
+            _TaggingAgent("first"),
+            _TaggingAgent("second"),
+            _BatchAgent(),
+        )
+        runner = make_runner([first, second, batch], enabled=False, stream_window=2)
+        events = [create_event(title=f"E{i}") for i in range(5)]
+
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert first.seen == [2, 2, 1]
+        assert second.seen == [2, 2, 1]
+        assert batch.seen == [5]
+        assert [e.tags for e in result.events] == [[f"E{i}", f"E{i}"] for i in range(5)]
+        assert [r.agent_name for r in result.agent_results] == [
+            "first",
+            "second",
+            "batch",
+        ]
+        assert result.agent_results[0].token_usage == {"total": 3}
+        assert result.total_token_usage.total == 6
+
+    def test_agent_exception_passes_window_through(self, make_runner, create_event):
+        """A failing agent should record the error and leave events unchanged."""
+
+        class _Boom(_TaggingAgent):
+            async def run(self, task):
+                raise RuntimeError("boom")
+
+        runner = make_runner([_Boom("boom")], enabled=False, stream_window=1)
+        events = [create_event(title="A"), create_event(title="B")]
+        result = asyncio.run(runner.run(events, prompt_version="v1"))
+
+        assert [e.event_id for e in result.events] == [e.event_id for e in events]
+        assert len(result.errors_by_agent["boom"]) == 2
+        assert result.agent_results == []
+
+
+class TestRunnerTelemetry:
+    """Tests for the optional OTel instruments recorded per agent window."""
+
+    def test_records_tokens_and_duration(self, make_runner, create_event, monkeypatch):
+        """Each window should add token counts and one duration sample."""
+        from src.agents.orchestration import telemetry
+
+        class _Instrument:
+            def __init__(self):
+                self.calls = []
+
+            def add(self, value, attributes):
+                self.calls.append((value, attributes))
+
+            record = add
+
+        tokens, duration = _Instrument(), _Instrument()
+        monkeypatch.setattr(telemetry, "_tokens", tokens)
+        monkeypatch.setattr(telemetry, "_duration", duration)
+
+        class _Usage(_TaggingAgent):
+            async def run(self, task):
+                result = await super().run(task)
+                result.token_usage = {"prompt_tokens": 7, "completion_tokens": 3}
+                return result
+
+        runner = make_runner(_Usage(), enabled=False, stream_window=1)
+        asyncio.run(runner.run([create_event(title="A")], prompt_version="v1"))
+
+        assert [(v, a["token.type"]) for v, a in tokens.calls] == [
+            (7, "prompt_tokens"),
+            (3, "completion_tokens"),
+        ]
+        assert len(duration.calls) == 1
+        assert duration.calls[0][1] == {"agent": "tagging", "prompt_version": "v1"}
+
+
+class _DateAwareLLM:
+    """Scores each event by its date, like an audit flagging past dates."""
+
+    is_available = True
+
+    async def complete_structured(self, system_prompt, user_prompt, **kwargs):
+        import json
+
+        from src.agents.base.output_models import DataQualityAuditBatch
+
+        return DataQualityAuditBatch(
+            items=[
+                {
+                    "source_event_id": item["source_event_id"],
+                    "quality_score": 0.2 if item["start_datetime"] < "2025" else 0.9,
+                }
+                for item in json.loads(user_prompt)
+            ]
+        )
+
+    def get_token_usage(self):
+        return {}
+
+
+class TestDataQualityNotCached:
+    """data_quality output depends on dates, so it must not be shared."""
+
+    @pytest.fixture
+    def agent(self):
+        from types import SimpleNamespace
+
+        from src.agents.enrichment.data_quality_agent import DataQualityAgent
+
+        agent = DataQualityAgent.__new__(DataQualityAgent)
+        agent._config = {}
+        agent._llm = _DateAwareLLM()
+        agent._registry = SimpleNamespace(
+            get_active_version=lambda name: "v1",
+            render=lambda name, variables, **kwargs: ("", variables["events_json"]),
+        )
+        return agent
+
+    def test_occurrences_differing_only_in_date(self, make_runner, create_event, agent):
+        """Past and future occurrences of a series get their own audit."""
+        past = create_event(
+            title="Weekly Jam", start_datetime=datetime(2024, 1, 5, tzinfo=UTC)
+        )
+        future = create_event(
+            title="Weekly Jam", start_datetime=datetime(2030, 1, 5, tzinfo=UTC)
+        )
+        assert EnrichmentCache.fingerprint(past) == EnrichmentCache.fingerprint(future)
+        runner = make_runner(agent)
+
+        together = asyncio.run(runner.run([past, future], prompt_version="v1"))
+        asyncio.run(runner.run([past], prompt_version="v1"))
+        later = asyncio.run(runner.run([future], prompt_version="v1"))
+
+        assert [e.data_quality_score for e in together.events] == [0.2, 0.9]
+        assert later.events[0].data_quality_score == 0.9
+        assert runner._cache.hits == 0
+
+
+class TestPostIngestionTriggerOnMany:
+    """Tests for PostIngestionTrigger.on_many."""
+
+    def test_enriches_each_source_in_order(self, monkeypatch, create_event):
+        """Results should line up with the input pipeline results."""
+        from types import SimpleNamespace
+
+        from src.agents.orchestration.pipeline_triggers import PostIngestionTrigger
+
+        monkeypatch.setattr(BatchEnrichmentRunner, "_build_chain", lambda self: [])
+        trigger = PostIngestionTrigger({})
+        trigger._runner._agent_chain = [_TaggingAgent()]
+
+        sources = [
+            SimpleNamespace(source_name="a", events=[create_event(title="A")]),
+            SimpleNamespace(source_name="empty", events=[]),
+            SimpleNamespace(source_name="b", events=[create_event(title="B")]),
+        ]
+        results = asyncio.run(trigger.on_many(sources))
+
+        assert [[e.tags for e in r.events] for r in results] == [[["A"]], [], [["B"]]]
+
+    def test_sources_share_one_limiter(self, monkeypatch, create_event):
+        """Every source's agent tasks should get the same limiter."""
+        from types import SimpleNamespace
+
+        from src.agents.orchestration.pipeline_triggers import PostIngestionTrigger
+
+        class _LimiterAgent(_TaggingAgent):
+            def __init__(self):
+                super().__init__()
+                self.limiters = []
+
+            async def run(self, task):
+                self.limiters.append(task.limiter)
+                return await super().run(task)
+
+        agent = _LimiterAgent()
+        monkeypatch.setattr(BatchEnrichmentRunner, "_build_chain", lambda self: [])
+        trigger = PostIngestionTrigger({"global": {"max_concurrency": 2}})
+        trigger._runner._agent_chain = [agent]
+
+        sources = [
+            SimpleNamespace(source_name=name, events=[create_event(title=name)])
+            for name in ("a", "b")
+        ]
+        asyncio.run(trigger.on_many(sources))
+
+        assert len(agent.limiters) == 2
+        assert agent.limiters[0] is agent.limiters[1]
+        assert isinstance(agent.limiters[0], asyncio.Semaphore)
+
+    def test_forwards_db_connection(self, monkeypatch):
+        """on_many should pass db_connection through to each source."""
+        from types import SimpleNamespace
+
+        from src.agents.orchestration.pipeline_triggers import PostIngestionTrigger
+
+        monkeypatch.setattr(BatchEnrichmentRunner, "_build_chain", lambda self: [])
+        trigger = PostIngestionTrigger({})
+        seen = []
+
+        async def _complete(result, prompt_version, db_connection, limiter):
+            seen.append(db_connection)
+
+        monkeypatch.setattr(trigger, "on_pipeline_complete", _complete)
+        conn = object()
+        sources = [SimpleNamespace(source_name="a", events=[])] * 2
+        asyncio.run(trigger.on_many(sources, db_connection=conn))
+
+        assert seen == [conn, conn]
+
+
+class TestRunnerBatchMode:
+    """Tests for BatchEnrichmentRunner(async_mode="batch")."""
+
+    def test_wraps_batch_capable_clients_and_reports_jobs(self, monkeypatch):
+        """Batch-capable agents should get a BatchLLMClient; job ids are reported."""
+        from types import SimpleNamespace
+
+        from src.agents.llm.batch_client import BatchLLMClient
+
+        batch_agent = _TaggingAgent("batch_capable")
+        batch_agent._llm = SimpleNamespace(
+            provider="fake", supports_batch=True, temperature=0.1, max_tokens=10
+        )
+        online_agent = _TaggingAgent("online_only")
+        online_agent._llm = SimpleNamespace(supports_batch=False)
+        monkeypatch.setattr(
+            BatchEnrichmentRunner,
+            "_build_chain",
+            lambda self: [batch_agent, online_agent],
+        )
+
+        runner = BatchEnrichmentRunner({}, async_mode="batch")
+
+        assert isinstance(batch_agent._llm, BatchLLMClient)
+        assert list(runner._batch_clients) == ["batch_capable"]
+
+        task = runner._make_task(batch_agent, [object()] * 5, "active")
+        assert task.max_concurrency == 5
@@ -0,0 +1,150 @@
+"""
+Unit tests for the MCP client abstraction layer.
+
+Covers:
+  - agents/mcp/mcp_client.py — WriteResult and the in-memory DirectMCPClient
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel, Field
+from src.agents.mcp.mcp_client import DirectMCPClient, WriteResult
+
+
+class _Taxonomy(BaseModel):
+    energy_level: str | None = None
+    emotional_output: list[str] = Field(default_factory=list)
+
+
+class _Event(BaseModel):
+    """Minimal event model exposing the attributes DirectMCPClient relies on."""
+
+    source_event_id: str
+    title: str = ""
+    description: str | None = None
+    tags: list[str] = Field(default_factory=list)
+    taxonomy: _Taxonomy | None = None
+
+
+@pytest.fixture
+def client():
+    """DirectMCPClient pre-loaded with one event keyed 'e1'."""
+    event = _Event(source_event_id="e1", title="Gig", taxonomy=_Taxonomy())
+    return DirectMCPClient(events=[event])
+
+
+# =============================================================================
+# WRITE RESULT
+# =============================================================================
+
+
+class TestWriteResult:
+    """Tests for the WriteResult dataclass."""
+
+    def test_defaults(self):
+        result = WriteResult(success=True, operation="write_tags")
+        assert result.event_id is None
+        assert result.fields_written == []
+        assert result.error is None
+
+    def test_rejects_unknown_attributes(self):
+        result = WriteResult(success=True, operation="write_tags")
+        with pytest.raises(AttributeError):
+            result.extra = "nope"
+
+
+# =============================================================================
+# DIRECT MCP CLIENT — READS
+# =============================================================================
+
+
+class TestDirectFetchMissingFeatures:
+    """Tests for DirectMCPClient fetch_missing_features."""
+
+    def test_reports_empty_and_unknown_fields(self, client):
+        result = asyncio.run(
+            client.read(
+                "fetch_missing_features",
+                {"event_id": "e1", "target_fields": ["title", "tags", "nope"]},
+            )
+        )
+        assert result == {"event_id": "e1", "missing": ["tags", "nope"], "total": 2}
+
+    def test_resolves_dotted_fields(self, client):
+        client._events["e1"].taxonomy.energy_level = "high"
+        result = asyncio.run(
+            client.read(
+                "fetch_missing_features",
+                {
+                    "event_id": "e1",
+                    "target_fields": [
+                        "taxonomy.energy_level",
+                        "taxonomy.emotional_output",
+                    ],
+                },
+            )
+        )
+        assert result["missing"] == ["taxonomy.emotional_output"]
+
+    def test_unknown_event(self, client):
+        result = asyncio.run(
+            client.read(
+                "fetch_missing_features", {"event_id": "x", "target_fields": ["a"]}
+            )
+        )
+        assert result == {"missing": ["a"]}
+
+
+# =============================================================================
+# DIRECT MCP CLIENT — WRITES
+# =============================================================================
+
+
+class TestDirectWriteFeatures:
+    """Tests for DirectMCPClient write_features."""
+
+    def test_writes_only_declared_fields(self, client):
+        result = asyncio.run(
+            client.write(
+                "write_features",
+                {
+                    "event_id": "e1",
+                    "fields": {"description": "Live", "model_dump": 1, "bogus": 2},
+                },
+            )
+        )
+        assert result.success is True
+        assert result.fields_written == ["description"]
+        assert client._events["e1"].description == "Live"
+
+    def test_unknown_event(self, client):
+        result = asyncio.run(
+            client.write("write_features", {"event_id": "nope", "fields": {}})
+        )
+        assert result.success is False
+
+
+class TestDirectWriteTaxonomy:
+    """Tests for DirectMCPClient write_taxonomy."""
+
+    def test_writes_declared_taxonomy_fields(self, client):
+        asyncio.run(
+            client.write(
+                "write_taxonomy",
+                {"event_id": "e1", "taxonomy": {"energy_level": "high", "x": 1}},
+            )
+        )
+        assert client._events["e1"].taxonomy.energy_level == "high"
+
+
+class TestDirectWriteTags:
+    """Tests for DirectMCPClient write_tags."""
+
+    def test_merges_preserving_order(self, client):
+        client._events["e1"].tags = ["techno", "club"]
+        result = asyncio.run(
+            client.write("write_tags", {"event_id": "e1", "tags": ["club", "live"]})
+        )
+        assert result.success is True
+        assert client._events["e1"].tags == ["techno", "club", "live"]
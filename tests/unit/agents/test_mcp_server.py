@@ -0,0 +1,461 @@
+"""
+Unit tests for the FastMCP enrichment server tools.
+
+Covers:
+  - agents/mcp/fastmcp_server.py — in-memory event store and read/write tools
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from src.agents.mcp import fastmcp_server as server
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    """Reset the module-level event store around each test."""
+    server.clear_store()
+    yield
+    server.clear_store()
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+class TestLoadEvents:
+    """Tests for load_events."""
+
+    def test_loads_models_via_model_dump(self):
+        class _Model:
+            def model_dump(self, mode="python"):
+                return {"source_event_id": "m1", "title": "Gig"}
+
+        assert server.load_events([_Model(), _Model()]) == 2
+        assert server._event_store["m1"]["title"] == "Gig"
+
+    def test_loads_dicts(self):
+        assert server.load_events([{"source_event_id": "d1"}]) == 1
+        assert "d1" in server._event_store
+
+    def test_rows_stored_json_safe(self, create_event):
+        from datetime import datetime
+
+        event = create_event(title="Gig")
+        server.load_events([event])
+        server.load_events(
+            [{"source_event_id": "d1", "when": datetime(2026, 5, 1), "ids": (1, 2)}]
+        )
+
+        row = next(r for r in server._event_store.values() if r.get("title") == "Gig")
+        assert row == json.loads(json.dumps(row))
+        assert server._event_store["d1"] == {
+            "source_event_id": "d1",
+            "when": "2026-05-01 00:00:00",
+            "ids": [1, 2],
+        }
+
+    def test_mixed_batch_skips_unrecognised_items(self):
+        class _Model:
+            def model_dump(self, mode="python"):
+                return {"source_event_id": "m1"}
+
+        loaded = server.load_events([_Model(), {"source_event_id": "d1"}, 42])
+        assert loaded == 2
+        assert set(server._event_store) == {"m1", "d1"}
+
+
+class TestEnrichedEvents:
+    """Tests for get_enriched_events / iter_enriched_events."""
+
+    def test_iter_matches_list(self):
+        server.load_events([{"source_event_id": "a"}, {"source_event_id": "b"}])
+        assert list(server.iter_enriched_events()) == server.get_enriched_events()
+
+    def test_iter_reflects_writes(self):
+        server.load_events([{"source_event_id": "a", "tags": []}])
+        view = server.iter_enriched_events()
+        server.write_tags("a", '["x"]')
+        assert next(iter(view))["tags"] == ["x"]
+
+
+# =============================================================================
+# READ TOOLS
+# =============================================================================
+
+
+class TestFetchAllMissing:
+    """Tests for fetch_all_missing."""
+
+    def test_scans_store_for_missing_field(self):
+        server.load_events(
+            [
+                {"source_event_id": "a", "tags": ["x"], "taxonomy": None},
+                {"source_event_id": "b", "tags": [], "taxonomy": {"risk_level": "low"}},
+                {"source_event_id": "c"},
+            ]
+        )
+        result = json.loads(server.fetch_all_missing("tags"))
+        assert result == {"field": "tags", "event_ids": ["b", "c"], "count": 2}
+
+        result = json.loads(server.fetch_all_missing("taxonomy.risk_level"))
+        assert result["event_ids"] == ["a", "c"]
+
+
+class TestListEvents:
+    """Tests for list_events."""
+
+    def test_lists_loaded_ids(self):
+        server.load_events([{"source_event_id": "a"}, {"source_event_id": "b"}])
+        assert json.loads(server.list_events()) == {"event_ids": ["a", "b"], "count": 2}
+
+    def test_cached_until_key_set_changes(self):
+        server.load_events([{"source_event_id": "a"}])
+        first = server.list_events()
+        server.write_tags("a", '["x"]')
+        assert server.list_events() is first
+
+        server.load_events_tool('[{"source_event_id": "b"}]')
+        assert json.loads(server.list_events())["count"] == 2
+
+        server.clear_store()
+        assert json.loads(server.list_events())["count"] == 0
+
+
+class TestFetchTaxonomyEnums:
+    """Tests for fetch_taxonomy_enums."""
+
+    def test_returns_all_enum_fields(self):
+        data = json.loads(server.fetch_taxonomy_enums())
+        assert data == server._taxonomy_enums
+
+    def test_returns_cached_blob(self):
+        assert server.fetch_taxonomy_enums() is server.fetch_taxonomy_enums()
+
+
+class TestFetchEventRow:
+    """Tests for fetch_event_row."""
+
+    def test_returns_event(self):
+        server.load_events([{"source_event_id": "a", "title": "A"}])
+        assert json.loads(server.fetch_event_row("a"))["title"] == "A"
+
+    def test_unknown_event_returns_empty_object(self):
+        assert server.fetch_event_row("nope") == "{}"
+
+
+class TestFetchMissingFeatures:
+    """Tests for fetch_missing_features."""
+
+    def test_reports_none_and_empty_fields(self):
+        server.load_events(
+            [{"source_event_id": "a", "title": "T", "description": "", "tags": []}]
+        )
+        result = json.loads(
+            server.fetch_missing_features("a", ["title", "description", "tags"])
+        )
+        assert result == {
+            "event_id": "a",
+            "missing": ["description", "tags"],
+            "total": 2,
+        }
+
+    def test_dotted_fields_resolve_nested_values(self):
+        server.load_events(
+            [
+                {
+                    "source_event_id": "a",
+                    "taxonomy": {"energy_level": "high", "risk_level": None},
+                }
+            ]
+        )
+        result = json.loads(
+            server.fetch_missing_features(
+                "a", ["taxonomy.energy_level", "taxonomy.risk_level"]
+            )
+        )
+        assert result["missing"] == ["taxonomy.risk_level"]
+
+    def test_dotted_field_with_null_parent_is_missing(self):
+        server.load_events([{"source_event_id": "a", "taxonomy": None}])
+        result = json.loads(
+            server.fetch_missing_features("a", ["taxonomy.energy_level"])
+        )
+        assert result["missing"] == ["taxonomy.energy_level"]
+
+    def test_unknown_event_reports_all_fields(self):
+        result = json.loads(server.fetch_missing_features("nope", ["title"]))
+        assert result["missing"] == ["title"]
+        assert result["error"] == "Event not found"
+
+
+# =============================================================================
+# WRITE TOOLS
+# =============================================================================
+
+
+class TestWriteTags:
+    """Tests for write_tags."""
+
+    def test_merges_and_deduplicates(self):
+        server.load_events([{"source_event_id": "a", "tags": ["techno", "club"]}])
+        result = json.loads(server.write_tags("a", '["club", "nightlife"]'))
+        assert result == {"success": True, "tags_count": 3, "error": None}
+        assert server._event_store["a"]["tags"] == ["techno", "club", "nightlife"]
+
+    def test_handles_missing_tags(self):
+        server.load_events([{"source_event_id": "a", "tags": None}])
+        json.loads(server.write_tags("a", '["jazz"]'))
+        assert server._event_store["a"]["tags"] == ["jazz"]
+
+    def test_rejects_non_array(self):
+        server.load_events([{"source_event_id": "a"}])
+        result = json.loads(server.write_tags("a", '"jazz"'))
+        assert result["success"] is False
+
+    def test_rejects_non_string_tags(self):
+        server.load_events([{"source_event_id": "a", "tags": []}])
+        result = json.loads(server.write_tags("a", '["jazz", 3]'))
+        assert result["success"] is False
+        assert server._event_store["a"]["tags"] == []
+
+    def test_concurrent_writes_do_not_lose_tags(self):
+        server.load_events([{"source_event_id": "a", "tags": []}])
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: server.write_tags("a", f'["t{i}"]'), range(200)))
+        assert len(server._event_store["a"]["tags"]) == 200
+
+
+class TestWriteLocks:
+    """Tests for the striped write locks."""
+
+    def test_same_event_maps_to_same_stripe(self):
+        assert server._lock_for("event-1") is server._lock_for("event-1")
+
+
+class TestWriteEmotions:
+    """Tests for write_emotions."""
+
+    def test_writes_emotional_output(self):
+        server.load_events([{"source_event_id": "a", "taxonomy": None}])
+        result = json.loads(server.write_emotions("a", '["joy"]'))
+        assert result == {"success": True, "error": None}
+        assert server._event_store["a"]["taxonomy"]["emotional_output"] == ["joy"]
+
+    def test_unknown_event(self):
+        result = json.loads(server.write_emotions("nope", '["joy"]'))
+        assert result["success"] is False
+
+    def test_rejects_invalid_payload(self):
+        server.load_events([{"source_event_id": "a"}])
+        for payload in ('{"joy": 1}', "[1]", "["):
+            result = json.loads(server.write_emotions("a", payload))
+            assert result["success"] is False
+            assert result["error"].startswith("Invalid input")
+
+
+class TestLoadEventsTool:
+    """Tests for load_events_tool."""
+
+    def test_loads_events_keyed_by_source_id(self):
+        payload = json.dumps(
+            [{"source_event_id": "a", "title": "A"}, {"source_event_id": "b"}]
+        )
+        result = json.loads(server.load_events_tool(payload))
+        assert result == {"loaded": 2, "total": 2}
+        assert server._event_store["a"]["title"] == "A"
+
+    def test_invalid_json_returns_error(self):
+        result = json.loads(server.load_events_tool("[{"))
+        assert result["loaded"] == 0
+        assert result["error"]
+
+    def test_non_array_returns_error(self):
+        result = json.loads(server.load_events_tool('{"source_event_id": "a"}'))
+        assert result["loaded"] == 0
+        assert "array" in result["error"]
+
+
+# =============================================================================
+# BATCH TOOL
+# =============================================================================
+
+
+class TestBatchExecute:
+    """Tests for batch_execute."""
+
+    def test_runs_calls_in_order(self):
+        server.load_events([{"source_event_id": "a", "tags": []}])
+        calls = [
+            {"tool": "write_tags", "args": {"event_id": "a", "tags_json": '["x"]'}},
+            {"tool": "fetch_event_row", "args": {"event_id": "a"}},
+        ]
+        result = json.loads(server.batch_execute(json.dumps(calls)))
+        assert result["executed"] == 2
+        assert result["results"][0]["success"] is True
+        assert result["results"][1]["tags"] == ["x"]
+
+    def test_unknown_tool_and_bad_args_reported_per_call(self):
+        calls = [
+            {"tool": "drop_everything", "args": {}},
+            {"tool": "list_events", "args": {"unexpected": 1}},
+            {"tool": "list_events"},
+        ]
+        result = json.loads(server.batch_execute(json.dumps(calls)))
+        assert "Unknown tool" in result["results"][0]["error"]
+        assert "Invalid arguments" in result["results"][1]["error"]
+        assert result["results"][2] == {"event_ids": [], "count": 0}
+
+    def test_stop_on_error(self):
+        calls = [
+            {"tool": "write_tags", "args": {"event_id": "nope", "tags_json": "[]"}},
+            {"tool": "list_events"},
+        ]
+        result = json.loads(server.batch_execute(json.dumps(calls), stop_on_error=True))
+        assert result["executed"] == 1
+
+    def test_raising_tool_is_recorded_and_stops_batch(self):
+        server.load_events([{"source_event_id": "a", "tags": []}])
+        calls = [
+            # A JSON array where an object is expected raises inside the tool
+            {"tool": "write_features", "args": {"event_id": "a", "fields_json": "[1]"}},
+            {"tool": "list_events"},
+        ]
+        result = json.loads(server.batch_execute(json.dumps(calls), stop_on_error=True))
+        assert result["executed"] == 1
+        assert result["results"][0]["success"] is False
+        assert result["results"][0]["error"]
+
+    def test_non_string_tool_reported_as_unknown(self):
+        calls = [{"tool": ["list_events"]}, {"tool": None}, "list_events"]
+        result = json.loads(server.batch_execute(json.dumps(calls)))
+        assert result["executed"] == 3
+        assert all(r["success"] is False for r in result["results"])
+        assert all("Unknown tool" in r["error"] for r in result["results"])
+
+    def test_invalid_payload(self):
+        result = json.loads(server.batch_execute("{}"))
+        assert result["executed"] == 0
+        assert result["error"]
+
+
+# =============================================================================
+# LOCAL CLIENT FAST PATH
+# =============================================================================
+
+
+class TestLocalClientFastPath:
+    """Tests for LocalMCPClient(fast_path=True) over the native operations."""
+
+    @pytest.fixture
+    def client(self):
+        from src.agents.mcp.fastmcp_client import LocalMCPClient
+
+        server.load_events([{"source_event_id": "a", "tags": ["x"], "title": ""}])
+        return LocalMCPClient(fast_path=True)
+
+    def test_reads_return_native_dicts(self, client):
+        result = asyncio.run(
+            client.read(
+                "fetch_missing_features",
+                {"event_id": "a", "target_fields": ["tags", "title"]},
+            )
+        )
+        assert result == {"event_id": "a", "missing": ["title"], "total": 1}
+
+    def test_writes_update_shared_store(self, client):
+        result = asyncio.run(
+            client.write("write_tags", {"event_id": "a", "tags": ["y", "x"]})
+        )
+        assert result.success is True
+        assert server._event_store["a"]["tags"] == ["x", "y"]
+
+        result = asyncio.run(
+            client.write("write_features", {"event_id": "a", "fields": {"title": "T"}})
+        )
+        assert result.fields_written == ["title"]
+
+    def test_unknown_operation(self, client):
+        assert asyncio.run(client.read("drop_everything", {})) == {}
+
+    def test_failing_operation_returns_empty_dict(self, client):
+        # fields must be a dict; the error is reported like _call_tool does
+        result = asyncio.run(
+            client.read("write_features", {"event_id": "a", "fields": []})
+        )
+        assert result == {}
+
+
+class TestNativeJsonParity:
+    """The native operations return exactly what the JSON tools decode to."""
+
+    @pytest.fixture(autouse=True)
+    def store(self):
+        from datetime import datetime
+
+        server.load_events(
+            [
+                {
+                    "source_event_id": "a",
+                    "tags": ["x"],
+                    "title": "",
+                    "start": datetime(2026, 5, 1, 20, 0),
+                }
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        ("operation", "native_args", "tool_args"),
+        [
+            ("fetch_event_row", {"event_id": "a"}, {"event_id": "a"}),
+            ("fetch_event_row", {"event_id": "nope"}, {"event_id": "nope"}),
+            ("fetch_all_missing", {"field": "title"}, {"field": "title"}),
+            ("list_events", {}, {}),
+            ("fetch_taxonomy_enums", {}, {}),
+            (
+                "write_features",
+                {"event_id": "nope", "fields": {}},
+                {"event_id": "nope", "fields_json": "not json"},
+            ),
+            (
+                "write_taxonomy",
+                {"event_id": "nope", "taxonomy": {}},
+                {"event_id": "nope", "taxonomy_json": "not json"},
+            ),
+            (
+                "write_emotions",
+                {"event_id": "nope", "emotional_output": []},
+                {"event_id": "nope", "emotional_output_json": "not json"},
+            ),
+            (
+                "write_tags",
+                {"event_id": "nope", "tags": []},
+                {"event_id": "nope", "tags_json": "not json"},
+            ),
+        ],
+    )
+    def test_native_matches_tool(self, operation, native_args, tool_args):
+        native = server.get_native_operations()[operation](**native_args)
+        tool = json.loads(getattr(server, operation)(**tool_args))
+        assert native == tool
+
+    def test_native_fetch_does_not_encode(self, monkeypatch):
+        def _no_json(*args, **kwargs):
+            raise AssertionError("native fetch must not touch json")
+
+        monkeypatch.setattr(server.json, "dumps", _no_json)
+        monkeypatch.setattr(server.json, "loads", _no_json)
+        row = server.get_native_operations()["fetch_event_row"](event_id="a")
+        assert row["start"] == "2026-05-01 20:00:00"
+
+    def test_non_string_tags_rejected_on_both_paths(self):
+        native = server.get_native_operations()["write_tags"](event_id="a", tags=[1])
+        tool = json.loads(server.write_tags(event_id="a", tags_json="[1]"))
+        assert native["success"] is tool["success"] is False
+        assert server._event_store["a"]["tags"] == ["x"]
@@ -147,6 +147,54 @@ class TestRender:
         )
         assert "feature_alignment/v1" in registry._templates
 
+    def test_render_reuses_compiled_template(self, registry: PromptRegistry):
+        """Templates should be compiled once and reused across renders."""
+        registry.render("feature_alignment", version="v1", variables={"title": "A"})
+        compiled = registry._templates["feature_alignment/v1"]["system"]
+        system, _ = registry.render(
+            "feature_alignment", version="v1", variables={"title": "B"}
+        )
+        assert registry._templates["feature_alignment/v1"]["system"] is compiled
+        assert "Title: B" in system
+
+    def test_render_missing_variable_is_placeholder(self, registry: PromptRegistry):
+        """Undefined variables should render as [name] rather than raising."""
+        _, user = registry.render("feature_alignment", version="v1", variables={})
+        assert "Analyze: [description]" in user
+
+    def test_render_batch_falls_back_to_user_prompt(self, registry: PromptRegistry):
+        """batch=True without batch_user_prompt should use user_prompt."""
+        _, user = registry.render(
+            "feature_alignment",
+            version="v1",
+            variables={"description": "D"},
+            batch=True,
+        )
+        assert "Analyze: D" in user
+
+    def test_render_reloads_edited_template(
+        self, registry: PromptRegistry, tmp_prompts_dir: Path
+    ):
+        """Editing a template on disk should invalidate the cached copy."""
+        import os
+
+        registry.render("feature_alignment", version="v1", variables={"title": "A"})
+        path = tmp_prompts_dir / "feature_alignment" / "v1.yaml"
+        path.write_text(MOCK_TEMPLATE_MINIMAL)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        system, user = registry.render(
+            "feature_alignment", version="v1", variables={"title": "A"}
+        )
+        assert "System instructions." in system
+        assert "Process: A" in user
+
+    def test_preload_compiles_active_template(self, registry: PromptRegistry):
+        """preload() should resolve 'active' and cache the compiled template."""
+        assert registry.preload("feature_alignment") == "v1"
+        assert "feature_alignment/v1" in registry._templates
+
     def test_render_missing_prompt_raises(self, tmp_path: Path):
         """render() for a non-existent prompt should raise an error."""
         reg = PromptRegistry(prompts_dir=tmp_path)
@@ -131,3 +131,20 @@ class TestLoadIngestionConfig:
         assert (
             config["sources"]["ticketmaster"]["query"]["params"]["apikey"] == test_key
         )
+
+    def test_unknown_placeholder_left_intact(self, monkeypatch, tmp_path):
+        """Placeholders with no matching setting should pass through unchanged."""
+        import src.configs.config
+
+        config_path = tmp_path / "ingestion.yaml"
+        config_path.write_text("url: ${DATABASE_URL}\nother: ${NOT_A_SETTING}\n")
+        monkeypatch.setattr(Config, "INGESTION_CONFIG_PATH", config_path)
+        Config.load_ingestion_config.cache_clear()
+
+        try:
+            config = Config.load_ingestion_config()
+        finally:
+            Config.load_ingestion_config.cache_clear()
+
+        assert config["other"] == "${NOT_A_SETTING}"
+        assert config["url"] == str(src.configs.config.settings.DATABASE_URL)
@@ -5,13 +5,16 @@ Tests for APIAdapterConfig and APIAdapter classes.
 """
 
 import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from src.ingestion.adapters import api_adapter
 from src.ingestion.adapters.api_adapter import (
     APIAdapter,
     APIAdapterConfig,
+    close_shared_clients,
 )
 from src.ingestion.adapters.base_adapter import SourceType
 
@@ -29,11 +32,48 @@ MOCK_API_RESPONSE = {
 }
 
 
+def _json_response(data: dict) -> httpx.Response:
+    """Build a 200 httpx.Response with a JSON body."""
+    return httpx.Response(
+        200, json=data, request=httpx.Request("GET", "https://api.example.com")
+    )
+
+
+def _mock_client(*outcomes) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    """
+    Build an httpx client that answers requests with the given outcomes in order.
+
+    Each outcome is a dict (served as a JSON body), an httpx.Response, or an
+    exception to raise. Returns the client and the list of requests it saw.
+    """
+    pending = list(outcomes)
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        outcome = pending.pop(0) if len(pending) > 1 else pending[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, dict):
+            return httpx.Response(200, json=outcome)
+        return outcome
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), seen
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    """Keep shared HTTP clients from leaking between tests."""
+    api_adapter._CLIENTS.clear()
+    yield
+    api_adapter._CLIENTS.clear()
+
+
 @pytest.fixture
 def api_config():
     """Create a basic API adapter config."""
@@ -93,6 +133,28 @@ class TestAPIAdapterConfig:
         )
         assert config.source_type == SourceType.API
 
+    def test_resolves_request_settings(self, graphql_config):
+        """Should resolve method, URL and headers once at construction."""
+        assert graphql_config._method == "POST"
+        assert graphql_config._url == "https://api.example.com/graphql"
+        assert graphql_config._headers["Accept"] == "application/json"
+        with pytest.raises(TypeError):
+            graphql_config._headers["Accept"] = "text/html"
+
+    def test_with_base_url_resolves_new_request_url(self, api_config):
+        """Should return a copy with the request URL re-resolved."""
+        moved = api_config.with_base_url("https://api.example.com/organizers/42/events")
+
+        assert moved._method == "GET"
+        assert moved._url == "https://api.example.com/organizers/42/events"
+        assert api_config._url == "https://api.example.com/events"
+
+    def test_config_is_frozen(self, api_config):
+        """Should reject mutation and carry no per-instance __dict__."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            api_config.max_retries = 10
+        assert not hasattr(api_config, "__dict__")
+
     def test_custom_headers(self):
         """Should accept custom headers."""
         config = APIAdapterConfig(
@@ -201,6 +263,52 @@ class TestAPIAdapterGetClient:
 
         assert client.headers["authorization"] == "Bearer test-key"
 
+    def test_configures_connection_pool(self, api_config):
+        """Should size the keep-alive pool for reuse across requests."""
+        adapter = APIAdapter(api_config)
+        pool = adapter._get_client()._transport._pool
+
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 20
+
+    def test_transport_retries_connection_failures(self, api_config):
+        """Should configure connection-level retries from max_retries."""
+        adapter = APIAdapter(api_config)
+        pool = adapter._get_client()._transport._pool
+
+        assert pool._retries == api_config.max_retries
+
+    def test_shares_client_across_adapters_for_same_host(self, api_config):
+        """Adapters for the same host and headers should reuse one client."""
+        other = APIAdapterConfig(
+            source_id="other",
+            source_type=SourceType.API,
+            base_url="https://api.example.com/venues",
+        )
+
+        assert APIAdapter(api_config)._get_client() is APIAdapter(other)._get_client()
+
+    def test_separate_clients_for_different_credentials(self, api_config):
+        """Adapters with different auth headers should not share a client."""
+        keyed = APIAdapterConfig(
+            source_id="keyed",
+            source_type=SourceType.API,
+            base_url="https://api.example.com/events",
+            api_key="secret",
+        )
+
+        assert (
+            APIAdapter(api_config)._get_client() is not APIAdapter(keyed)._get_client()
+        )
+
+    def test_new_client_per_event_loop(self, api_config):
+        """A client created on one event loop should not be reused on another."""
+
+        async def get_client():
+            return APIAdapter(api_config)._get_client()
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
 
 class TestAPIAdapterFetch:
     """Tests for APIAdapter.fetch method."""
@@ -279,6 +387,35 @@ class TestAPIAdapterFetch:
         assert result.fetch_started_at is not None
         assert result.fetch_ended_at is not None
         assert result.fetch_started_at <= result.fetch_ended_at
+        assert result.metadata["elapsed_ns"] >= 0
+        assert result.duration_seconds == pytest.approx(
+            (result.fetch_ended_at - result.fetch_started_at).total_seconds(),
+            abs=1e-6,
+        )
+
+    def test_client_from_finished_loop_is_closed(self, api_config):
+        """Replacing a client after a loop change should close the old one."""
+
+        async def get_client():
+            return APIAdapter(api_config)._get_client()
+
+        async def replace_client():
+            client = APIAdapter(api_config)._get_client()
+            await asyncio.gather(*api_adapter._CLOSING)
+            return client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(replace_client())
+
+        assert first.is_closed
+        assert not second.is_closed
+
+    def test_client_key_holds_headers_not_their_hash(self, api_config):
+        """Should key shared clients on the header items themselves."""
+        APIAdapter(api_config)._get_client()
+
+        ((_, headers, _),) = api_adapter._CLIENTS
+        assert headers == frozenset(api_config._headers.items())
 
 
 class TestAPIAdapterMakeRequest:
@@ -287,24 +424,47 @@ class TestAPIAdapterMakeRequest:
     def test_make_get_request(self, api_config):
         """Should make GET request for REST API."""
         adapter = APIAdapter(api_config)
-        response = MagicMock()
-        response.json.return_value = {"data": "test"}
-        response.raise_for_status = MagicMock()
-        client = AsyncMock()
-        client.get = AsyncMock(return_value=response)
+        client, requests = _mock_client({"data": "test"})
 
         with patch("asyncio.sleep", new=AsyncMock()):
             result = asyncio.run(adapter._make_request(client, {"param": "value"}))
 
-        client.get.assert_called_once()
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert requests[0].url.params["param"] == "value"
         assert result == {"data": "test"}
 
+    def test_streams_body_larger_than_content_length(self, api_config):
+        """Should decode the full body even if Content-Length under-reports it."""
+        adapter = APIAdapter(api_config)
+        body = b'{"data": [' + b",".join(b"%d" % i for i in range(5000)) + b"]}"
+        response = httpx.Response(
+            200, headers={"Content-Length": "10"}, stream=httpx.ByteStream(body)
+        )
+        client, _ = _mock_client(response)
+
+        result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result == {"data": list(range(5000))}
+
+    def test_huge_content_length_not_preallocated(self, api_config):
+        """Should not size the buffer from an absurd Content-Length."""
+        adapter = APIAdapter(api_config)
+        response = httpx.Response(
+            200,
+            headers={"Content-Length": str(1 << 60)},
+            stream=httpx.ByteStream(b'{"data": [1]}'),
+        )
+        client, _ = _mock_client(response)
+
+        result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result == {"data": [1]}
+
     def test_make_post_request_for_graphql(self, graphql_config):
         """Should make POST request for GraphQL API."""
         adapter = APIAdapter(graphql_config)
-        response = MagicMock()
-        response.json.return_value = {"data": "test"}
-        response.raise_for_status = MagicMock()
+        response = _json_response({"data": "test"})
         client = AsyncMock()
         client.post = AsyncMock(return_value=response)
 
@@ -317,21 +477,14 @@ class TestAPIAdapterMakeRequest:
     def test_retry_on_failure(self, api_config):
         """Should retry on request failure."""
         adapter = APIAdapter(api_config)
-        success_response = MagicMock()
-        success_response.json.return_value = {"data": "success"}
-        success_response.raise_for_status = MagicMock()
-        client = AsyncMock()
-        client.get = AsyncMock(
-            side_effect=[
-                httpx.HTTPError("Failed"),
-                success_response,
-            ]
+        client, requests = _mock_client(
+            httpx.ReadTimeout("Failed"), {"data": "success"}
         )
 
         with patch("asyncio.sleep", new=AsyncMock()):
             result = asyncio.run(adapter._make_request(client, {}))
 
-        assert client.get.call_count == 2
+        assert len(requests) == 2
         assert result == {"data": "success"}
 
     def test_max_retries_exceeded(self, api_config):
@@ -343,28 +496,77 @@ class TestAPIAdapterMakeRequest:
             max_retries=2,
         )
         adapter = APIAdapter(config)
-        client = AsyncMock()
-        client.get = AsyncMock(side_effect=httpx.HTTPError("Failed"))
+        client, requests = _mock_client(httpx.Response(503))
 
         with patch("asyncio.sleep", new=AsyncMock()):
             result = asyncio.run(adapter._make_request(client, {}))
 
         assert result is None
-        assert client.get.call_count == 3  # Initial + 2 retries
+        assert len(requests) == 3  # Initial + 2 retries
+
+    def test_connect_errors_left_to_transport(self, api_config):
+        """Should not re-run connection failures the transport already retried."""
+        adapter = APIAdapter(api_config)
+        client, requests = _mock_client(httpx.ConnectError("Failed"))
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result is None
+        assert len(requests) == 1
+        mock_sleep.assert_not_called()
+
+    def test_honors_retry_after_on_429(self, api_config):
+        """Should wait for Retry-After instead of the exponential backoff."""
+        adapter = APIAdapter(api_config)
+        throttled = httpx.Response(429, headers={"Retry-After": "7"})
+        client, _ = _mock_client(throttled, {"data": "success"})
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result == {"data": "success"}
+        assert mock_sleep.call_args_list[0].args == (7.0,)
+
+    def test_caps_long_retry_after(self, api_config):
+        """Should not wait longer than the backoff cap, however long asked."""
+        adapter = APIAdapter(api_config)
+        throttled = httpx.Response(429, headers={"Retry-After": "99999999"})
+        client, _ = _mock_client(throttled, {"data": "success"})
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result == {"data": "success"}
+        assert mock_sleep.call_args_list[0].args == (30.0,)
+
+    def test_retry_after_http_date_without_zone(self, api_config):
+        """Should read a "-0000" HTTP date as UTC instead of raising."""
+        adapter = APIAdapter(api_config)
+        throttled = httpx.Response(
+            503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"}
+        )
+        client, _ = _mock_client(throttled, {"data": "success"})
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(adapter._make_request(client, {}))
+
+        assert result == {"data": "success"}
+        # The date is in the past, so retry straight away
+        assert mock_sleep.call_args_list[0].args == (0.0,)
 
     def test_rate_limiting(self, api_config):
-        """Should respect rate limit via asyncio.sleep."""
+        """Should only wait once requests exceed the rate budget."""
         adapter = APIAdapter(api_config)
-        response = MagicMock()
-        response.json.return_value = {"data": "test"}
-        response.raise_for_status = MagicMock()
-        client = AsyncMock()
-        client.get = AsyncMock(return_value=response)
+        client, _ = _mock_client({"data": "test"})
 
         with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
             asyncio.run(adapter._make_request(client, {}))
+            mock_sleep.assert_not_called()
+            asyncio.run(adapter._make_request(client, {}))
 
-        mock_sleep.assert_called()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0, abs=0.05)
 
 
 class TestAPIAdapterDefaultParsers:
@@ -402,16 +604,25 @@ class TestAPIAdapterDefaultParsers:
 class TestAPIAdapterClose:
     """Tests for APIAdapter.close method."""
 
-    def test_close_client(self, api_config):
-        """Should close the async HTTP client."""
+    def test_close_releases_shared_client(self, api_config):
+        """Should drop the adapter's reference but leave the shared client open."""
         adapter = APIAdapter(api_config)
-        mock_client = AsyncMock()
-        adapter._client = mock_client
+        client = adapter._get_client()
 
         asyncio.run(adapter.close())
 
-        mock_client.aclose.assert_called_once()
         assert adapter._client is None
+        assert not client.is_closed
+        assert APIAdapter(api_config)._get_client() is client
+
+    def test_close_shared_clients(self, api_config):
+        """Should close every shared client on shutdown."""
+        client = APIAdapter(api_config)._get_client()
+
+        asyncio.run(close_shared_clients())
+
+        assert client.is_closed
+        assert APIAdapter(api_config)._get_client() is not client
 
     def test_close_without_client(self, api_config):
         """Should handle close when no client exists."""
@@ -4,7 +4,10 @@ Unit tests for the base_adapter module.
 Tests for BaseSourceAdapter, SourceType, FetchResult, and AdapterConfig.
 """
 
-from datetime import datetime, timedelta
+import subprocess
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 from src.ingestion.adapters.base_adapter import (
@@ -87,6 +90,19 @@ class TestFetchResult:
 
         assert result.duration_seconds == 5.0
 
+    def test_duration_seconds_prefers_monotonic_elapsed(self):
+        """Should use metadata elapsed_ns over the wall-clock timestamps."""
+        start = datetime.now(UTC)
+        result = FetchResult(
+            success=True,
+            source_type=SourceType.API,
+            metadata={"elapsed_ns": 1_500_000_000},
+            fetch_started_at=start,
+            fetch_ended_at=start + timedelta(seconds=5),
+        )
+
+        assert result.duration_seconds == 1.5
+
     def test_duration_seconds_no_timestamps(self):
         """Should return 0 when timestamps not set."""
         result = FetchResult(
@@ -127,6 +143,7 @@ class TestAdapterConfig:
         assert config.request_timeout == 30
         assert config.max_retries == 3
         assert config.rate_limit_per_second == 1.0
+        assert config.max_errors_recorded == 100
         assert config.custom_config == {}
 
     def test_custom_values(self):
@@ -227,3 +244,25 @@ class TestBaseSourceAdapter:
 
         # Should not raise
         asyncio.run(adapter.close())
+
+
+class TestAdaptersPackage:
+    """Tests for the adapters package's lazy exports."""
+
+    def test_adapter_classes_load_on_first_access(self):
+        """Importing the package should not load httpx until APIAdapter is used."""
+        code = (
+            "import sys, src.ingestion.adapters as adapters\n"
+            "assert 'httpx' not in sys.modules\n"
+            "assert adapters.APIAdapter.__name__ == 'APIAdapter'\n"
+            "assert 'httpx' in sys.modules\n"
+        )
+        api_root = Path(__file__).resolve().parents[4] / "services" / "api"
+        subprocess.run([sys.executable, "-c", code], cwd=api_root, check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should still raise AttributeError."""
+        from src.ingestion import adapters
+
+        with pytest.raises(AttributeError):
+            adapters.NoSuchAdapter  # noqa: B018
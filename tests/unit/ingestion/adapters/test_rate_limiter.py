@@ -0,0 +1,59 @@
+"""
+Unit tests for the rate_limiter module.
+
+Tests for the AsyncRateLimiter token bucket.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.ingestion.adapters.rate_limiter import AsyncRateLimiter
+
+# =============================================================================
+# TEST CLASSES
+# =============================================================================
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter."""
+
+    def test_burst_within_budget_does_not_wait(self):
+        """Requests up to the bucket size should go out immediately."""
+        limiter = AsyncRateLimiter(rate_per_second=3.0, clock=lambda: 0.0)
+
+        async def _run():
+            for _ in range(3):
+                async with limiter:
+                    pass
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            asyncio.run(_run())
+
+        mock_sleep.assert_not_called()
+
+    def test_concurrent_callers_reserve_successive_slots(self):
+        """Callers past the budget should each wait for their own slot."""
+        limiter = AsyncRateLimiter(rate_per_second=2.0, clock=lambda: 0.0)
+
+        async def _run():
+            await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            asyncio.run(_run())
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert waits == [pytest.approx(0.5), pytest.approx(1.0)]
+
+    def test_tokens_refill_over_time(self):
+        """Elapsed time should refill the bucket up to its capacity."""
+        now = [0.0]
+        limiter = AsyncRateLimiter(rate_per_second=1.0, clock=lambda: now[0])
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            asyncio.run(limiter.acquire())
+            now[0] = 5.0
+            asyncio.run(limiter.acquire())
+            asyncio.run(limiter.acquire())
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [pytest.approx(1.0)]
@@ -5,6 +5,7 @@ Tests for ScraperAdapterConfig and ScraperAdapter classes.
 """
 
 import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -50,6 +51,13 @@ def mock_fetch_result():
     return result
 
 
+def _pid_parser(html: str, url: str) -> dict:
+    """Module-level (picklable) parser recording the process it ran in."""
+    import os
+
+    return {"title": "Parsed Event", "pid": os.getpid()}
+
+
 # =============================================================================
 # TEST CLASSES
 # =============================================================================
@@ -265,12 +273,15 @@ class TestScraperAdapterFetch:
         mock_get_scraper.return_value = mock_scraper
 
         adapter = ScraperAdapter(scraper_config)
-        asyncio.run(adapter.fetch(city="madrid", country_code="es", max_pages=3))
+        asyncio.run(
+            adapter.fetch(city="madrid", country_code="es", max_pages=3, concurrency=2)
+        )
 
         mock_scraper.fetch_listing_pages.assert_called_with(
             city="madrid",
             country_code="es",
             max_pages=3,
+            concurrency=2,
         )
 
     @patch.object(ScraperAdapter, "_get_scraper")
@@ -298,6 +309,112 @@ class TestScraperAdapterFetch:
 
         # Should fetch only unique URLs
         mock_scraper.fetch_event_pages.assert_called_once()
+        assert mock_scraper.fetch_event_pages.call_args.args[0] == [
+            "https://example.com/events/1"
+        ]
+
+    @patch.object(ScraperAdapter, "_get_scraper")
+    def test_fetch_parses_pages_as_they_arrive(
+        self, mock_get_scraper, scraper_config, mock_fetch_result
+    ):
+        """Pages reported via on_result should be parsed once, off the event loop."""
+        import threading
+
+        parse_threads = []
+
+        def parser(html, url):
+            parse_threads.append(threading.get_ident())
+            return {"title": "Parsed Event"}
+
+        async def fetch_event_pages(urls, *, max_events, concurrency, on_result):
+            assert concurrency == 3
+            on_result(mock_fetch_result)
+            return [mock_fetch_result]
+
+        mock_scraper = MagicMock()
+        mock_scraper.fetch_listing_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_scraper.extract_event_urls.return_value = ["https://example.com/events/1"]
+        mock_scraper.fetch_event_pages = fetch_event_pages
+        mock_get_scraper.return_value = mock_scraper
+
+        adapter = ScraperAdapter(scraper_config, html_parser=parser)
+        result = asyncio.run(adapter.fetch(concurrency=3))
+
+        assert result.raw_data[0]["title"] == "Parsed Event"
+        assert len(parse_threads) == 1
+        assert parse_threads[0] != threading.get_ident()
+
+    @patch.object(ScraperAdapter, "_get_scraper")
+    def test_fetch_parses_in_worker_processes(
+        self, mock_get_scraper, scraper_config, mock_fetch_result
+    ):
+        """With parse_processes set, pages should be parsed outside this process."""
+        import os
+
+        mock_fetch_result.html = "<html></html>"  # MagicMock attrs don't pickle
+        mock_fetch_result.url = "https://example.com/events/1"
+        mock_scraper = MagicMock()
+        mock_scraper.fetch_listing_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_scraper.extract_event_urls.return_value = ["https://example.com/events/1"]
+        mock_scraper.fetch_event_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_get_scraper.return_value = mock_scraper
+        scraper_config = dataclasses.replace(scraper_config, parse_processes=1)
+
+        async def run():
+            adapter = ScraperAdapter(scraper_config, html_parser=_pid_parser)
+            try:
+                return await adapter.fetch()
+            finally:
+                await adapter.close()
+
+        result = asyncio.run(run())
+
+        assert result.raw_data[0]["title"] == "Parsed Event"
+        assert result.raw_data[0]["pid"] != os.getpid()
+
+    def test_unpicklable_parser_falls_back_to_threads(self, scraper_config):
+        """A parser that can't be pickled should keep parsing in threads."""
+        scraper_config = dataclasses.replace(scraper_config, parse_processes=2)
+        adapter = ScraperAdapter(scraper_config, html_parser=lambda html, url: {})
+
+        assert adapter._get_parse_pool() is None
+
+    @patch.object(ScraperAdapter, "_get_scraper")
+    def test_fetch_releases_page_html(
+        self, mock_get_scraper, scraper_config, mock_fetch_result
+    ):
+        """Parsed pages should drop their HTML, and raw HTML is opt-in."""
+        event_page = MagicMock(ok=True, html="<html>event</html>", error=None)
+        event_page.url = event_page.final_url = "https://example.com/events/1"
+        mock_scraper = MagicMock()
+        mock_scraper.fetch_listing_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_scraper.extract_event_urls.return_value = [event_page.url]
+        mock_scraper.fetch_event_pages = AsyncMock(return_value=[event_page])
+        mock_get_scraper.return_value = mock_scraper
+
+        result = asyncio.run(ScraperAdapter(scraper_config).fetch())
+
+        assert event_page.html is None
+        assert "_raw_html" not in result.raw_data[0]
+        assert result.raw_data[0]["_url"] == "https://example.com/events/1"
+
+    @patch.object(ScraperAdapter, "_get_scraper")
+    def test_fetch_stores_raw_html_when_enabled(
+        self, mock_get_scraper, scraper_config, mock_fetch_result
+    ):
+        """store_raw_html should keep the page HTML in raw_data."""
+        mock_scraper = MagicMock()
+        mock_scraper.fetch_listing_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_scraper.extract_event_urls.return_value = ["https://example.com/events/1"]
+        mock_scraper.fetch_event_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_get_scraper.return_value = mock_scraper
+        scraper_config = dataclasses.replace(scraper_config, store_raw_html=True)
+
+        result = asyncio.run(ScraperAdapter(scraper_config).fetch())
+
+        assert result.raw_data[0]["_raw_html"] == (
+            "<html><body>Event content</body></html>"
+        )
 
     @patch.object(ScraperAdapter, "_get_scraper")
     def test_fetch_tracks_parse_failures(
@@ -337,6 +454,32 @@ class TestScraperAdapterFetch:
 
         assert result.metadata["pages_fetched"] == 0
 
+    @patch.object(ScraperAdapter, "_get_scraper")
+    def test_fetch_bounds_recorded_errors(
+        self, mock_get_scraper, scraper_config, mock_fetch_result
+    ):
+        """Should keep only the latest errors while counting every failure."""
+        failed = []
+        for i in range(5):
+            page = MagicMock(ok=False, html=None, error="HTTP 503")
+            page.url = f"https://example.com/events/{i}"
+            failed.append(page)
+        mock_scraper = MagicMock()
+        mock_scraper.fetch_listing_pages = AsyncMock(return_value=[mock_fetch_result])
+        mock_scraper.extract_event_urls.return_value = [p.url for p in failed]
+        mock_scraper.fetch_event_pages = AsyncMock(return_value=failed)
+        mock_get_scraper.return_value = mock_scraper
+        scraper_config = dataclasses.replace(scraper_config, max_errors_recorded=2)
+
+        adapter = ScraperAdapter(scraper_config)
+        result = asyncio.run(adapter.fetch())
+
+        assert result.metadata["error_count"] == 5
+        assert result.errors == [
+            "Fetch failed for https://example.com/events/3: HTTP 503",
+            "Fetch failed for https://example.com/events/4: HTTP 503",
+        ]
+
     @patch.object(ScraperAdapter, "_get_scraper")
     def test_fetch_timestamps(
         self, mock_get_scraper, scraper_config, mock_fetch_result
@@ -6,12 +6,14 @@ and config loading utilities.
 """
 
 import asyncio
+import dataclasses
 import json
-from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from src.ingestion.pipelines.base_pipeline import PipelineConfig
+from src.ingestion.pipelines.scrapers import base_scraper
 from src.ingestion.pipelines.scrapers.base_scraper import (
     BaseScraperPipeline,
     EventScraper,
@@ -162,6 +164,12 @@ class TestScraperConfig:
         assert config.base_url == "https://example.com"
         assert config.url_pattern == r"/event/\d+"
 
+    def test_config_is_frozen(self, scraper_config):
+        """Should reject attribute assignment and carry no per-instance dict."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            scraper_config.max_pages = 1
+        assert not hasattr(scraper_config, "__dict__")
+
     def test_default_values(self):
         """Should have sensible defaults."""
         config = ScraperConfig(
@@ -243,17 +251,47 @@ class TestLoadConfigRaw:
     """Tests for load_config_raw function."""
 
     @patch("src.ingestion.pipelines.scrapers.base_scraper.get_config_path")
-    def test_loads_json_config(self, mock_get_path):
+    def test_loads_json_config(self, mock_get_path, tmp_path):
         """Should load and parse JSON config."""
-        mock_get_path.return_value = Path("/fake/path.json")
+        config_file = tmp_path / "test_source.json"
+        config_file.write_text(json.dumps(MOCK_SCRAPER_CONFIG_JSON))
+        mock_get_path.return_value = config_file
 
-        with patch(
-            "builtins.open", mock_open(read_data=json.dumps(MOCK_SCRAPER_CONFIG_JSON))
-        ):
-            result = load_config_raw("test_source")
+        result = load_config_raw("test_source")
 
         assert result["source_id"] == "test_source"
 
+    @patch("src.ingestion.pipelines.scrapers.base_scraper.get_config_path")
+    def test_caches_parse_until_file_changes(self, mock_get_path, tmp_path):
+        """Should reuse the parsed file, hand out copies, and re-read on change."""
+        config_file = tmp_path / "test_source.json"
+        config_file.write_text(json.dumps(MOCK_SCRAPER_CONFIG_JSON))
+        mock_get_path.return_value = config_file
+
+        with patch("builtins.open", wraps=open) as spy_open:
+            first = load_config_raw("test_source")
+            first["source_id"] = "mutated"
+            second = load_config_raw("test_source")
+        assert spy_open.call_count == 1
+        assert second["source_id"] == "test_source"
+
+        config_file.write_text(json.dumps({"source_id": "edited"}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config_raw("test_source")["source_id"] == "edited"
+
+    @patch("src.ingestion.pipelines.scrapers.base_scraper.get_config_path")
+    def test_decodes_utf8_config(self, mock_get_path, tmp_path):
+        """Should parse non-ASCII text from the raw file bytes."""
+        config_file = tmp_path / "test_source.json"
+        config_file.write_bytes(
+            json.dumps({"source_id": "Córdoba"}, ensure_ascii=False).encode("utf-8")
+        )
+        mock_get_path.return_value = config_file
+
+        assert load_config_raw("test_source")["source_id"] == "Córdoba"
+
 
 class TestLoadScraperConfig:
     """Tests for load_scraper_config function."""
@@ -296,6 +334,13 @@ class TestLoadScraperConfig:
         assert result.max_pages == 10
 
 
+def _mock_context():
+    context = MagicMock()
+    context.add_init_script = AsyncMock()
+    context.close = AsyncMock()
+    return context
+
+
 # =============================================================================
 # TEST CLASSES - EventScraper
 # =============================================================================
@@ -310,7 +355,7 @@ class TestEventScraperInit:
 
         assert scraper.config is scraper_config
         assert scraper._browser is None
-        assert scraper._playwright is None
+        assert scraper._context is None
 
 
 class TestEventScraperEnsureBrowser:
@@ -327,29 +372,213 @@ class TestEventScraperEnsureBrowser:
                         await scraper._ensure_browser()
 
         asyncio.run(run())
+        # A failed launch isn't kept around for the next scraper to reuse
+        assert base_scraper._BROWSERS == {}
+        assert scraper._browser is None
+
+
+class TestEventScraperFetchPage:
+    """Tests for EventScraper._fetch_page method."""
+
+    def test_pages_share_one_browser_context(self, scraper_config):
+        """Should open each page in the shared context and close only the page."""
+        scraper = EventScraper(scraper_config)
+        pages = []
+
+        async def new_page():
+            page = MagicMock()
+            page.goto = AsyncMock(return_value=MagicMock(status=200))
+            page.wait_for_timeout = AsyncMock()
+            page.content = AsyncMock(return_value="<html>ok</html>")
+            page.evaluate = AsyncMock()
+            page.close = AsyncMock()
+            page.url = f"https://example.com/e/{len(pages)}"
+            pages.append(page)
+            return page
+
+        context = MagicMock()
+        context.new_page = new_page
+        context.close = AsyncMock()
+        scraper._context = context
+
+        async def run():
+            return [
+                await scraper._fetch_page("https://example.com/e/0"),
+                await scraper._fetch_page("https://example.com/e/1"),
+            ]
+
+        results = asyncio.run(run())
+
+        assert [r.ok for r in results] == [True, True]
+        assert len(pages) == 2
+        for page in pages:
+            page.content.assert_awaited_once()
+            page.close.assert_awaited_once()
+        context.close.assert_not_called()
+
+    def test_rereads_only_captcha_pages(self, scraper_config):
+        """Should wait and read the page again only when a captcha is shown."""
+        scraper = EventScraper(scraper_config)
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=200))
+        page.wait_for_timeout = AsyncMock()
+        page.content = AsyncMock(
+            side_effect=["<html>DataDome captcha</html>", "<html>event</html>"]
+        )
+        page.evaluate = AsyncMock()
+        page.close = AsyncMock()
+        page.url = "https://example.com/e/0"
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        scraper._context = context
+
+        result = asyncio.run(scraper._fetch_page("https://example.com/e/0"))
+
+        assert result.ok is True
+        assert result.html == "<html>event</html>"
+        assert page.content.await_count == 2
+        page.wait_for_timeout.assert_any_await(5000)
+
+    def test_coalesces_concurrent_fetches_of_same_url(self, scraper_config):
+        """Should load a URL once for concurrent callers, then forget it."""
+        scraper = EventScraper(scraper_config)
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=200))
+        page.wait_for_timeout = AsyncMock()
+        page.content = AsyncMock(return_value="<html>ok</html>")
+        page.evaluate = AsyncMock()
+        page.close = AsyncMock()
+        page.url = "https://example.com/e/0"
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        scraper._context = context
+
+        async def run():
+            return await asyncio.gather(
+                scraper._fetch_page("https://example.com/e/0"),
+                scraper._fetch_page("https://example.com/e/0"),
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        context.new_page.assert_awaited_once()
+        assert scraper._inflight == {}
+
+
+class TestEventScraperFetchEventPages:
+    """Tests for EventScraper.fetch_event_pages method."""
+
+    def test_bounded_concurrency_in_url_order(self, scraper_config):
+        """Should cap in-flight fetches, report each result, and keep URL order."""
+        scraper = EventScraper(scraper_config)
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_fetch(url):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0)
+            in_flight["now"] -= 1
+            return PageFetchResult(
+                ok=True,
+                url=url,
+                final_url=url,
+                status_code=200,
+                html="<html></html>",
+                error=None,
+                elapsed_s=0.0,
+            )
+
+        scraper._fetch_page = fake_fetch
+        scraper.config = dataclasses.replace(scraper.config, min_delay_s=0)
+        urls = [f"https://example.com/e/{i}" for i in range(6)]
+        seen = []
+
+        results = asyncio.run(
+            scraper.fetch_event_pages(urls, concurrency=2, on_result=seen.append)
+        )
+
+        assert [r.url for r in results] == urls
+        assert sorted(r.url for r in seen) == urls
+        assert in_flight["max"] == 2
+
+
+class TestEventScraperFetchListingPages:
+    """Tests for EventScraper.fetch_listing_pages method."""
+
+    def test_fetches_pages_concurrently_in_page_order(self, scraper_config):
+        """Should fetch listing pages in parallel and return them in page order."""
+        scraper = EventScraper(scraper_config)
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_fetch(url):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0)
+            in_flight["now"] -= 1
+            return PageFetchResult(
+                ok=True,
+                url=url,
+                final_url=url,
+                status_code=200,
+                html="<html></html>",
+            )
+
+        scraper._fetch_page = fake_fetch
+        scraper.config = dataclasses.replace(scraper.config, min_delay_s=0)
+
+        results = asyncio.run(
+            scraper.fetch_listing_pages(
+                city="madrid", country_code="es", max_pages=3, concurrency=3
+            )
+        )
+
+        base = f"{scraper_config.base_url}/es/madrid"
+        assert [r.url for r in results] == [base, f"{base}?week=1", f"{base}?week=2"]
+        assert in_flight["max"] == 3
 
 
 class TestEventScraperClose:
     """Tests for EventScraper.close method."""
 
     def test_close_browser(self, scraper_config):
-        """Should close browser and playwright."""
-        from unittest.mock import AsyncMock
-
-        scraper = EventScraper(scraper_config)
+        """Should close its context and the browser once no scraper uses it."""
         mock_browser = MagicMock()
         mock_browser.close = AsyncMock()
+        mock_browser.new_context = AsyncMock(side_effect=lambda **_: _mock_context())
         mock_playwright = MagicMock()
         mock_playwright.stop = AsyncMock()
-        scraper._browser = mock_browser
-        scraper._playwright = mock_playwright
+        launches = []
 
-        asyncio.run(scraper.close())
+        async def fake_launch(headless):
+            launches.append(headless)
+            return mock_playwright, mock_browser
 
-        mock_browser.close.assert_called_once()
-        mock_playwright.stop.assert_called_once()
-        assert scraper._browser is None
-        assert scraper._playwright is None
+        async def run():
+            first = EventScraper(scraper_config)
+            second = EventScraper(scraper_config)
+            await asyncio.gather(first._ensure_browser(), second._ensure_browser())
+            contexts = [first._context, second._context]
+
+            await first.close()
+            mock_browser.close.assert_not_called()
+            await second.close()
+            return first, second, contexts
+
+        with patch(
+            "src.ingestion.pipelines.scrapers.base_scraper._launch_browser",
+            fake_launch,
+        ):
+            first, second, contexts = asyncio.run(run())
+
+        assert launches == [scraper_config.headless]
+        assert contexts[0] is not contexts[1]
+        for context in contexts:
+            context.close.assert_awaited_once()
+        mock_browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+        assert first._browser is None and first._context is None
+        assert second._browser is None and second._context is None
 
     def test_close_without_browser(self, scraper_config):
         """Should handle close when browser not initialized."""
@@ -411,7 +640,6 @@ class TestEventScraperContextManager:
 
     def test_context_manager(self, scraper_config):
         """Should work as async context manager."""
-        from unittest.mock import AsyncMock
 
         scraper = EventScraper(scraper_config)
         mock_close = AsyncMock()
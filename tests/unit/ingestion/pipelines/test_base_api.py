@@ -323,6 +323,73 @@ class TestConfigDrivenAPIAdapterParseResponse:
         assert result == []
 
 
+class TestConfigDrivenAPIAdapterPagination:
+    """Tests for ConfigDrivenAPIAdapter.fetch pagination."""
+
+    @staticmethod
+    def _adapter(source_config):
+        from src.ingestion.adapters.api_adapter import APIAdapterConfig
+
+        api_config = APIAdapterConfig(
+            source_id="test",
+            source_type=SourceType.API,
+            graphql_endpoint="https://test.com",
+        )
+        return ConfigDrivenAPIAdapter(api_config, source_config)
+
+    @staticmethod
+    def _paged_fetch(total, in_flight_peak):
+        """Fake APIAdapter.fetch serving `total` rows in pages, tracking overlap."""
+        in_flight = 0
+
+        async def fetch(self, page, page_size, **kwargs):
+            nonlocal in_flight
+            in_flight += 1
+            in_flight_peak.append(in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            start = (page - 1) * page_size
+            rows = [{"id": i} for i in range(start, min(start + page_size, total))]
+            return FetchResult(
+                success=bool(rows),
+                source_type=SourceType.API,
+                raw_data=rows,
+                total_fetched=len(rows),
+                metadata={"total_available": total},
+            )
+
+        return fetch
+
+    def test_fetches_remaining_pages_concurrently(self, sample_source_config):
+        """After page 1 reports the total, the other pages should overlap."""
+        adapter = self._adapter(sample_source_config)
+        peak: list[int] = []
+
+        with patch(
+            "src.ingestion.adapters.api_adapter.APIAdapter.fetch",
+            new=self._paged_fetch(total=230, in_flight_peak=peak),
+        ):
+            result = asyncio.run(adapter.fetch(page_size=50))
+
+        assert [row["id"] for row in result.raw_data] == list(range(230))
+        assert len(peak) == 5
+        assert max(peak) == 4
+
+    def test_respects_max_pages(self, sample_source_config):
+        """Should not request pages beyond max_pages."""
+        adapter = self._adapter(sample_source_config)
+        peak: list[int] = []
+
+        with patch(
+            "src.ingestion.adapters.api_adapter.APIAdapter.fetch",
+            new=self._paged_fetch(total=1000, in_flight_peak=peak),
+        ):
+            result = asyncio.run(adapter.fetch(page_size=50, max_pages=3))
+
+        assert len(peak) == 3
+        assert result.total_fetched == 150
+
+
 class TestBaseAPIPipelineParseRawEvent:
     """Tests for parse_raw_event method."""
 
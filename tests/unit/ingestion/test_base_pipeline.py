@@ -329,6 +329,24 @@ class TestCalculateQualityScore:
         # Has key fields (0.4) + enrichment bonuses
         assert score > 0.5
 
+    def test_quality_sparse_event_keeps_enrichment_bonus(
+        self, sample_pipeline_config, mock_adapter, create_event
+    ):
+        """Should still count organizer/coordinates without description or taxonomy."""
+        from src.schemas.event import Coordinates
+
+        pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
+        event = create_event(
+            title="Test Event",
+            location=LocationInfo(
+                city="Barcelona",
+                coordinates=Coordinates(latitude=41.3851, longitude=2.1734),
+            ),
+        )
+        score = pipeline._calculate_quality_score(event)
+        # Key fields (0.4) + organizer, coordinates, non-free price (0.05 each)
+        assert score == 0.55
+
     def test_quality_with_taxonomy_confidence(
         self, sample_pipeline_config, mock_adapter, create_event, valid_subcategory_id
     ):
@@ -532,6 +550,74 @@ class TestExecute:
         # Should have 2 unique events after deduplication
         assert result.successful_events == 2
 
+    def test_execute_deduplicates_off_the_event_loop(
+        self, sample_pipeline_config, mock_adapter, create_event, monkeypatch
+    ):
+        """Should run deduplication in a worker thread, not on the loop thread."""
+        import threading
+
+        from src.ingestion.pipelines import base_pipeline
+
+        fetch_result = FetchResult(
+            success=True,
+            source_type=SourceType.API,
+            raw_data=[{"title": "Event 1"}],
+            total_fetched=1,
+            metadata={},
+        )
+        mock_adapter.fetch = AsyncMock(return_value=fetch_result)
+        dedupe_threads = []
+
+        def fake_deduplicate(events):
+            dedupe_threads.append(threading.current_thread())
+            return events
+
+        monkeypatch.setattr(
+            base_pipeline,
+            "get_deduplicator",
+            lambda strategy: MagicMock(deduplicate=fake_deduplicate),
+        )
+        pipeline = ConcretePipeline(
+            sample_pipeline_config,
+            mock_adapter,
+            return_events=[create_event(title="Event 1")],
+        )
+
+        result = asyncio.run(pipeline.execute())
+
+        assert result.successful_events == 1
+        assert dedupe_threads and dedupe_threads[0] is not threading.main_thread()
+
+    def test_execute_reuses_deduplicator(
+        self, sample_pipeline_config, mock_adapter, create_event, monkeypatch
+    ):
+        """Should build the deduplicator once per pipeline, not once per run."""
+        from src.ingestion.pipelines import base_pipeline
+
+        fetch_result = FetchResult(
+            success=True,
+            source_type=SourceType.API,
+            raw_data=[{"title": "Event 1"}],
+            total_fetched=1,
+            metadata={},
+        )
+        mock_adapter.fetch = AsyncMock(return_value=fetch_result)
+        factory = MagicMock(return_value=MagicMock(deduplicate=lambda events: events))
+        monkeypatch.setattr(base_pipeline, "get_deduplicator", factory)
+        pipeline = ConcretePipeline(
+            sample_pipeline_config,
+            mock_adapter,
+            return_events=[
+                create_event(title="Event 1"),
+                create_event(title="Event 1"),
+            ],
+        )
+
+        asyncio.run(pipeline.execute())
+        asyncio.run(pipeline.execute())
+
+        factory.assert_called_once()
+
     def test_execute_without_deduplication(self, mock_adapter, create_event):
         """Should not deduplicate when disabled."""
         config = PipelineConfig(source_name="test", deduplicate=False)
@@ -625,6 +711,64 @@ class TestProcessEventsBatch:
         assert result[0].data_quality_score is not None
         assert 0.0 <= result[0].data_quality_score <= 1.0
 
+    def test_process_batch_bounded_by_workers(
+        self, sample_pipeline_config, mock_adapter
+    ):
+        """Should overlap up to `workers` events and keep the input order."""
+        sample_pipeline_config.custom_config["workers"] = 2
+        pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
+        in_flight = 0
+        peak = 0
+        normalize = pipeline.normalize_to_schema
+
+        async def slow_normalize(parsed_event, primary_cat, taxonomy_dims):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await normalize(parsed_event, primary_cat, taxonomy_dims)
+
+        pipeline.normalize_to_schema = slow_normalize
+
+        raw_events = [{"title": f"Event {i}"} for i in range(5)]
+        result = asyncio.run(pipeline._process_events_batch(raw_events))
+
+        assert [e.title for e in result] == [r["title"] for r in raw_events]
+        assert peak == 2
+
+
+class TestProcessBatchOverride:
+    """Tests for overriding process_batch in a subclass."""
+
+    def test_execute_uses_overridden_process_batch(
+        self, sample_pipeline_config, mock_adapter, create_event
+    ):
+        """Should hand the whole raw batch to process_batch in one call."""
+        sample_pipeline_config.deduplicate = False
+        batches = []
+
+        class BatchPipeline(ConcretePipeline):
+            async def process_batch(self, raw_events):
+                batches.append(raw_events)
+                return [create_event(title=r["title"]) for r in raw_events]
+
+        mock_adapter.fetch = AsyncMock(
+            return_value=FetchResult(
+                success=True,
+                source_type=SourceType.API,
+                raw_data=[{"title": "Event 1"}, {"title": "Event 2"}],
+                total_fetched=2,
+                metadata={},
+            )
+        )
+        pipeline = BatchPipeline(sample_pipeline_config, mock_adapter)
+
+        result = asyncio.run(pipeline.execute())
+
+        assert len(batches) == 1
+        assert [e.title for e in result.events] == ["Event 1", "Event 2"]
+
 
 class TestToDataFrame:
     """Tests for to_dataframe method."""
@@ -697,6 +841,22 @@ class TestToDataFrame:
         assert df["price_minimum"].iloc[0] == 15.00
         assert df["price_maximum"].iloc[0] == 25.00
 
+    def test_dataframe_json_columns(
+        self, sample_pipeline_config, mock_adapter, create_event
+    ):
+        """Should serialize nested fields as compact JSON that parses back."""
+        import json
+
+        event = create_event(
+            title="Test Event", custom_fields={"city": "Málaga", "rank": 3}
+        )
+
+        pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
+        df = pipeline.to_dataframe([event])
+
+        assert df["custom_fields_json"].iloc[0] == '{"city":"Málaga","rank":3}'
+        assert json.loads(df["custom_fields_json"].iloc[0]) == event.custom_fields
+
     def test_dataframe_handles_empty_list(self, sample_pipeline_config, mock_adapter):
         """Should handle empty event list."""
         pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
@@ -704,6 +864,17 @@ class TestToDataFrame:
 
         assert len(df) == 0
 
+    def test_dataframe_empty_list_keeps_columns(
+        self, sample_pipeline_config, mock_adapter, sample_event
+    ):
+        """Should return the same columns for no events as for some."""
+        pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
+
+        empty = pipeline.to_dataframe([])
+        full = pipeline.to_dataframe([sample_event])
+
+        assert list(empty.columns) == list(full.columns)
+
     def test_dataframe_handles_none_values(
         self, sample_pipeline_config, mock_adapter, create_event
     ):
@@ -765,3 +936,13 @@ class TestGenerateExecutionId:
         today = datetime.utcnow().strftime("%Y%m%d")
 
         assert today in exec_id
+
+    def test_id_format(self, sample_pipeline_config, mock_adapter):
+        """Should be source_YYYYmmdd_HHMMSS_ followed by 8 hex characters."""
+        import re
+
+        pipeline = ConcretePipeline(sample_pipeline_config, mock_adapter)
+
+        exec_id = pipeline._generate_execution_id()
+
+        assert re.fullmatch(r"test_source_\d{8}_\d{6}_[0-9a-f]{8}", exec_id)
@@ -325,6 +325,41 @@ class TestCreateAllEnabledPipelines:
         assert isinstance(pipelines, dict)
 
 
+class TestCollectScraperSeedUrls:
+    """Tests for _collect_scraper_seed_urls method."""
+
+    def test_keeps_only_http_urls(self, config_file):
+        """Should drop non-string and non-http(s) seed URLs, preserving order."""
+        from src.ingestion.factory import PipelineFactory
+
+        factory = PipelineFactory(config_path=config_file)
+        source_config = {
+            "scraper": {
+                "seed_urls": [
+                    "https://a.example.com",
+                    "ftp://b.example.com",
+                    None,
+                    "http://c.example.com",
+                ]
+            }
+        }
+
+        assert factory._collect_scraper_seed_urls(source_config) == [
+            "https://a.example.com",
+            "http://c.example.com",
+        ]
+
+    def test_falls_back_to_base_url(self, config_file):
+        """Should use base_url when no seed URLs or endpoint are configured."""
+        from src.ingestion.factory import PipelineFactory
+
+        factory = PipelineFactory(config_path=config_file)
+
+        assert factory._collect_scraper_seed_urls(
+            {"base_url": "https://example.com"}
+        ) == ["https://example.com"]
+
+
 class TestReloadConfig:
     """Tests for reload_config method."""
 
@@ -711,6 +711,21 @@ class TestRunFullIngestion:
         assert stats["total_unique_found"] == 0
         assert stats["total_saved_to_db"] == 0
 
+    def test_run_full_ingestion_closes_shared_http_clients(self, orchestrator):
+        """Should release the pooled API clients once the pipelines are done."""
+        pipe = MagicMock(spec=BasePipeline)
+        pipe.source_type = SourceType.API
+        pipe.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        orchestrator.register_pipeline("test", pipe)
+
+        with patch(
+            "src.ingestion.adapters.api_adapter.close_shared_clients",
+            new=AsyncMock(),
+        ) as close_clients:
+            asyncio.run(orchestrator.run_full_ingestion())
+
+        close_clients.assert_awaited_once()
+
     def test_run_full_ingestion_with_events(self, orchestrator, create_event):
         """Should execute, deduplicate, and persist events."""
         events = [create_event(title=f"Event {i}") for i in range(5)]